@@ -0,0 +1,89 @@
+"""Microbenchmark: validating 20000 flat records held as columns.
+
+Each record has an id, a name, a country and a score, checked with
+built-in validators.  Validates the records once as an element tree per
+record, and once with :func:`flatland.columnar.validate_columns` over
+lists of raw strings and, if NumPy is installed, over NumPy arrays of
+the numeric columns.
+
+Run with ``python benchmarks/bench_columnar.py``.
+
+"""
+
+import random
+import timeit
+
+from flatland import Dict, Float, Integer, String
+from flatland.columnar import validate_columns
+from flatland.validation import (
+    Converted,
+    LengthBetween,
+    Present,
+    ValueAtLeast,
+    ValueBetween,
+    ValueIn,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+RECORDS = 20000
+COUNTRIES = ["de", "fr", "gb", "jp", "nz", "us"]
+
+Record = Dict.named("record").of(
+    Integer.named("id").using(validators=[Converted(), ValueAtLeast(1)]),
+    String.named("name").using(validators=[Present(), LengthBetween(2, 20)]),
+    String.named("country").using(validators=[ValueIn(COUNTRIES)]),
+    Float.named("score").using(validators=[Converted(), ValueBetween(0, 100)]),
+)
+
+
+def columns():
+    rng = random.Random(0)
+    names = ["Ada", "Grace", "", "K", "Barbara"]
+    return {
+        "id": [str(n) for n in range(RECORDS)],
+        "name": [rng.choice(names) for _ in range(RECORDS)],
+        "country": [rng.choice(COUNTRIES + ["xx"]) for _ in range(RECORDS)],
+        "score": ["%.1f" % rng.uniform(-10, 110) for _ in range(RECORDS)],
+    }
+
+
+def main(repeat=3):
+    table = columns()
+    rows = [dict(zip(table, values)) for values in zip(*table.values())]
+
+    def by_element():
+        return [Record(row).validate() for row in rows]
+
+    def by_column():
+        return validate_columns(Record, table)
+
+    assert by_element() == by_column().valid
+    timings = {
+        "element per record": min(timeit.repeat(by_element, number=1, repeat=repeat)),
+        "columns of strings": min(timeit.repeat(by_column, number=1, repeat=repeat)),
+    }
+    if numpy is not None:
+        arrays = dict(table)
+        arrays["id"] = numpy.arange(RECORDS)
+        arrays["score"] = numpy.array([float(s) for s in table["score"]])
+        assert list(validate_columns(Record, arrays).valid) == by_element()
+        timings["NumPy numeric columns"] = min(
+            timeit.repeat(
+                lambda: validate_columns(Record, arrays), number=1, repeat=repeat
+            )
+        )
+
+    baseline = timings["element per record"]
+    print("%d records of %d fields" % (RECORDS, len(table)))
+    for name, seconds in timings.items():
+        print(
+            "  %-22s %8.1f ms  %6.2fx" % (name + ":", seconds * 1e3, baseline / seconds)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark: a 50,000 member List of Integers, compact and as elements.
+
+Loads ``List.of(Integer)`` and ``CompactList.of(Integer)`` from flat pairs,
+measuring the memory each holds with :mod:`tracemalloc` and the time taken
+to load, validate and flatten them.  Variants are timed alternately and the
+best of several runs is reported.
+
+Run with ``python benchmarks/bench_compact_list.py``.
+
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from flatland import CompactList, Integer, List
+from flatland.validation import Converted, ValueAtLeast
+
+MEMBERS = 50000
+
+Member = Integer.validated_by(Converted(), ValueAtLeast(minimum=0))
+SCHEMAS = {
+    "List": List.named("n").of(Member),
+    "CompactList": CompactList.named("n").of(Member),
+}
+PAIRS = [("n_%d" % i, str(i)) for i in range(MEMBERS)]
+
+
+def held(schema):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        element = schema.from_flat(PAIRS)
+        element.validate()
+        return element, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main(repeat=5):
+    schemas = {
+        label: schema.using(maximum_set_flat_members=MEMBERS)
+        for label, schema in SCHEMAS.items()
+    }
+    print("List of %d Integers, from %d pairs" % (MEMBERS, len(PAIRS)))
+    for label, schema in schemas.items():
+        print("  %-12s held: %8d KiB" % (label, held(schema)[1] // 1024))
+
+    elements = {label: schema.from_flat(PAIRS) for label, schema in schemas.items()}
+    operations = {
+        "load": lambda label: schemas[label].from_flat(PAIRS),
+        "validate": lambda label: elements[label].validate(),
+        "flatten": lambda label: elements[label].flatten(),
+    }
+    for operation, run in operations.items():
+        best = dict.fromkeys(schemas, float("inf"))
+        for _ in range(repeat):
+            for label in schemas:
+                seconds = timeit.timeit(lambda: run(label), number=1)
+                best[label] = min(best[label], seconds)
+        for label, seconds in best.items():
+            print("  %-12s %-8s  %8.1f ms" % (label, operation, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Microbenchmark: counting invalid records with deferred messages.
+
+Validates 2000 records of 10 fields, each failing validation in several
+fields, counting the invalid records without reading their messages.
+Once with messages expanded as noted, and once with
+``Validator.defer_messages`` set.
+
+Run with ``python benchmarks/bench_deferred_messages.py``.
+
+"""
+
+import timeit
+
+from flatland import Dict, Integer, String
+from flatland.validation import Converted, Present, Validator, ValueAtLeast
+
+RECORDS = 2000
+FIELDS = 10
+
+Record = Dict.named("record").of(
+    *[
+        Integer.named("n%d" % i).using(
+            validators=[Present(), Converted(), ValueAtLeast(minimum=10)]
+        )
+        for i in range(FIELDS)
+    ]
+)
+
+
+def records():
+    for n in range(RECORDS):
+        # blank, unconverted, too small and valid fields
+        yield {"n%d" % i: ["", "x", "1", "10"][(n + i) % 4] for i in range(FIELDS)}
+
+
+def count_invalid(data):
+    return sum(1 for row in data if not Record(row).validate())
+
+
+def main(repeat=5):
+    data = list(records())
+    expanded = deferred = float("inf")
+    for _ in range(repeat):
+        expanded = min(expanded, timeit.timeit(lambda: count_invalid(data), number=1))
+        Validator.defer_messages = True
+        try:
+            deferred = min(
+                deferred, timeit.timeit(lambda: count_invalid(data), number=1)
+            )
+        finally:
+            Validator.defer_messages = False
+
+    print("%d records of %d fields, all invalid" % (RECORDS, FIELDS))
+    print("  expanded messages: %8.1f ms" % (expanded * 1e3))
+    print("  deferred messages: %8.1f ms" % (deferred * 1e3))
+    print("  speedup:           %8.2fx" % (expanded / deferred))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Memory benchmark: per-element bookkeeping on a 10,000 element tree.
+
+Builds a ``List.of(Dict.of(...))`` of 10,000 elements and measures the
+memory it holds with :mod:`tracemalloc`, once as elements are now built,
+with :attr:`~flatland.schema.base.Element.errors` and
+:attr:`~flatland.schema.base.Element.warnings` allocated on first use and
+``valid`` and ``parent`` defaulted on the class, and once with every
+element allocating its own lists and state eagerly, as before.
+
+Run with ``python benchmarks/bench_element_memory.py``.
+
+"""
+
+import gc
+import tracemalloc
+
+from flatland import Dict, List, String
+from flatland.schema.base import Element, Unevaluated
+
+MEMBERS = 2500
+
+Row = Dict.of(String.named("a"), String.named("b"), String.named("c"))
+Rows = List.named("rows").of(Row).using(maximum_set_flat_members=MEMBERS)
+PAIRS = [
+    ("rows_%d_%s" % (i, field), "%s%d" % (field, i))
+    for i in range(MEMBERS)
+    for field in "abc"
+]
+
+
+def measure():
+    gc.collect()
+    tracemalloc.start()
+    try:
+        element = Rows.from_flat(PAIRS)
+        element.validate()
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return element, held
+
+
+def _eager_init(init):
+    def __init__(self, value=Element.__init__.__defaults__[0], **kw):
+        self.parent = kw.get("parent")
+        self.valid = Unevaluated
+        self.errors = []
+        self.warnings = []
+        init(self, value, **kw)
+
+    return __init__
+
+
+def main(repeat=3):
+    init = Element.__init__
+    Element.__init__ = _eager_init(init)
+    try:
+        eager = min(measure()[1] for _ in range(repeat))
+    finally:
+        Element.__init__ = init
+    lazy = min(measure()[1] for _ in range(repeat))
+    count = sum(1 for _ in measure()[0].all_children) + 1
+
+    print("List.of(Dict.of(...)), %d elements" % count)
+    print("  eager per-element state: %8.0f KiB" % (eager / 1024))
+    print("  lazy per-element state:  %8.0f KiB" % (lazy / 1024))
+    print("  reduction:               %8.1f%%" % (100.0 * (eager - lazy) / eager))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Microbenchmark: rejecting invalid records with fail-fast validation.
+
+Validates 1000 records of 20 fields, most of them invalid in an early
+field, once with a full ``validate`` and once with
+``validate(fail_fast=True)``.
+
+Run with ``python benchmarks/bench_fail_fast.py``.
+
+"""
+
+import random
+import timeit
+
+from flatland import Dict, Integer, String
+from flatland.validation import Converted, LengthBetween, Present
+
+RECORDS = 1000
+FIELDS = 20
+
+Record = Dict.named("record").of(
+    Integer.named("id").using(validators=[Converted()]),
+    *[
+        String.named("f%d" % i).using(validators=[Present(), LengthBetween(1, 40)])
+        for i in range(FIELDS - 1)
+    ],
+)
+
+
+def records():
+    rng = random.Random(0)
+    for n in range(RECORDS):
+        row = {"f%d" % i: "value %d" % i for i in range(FIELDS - 1)}
+        # most records are rejected, many on their first field
+        row["id"] = str(n) if rng.random() < 0.3 else "x%d" % n
+        if rng.random() < 0.6:
+            row["f2"] = ""
+        yield Record(row)
+
+
+def main(repeat=5):
+    elements = list(records())
+    assert [e.validate() for e in elements] == [
+        e.validate(fail_fast=True) for e in elements
+    ]
+
+    def full():
+        for element in elements:
+            element.validate()
+
+    def fail_fast():
+        for element in elements:
+            element.validate(fail_fast=True)
+
+    plain = fast = float("inf")
+    for _ in range(repeat):
+        plain = min(plain, timeit.timeit(full, number=1))
+        fast = min(fast, timeit.timeit(fail_fast, number=1))
+
+    rejected = sum(1 for e in elements if e.stopped_at is not None)
+    print("%d records of %d fields, %d rejected" % (RECORDS, FIELDS, rejected))
+    print("  validate:                 %8.1f ms" % (plain * 1e3))
+    print("  validate(fail_fast=True): %8.1f ms" % (fast * 1e3))
+    print("  speedup:                  %8.2fx" % (plain / fast))
+
+
+if __name__ == "__main__":
+    main()
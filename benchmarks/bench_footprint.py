@@ -0,0 +1,84 @@
+"""Memory footprint of representative element trees.
+
+Measures each tree with :func:`flatland.diagnostics.measure` and prints its
+element count and retained bytes beside the reference numbers below,
+recorded on CPython 3.11 (64-bit).  A tree growing well past its
+reference is a regression in per-element memory; numbers on other Python
+versions differ by a few percent from interpreter object sizes alone.
+
+Run with ``python benchmarks/bench_footprint.py``.
+
+"""
+
+import sys
+
+from flatland import CompactList, Dict, Integer, List, String
+from flatland.diagnostics import measure
+
+MEMBERS = 1000
+
+Flat = Dict.named("flat").of(*[String.named("f%d" % i) for i in range(20)])
+Row = Dict.of(String.named("a"), String.named("b"), Integer.named("c"))
+Rows = List.named("rows").of(Row).using(maximum_set_flat_members=MEMBERS)
+Numbers = CompactList.named("n").of(Integer).using(maximum_set_flat_members=MEMBERS)
+
+
+def _flat():
+    return Flat.from_flat([("flat_f%d" % i, "value %d" % i) for i in range(20)])
+
+
+def _rows():
+    return Rows.from_flat(
+        (
+            ("rows_%d_%s" % (i, field), "%d" % i)
+            for i in range(MEMBERS)
+            for field in "abc"
+        )
+    )
+
+
+def _invalid_rows():
+    element = _rows()
+    for row in element:
+        row["a"].add_error("%s is not allowed" % row["a"].value)
+    return element
+
+
+def _numbers():
+    return Numbers.from_flat(("n_%d" % i, "%d" % i) for i in range(MEMBERS))
+
+
+# name: (build, reference element count, reference total bytes)
+TREES = {
+    "flat Dict of 20 Strings": (_flat, 21, 8962),
+    "List of 1000 Dicts": (_rows, 5001, 1467938),
+    "List of 1000 Dicts, with errors": (_invalid_rows, 5001, 1638828),
+    "CompactList of 1000 Integers": (_numbers, 3, 71281),
+}
+
+
+def main():
+    print("Python %d.%d, reference 3.11" % sys.version_info[:2])
+    print(
+        "%-34s %8s %12s %12s %8s" % ("tree", "elements", "bytes", "reference", "change")
+    )
+    for name, (build, elements, reference) in TREES.items():
+        footprint = measure(build())
+        print(
+            "%-34s %8d %12d %12d %+7.1f%%"
+            % (
+                name,
+                footprint.elements,
+                footprint.total,
+                reference,
+                100.0 * (footprint.total - reference) / reference,
+            )
+        )
+        if footprint.elements != elements:
+            print("  expected %d elements" % elements)
+    print()
+    print(measure(_invalid_rows()).report())
+
+
+if __name__ == "__main__":
+    main()
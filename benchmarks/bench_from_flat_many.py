@@ -0,0 +1,64 @@
+"""Benchmark: bulk record import with from_flat_many.
+
+Loads and validates 20,000 CSV-style records through a :class:`Schema`,
+once with a per-row loop of ``from_flat`` and ``validate`` and once with
+:meth:`~flatland.schema.base.Element.from_flat_many`.
+
+Run with ``python benchmarks/bench_from_flat_many.py``.
+
+"""
+
+import timeit
+
+from flatland import Date, Integer, Schema, String
+from flatland.validation import Present, ValueAtLeast
+
+ROWS = 20000
+
+
+class Record(Schema):
+    id = Integer.using(validators=[Present()])
+    name = String.using(validators=[Present()])
+    email = String
+    born = Date
+    score = Integer.using(optional=True, validators=[ValueAtLeast(minimum=0)])
+
+
+RECORDS = [
+    {
+        "id": str(i),
+        "name": "name %d" % i,
+        "email": "user%d@example.com" % i,
+        "born": "2001-02-03",
+        "score": str(i % 50) if i % 7 else "",
+    }
+    for i in range(ROWS)
+]
+
+
+def per_row():
+    for row in RECORDS:
+        element = Record.from_flat(row)
+        element.validate()
+
+
+def batched():
+    for element, valid in Record.from_flat_many(RECORDS):
+        pass
+
+
+def main(number=1, repeat=7):
+    # alternate the two so that machine noise affects both alike
+    loop = batch = float("inf")
+    for _ in range(repeat):
+        loop = min(loop, timeit.timeit(per_row, number=number) / number)
+        batch = min(batch, timeit.timeit(batched, number=number) / number)
+
+    print("Schema of 5 fields, %d records" % ROWS)
+    print("  from_flat + validate: %8.0f records/s" % (ROWS / loop))
+    print("  from_flat_many:       %8.0f records/s" % (ROWS / batch))
+    print("  speedup:              %8.2fx" % (loop / batch))
+
+
+if __name__ == "__main__":
+    main()
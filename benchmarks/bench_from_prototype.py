@@ -0,0 +1,46 @@
+"""Microbenchmark: instantiating a large schema from a prototype.
+
+Builds a ``Dict`` of 10 sections of 50 defaulted fields each, once by
+construction (``cls()`` and ``cls.from_defaults()``) and once by cloning
+a memoized prototype with :meth:`~flatland.schema.base.Element.from_prototype`.
+
+Run with ``python benchmarks/bench_from_prototype.py``.
+
+"""
+
+import timeit
+
+from flatland import Dict, Integer, String
+
+Section = Dict.of(
+    *[String.named("s%d" % i).using(default="x") for i in range(25)]
+    + [Integer.named("i%d" % i).using(default=i) for i in range(25)]
+)
+Form = Dict.named("form").of(*[Section.named("sec%d" % i) for i in range(10)])
+
+
+def best(stmt, number, repeat):
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+
+def main(number=50, repeat=7):
+    Form.from_prototype()
+    Form.from_prototype(defaults=True)
+    cases = [
+        ("blank", Form, Form.from_prototype),
+        ("defaults", Form.from_defaults, lambda: Form.from_prototype(defaults=True)),
+    ]
+    print("Dict of 10 x 50 fields, %d elements" % len(list(Form().all_children)))
+    for label, construct, clone in cases:
+        constructed = cloned = float("inf")
+        # alternate the variants to even out machine noise
+        for _ in range(repeat):
+            constructed = min(constructed, best(construct, number, 1))
+            cloned = min(cloned, best(clone, number, 1))
+        print("  %-8s constructed: %8.1f us" % (label, constructed * 1e6))
+        print("  %-8s cloned:      %8.1f us" % (label, cloned * 1e6))
+        print("  %-8s speedup:     %8.2fx" % (label, constructed / cloned))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Microbenchmark: validating forms producing many error messages.
+
+A List of 1000 Dicts, each with an unconvertible Integer, and a List of
+1000 Dicts each holding three unconvertible Integers two Dicts further
+down.  Validates them with the i18n function lookups of each element
+cached for the duration of ``validate``, and with every message searching
+the element's ancestry again, as before.  Once with no translation
+functions, falling back to ``builtins``, and once with ``ugettext`` on the
+root.
+
+Run with ``python benchmarks/bench_i18n_lookup.py``.
+
+"""
+
+import itertools
+import timeit
+
+from flatland import Dict, Integer, List
+from flatland.schema import base
+from flatland.validation import Converted
+
+MEMBERS = 1000
+
+catalog = {"%(label)s is not correct.": "%(label)s ist nicht korrekt."}
+
+Field = Integer.using(validators=[Converted()])
+
+ROWS = {
+    "flat rows": (Dict.of(Field.named("n")), {"n": "x"}),
+    "nested rows": (
+        Dict.of(
+            Dict.named("a").of(
+                Dict.named("b").of(Field.named("x"), Field.named("y"), Field.named("z"))
+            )
+        ),
+        {"a": {"b": {"x": "x", "y": "x", "z": "x"}}},
+    ),
+}
+
+TRANSLATIONS = {
+    "no translations": {},
+    "ugettext on the root": {"ugettext": lambda text: catalog.get(text, text)},
+}
+
+
+class _uncached:
+    active = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+def main(repeat=7):
+    cache = base.i18n_resolution_cache
+    for (shape, (row, value)), (name, translations) in itertools.product(
+        ROWS.items(), TRANSLATIONS.items()
+    ):
+        schema = Dict.named("form").of(
+            List.named("rows").of(row).using(maximum_set_flat_members=MEMBERS)
+        )
+        form = schema.using(**translations)({"rows": [value] * MEMBERS})
+        cached = uncached = float("inf")
+        for _ in range(repeat):
+            cached = min(cached, timeit.timeit(form.validate, number=1))
+            base.i18n_resolution_cache = _uncached
+            try:
+                uncached = min(uncached, timeit.timeit(form.validate, number=1))
+            finally:
+                base.i18n_resolution_cache = cache
+
+        errors = sum(len(element.errors) for element in form.all_children)
+        print("List of %d Dicts, %s, %d errors, %s" % (MEMBERS, shape, errors, name))
+        print("  searched per message: %8.1f ms" % (uncached * 1e3))
+        print("  cached per validate:  %8.1f ms" % (cached * 1e3))
+        print("  speedup:              %8.2fx" % (uncached / cached))
+
+
+if __name__ == "__main__":
+    main()
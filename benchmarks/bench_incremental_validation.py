@@ -0,0 +1,59 @@
+"""Microbenchmark: revalidating a 400 field form after one field changes.
+
+Changes one field of a form of 40 sections of 10 validated Strings and
+revalidates it, once with ``validate(incremental=True)``, which reruns
+only the changed field's validators and those of its ancestors, and once
+with ``validate()``, which reruns every validator in the form.
+
+Run with ``python benchmarks/bench_incremental_validation.py``.
+
+"""
+
+import itertools
+import timeit
+
+from flatland import Dict, String
+from flatland.validation import LengthBetween, Present
+
+SECTIONS, FIELDS = 40, 10
+
+Field = String.using(validators=[Present(), LengthBetween(1, 40)])
+Section = Dict.of(*[Field.named("f%d" % i) for i in range(FIELDS)])
+Form = Dict.named("form").of(*[Section.named("s%d" % i) for i in range(SECTIONS)])
+PAIRS = [
+    ("form_s%d_f%d" % (s, f), "value") for s in range(SECTIONS) for f in range(FIELDS)
+]
+
+
+def editor(incremental):
+    form = Form.from_flat(PAIRS)
+    form.validate(incremental=incremental)
+    field = form["s20"]["f5"]
+    values = itertools.cycle(["edited", "", "value"])
+
+    def edit():
+        field.set(next(values))
+        return form.validate(incremental=incremental)
+
+    return edit
+
+
+def best(incremental, number, repeat):
+    edit = editor(incremental)
+    return min(timeit.repeat(edit, number=number, repeat=repeat)) / number
+
+
+def main(repeat=5):
+    incremental = full = float("inf")
+    for _ in range(repeat):
+        incremental = min(incremental, best(True, 300, 1))
+        full = min(full, best(False, 30, 1))
+
+    print("Dict of %d Dicts of %d Strings, one field edited" % (SECTIONS, FIELDS))
+    print("  validate():                 %8.1f us" % (full * 1e6))
+    print("  validate(incremental=True): %8.1f us" % (incremental * 1e6))
+    print("  speedup:                    %8.1fx" % (full / incremental))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Microbenchmark: removing members from the front of a 5,000 member List.
+
+Empties a ``List.of(String)`` with ``del names[0]``, once renaming the
+moved slots lazily as they are read, and once renaming every slot after
+each removal, as before.
+
+Run with ``python benchmarks/bench_list_renumber.py``.
+
+"""
+
+import timeit
+
+from flatland import List, String
+
+MEMBERS = 5000
+
+Names = List.named("names").of(String.named("name"))
+VALUES = ["name %d" % i for i in range(MEMBERS)]
+
+
+def drain():
+    names = Names(VALUES)
+    while names:
+        del names[0]
+    return names
+
+
+def _eager_renumber(self, start=0):
+    for index, slot in enumerate(self._slots):
+        slot.name = str(index)
+
+
+def best(repeat):
+    return min(timeit.repeat(drain, number=1, repeat=repeat))
+
+
+def main(repeat=3):
+    lazy = eager = float("inf")
+    renumber = List._renumber
+    for _ in range(repeat):
+        lazy = min(lazy, best(1))
+        List._renumber = _eager_renumber
+        try:
+            eager = min(eager, best(1))
+        finally:
+            List._renumber = renumber
+
+    print("List.of(String), %d members removed from the front" % MEMBERS)
+    print("  renamed after each removal: %8.1f ms" % (eager * 1000))
+    print("  renamed lazily:             %8.1f ms" % (lazy * 1000))
+    print("  speedup:                    %8.1fx" % (eager / lazy))
+
+
+if __name__ == "__main__":
+    main()
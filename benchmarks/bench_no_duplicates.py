@@ -0,0 +1,43 @@
+"""Microbenchmark: checking a List of Strings for repeated values.
+
+Validates Lists of unique Strings with :class:`NotDuplicated` given to
+each member, which compares every member with each member before it, and
+with :class:`HasNoDuplicates` given to the List, which checks all members
+in one pass.
+
+Run with ``python benchmarks/bench_no_duplicates.py``.
+
+"""
+
+import timeit
+
+from flatland import List, String
+from flatland.validation import HasNoDuplicates, NotDuplicated
+
+SIZES = (500, 2000, 20000)
+# pairwise comparison of 20000 members takes most of a minute
+PAIRWISE_LIMIT = 2000
+
+Pairwise = List.named("rows").of(String.using(validators=[NotDuplicated()]))
+Hashed = List.named("rows").of(String).using(validators=[HasNoDuplicates()])
+
+
+def best(element, repeat):
+    return min(timeit.repeat(element.validate, number=1, repeat=repeat))
+
+
+def main(repeat=3):
+    for size in SIZES:
+        values = ["value %d" % i for i in range(size)]
+        hashed = best(Hashed(values), repeat)
+        print("List of %d Strings" % size)
+        if size <= PAIRWISE_LIMIT:
+            pairwise = best(Pairwise(values), repeat)
+            print("  NotDuplicated:   %10.1f ms" % (pairwise * 1e3))
+        print("  HasNoDuplicates: %10.1f ms" % (hashed * 1e3))
+        if size <= PAIRWISE_LIMIT:
+            print("  speedup:         %10.2fx" % (pairwise / hashed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Microbenchmark: set_flat with memoized per-class plans.
+
+Loads a 1,000 member ``List.of(Dict.of(...))`` from flat pairs, once with
+:class:`~flatland.schema.flat.FlatPlan` memoized on each element class and
+once with a plan compiled for every element, as before plans were cached.
+
+Run with ``python benchmarks/bench_set_flat.py``.
+
+"""
+
+import timeit
+
+from flatland import Dict, Integer, List, String
+from flatland.schema.base import Element
+
+MEMBERS = 1000
+
+Row = Dict.of(
+    Integer.named("id"),
+    String.named("name"),
+    String.named("email"),
+    List.named("tags").of(String),
+)
+Rows = List.named("rows").of(Row).using(maximum_set_flat_members=MEMBERS)
+
+PAIRS = []
+for i in range(MEMBERS):
+    PAIRS.append(("rows_%d_id" % i, str(i)))
+    PAIRS.append(("rows_%d_name" % i, "name %d" % i))
+    PAIRS.append(("rows_%d_email" % i, "user%d@example.com" % i))
+    PAIRS.append(("rows_%d_tags_0" % i, "a"))
+    PAIRS.append(("rows_%d_tags_1" % i, "b"))
+
+
+def load():
+    Rows.from_flat(PAIRS)
+
+
+def _uncached_flat_plan(self, sep):
+    return self._compile_flat_plan(sep)
+
+
+def main(number=10, repeat=5):
+    memoized = Element._flat_plan
+    warm = min(timeit.repeat(load, number=number, repeat=repeat)) / number
+
+    Element._flat_plan = _uncached_flat_plan
+    try:
+        cold = min(timeit.repeat(load, number=number, repeat=repeat)) / number
+    finally:
+        Element._flat_plan = memoized
+
+    print("List.of(Dict.of(...)), %d members, %d pairs" % (MEMBERS, len(PAIRS)))
+    print("  plan compiled per element: %8.2f ms" % (cold * 1000))
+    print("  plan memoized per class:   %8.2f ms" % (warm * 1000))
+    print("  speedup:                   %8.2fx" % (cold / warm))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Microbenchmark: validating a wide form and a List of 500 Dicts.
+
+Validates each tree repeatedly, once with the compiled validation plan,
+and once with the breadth-first search of the tree ``validate`` made on
+every call before plans were compiled.
+
+Run with ``python benchmarks/bench_validation_plan.py``.
+
+"""
+
+import collections
+import timeit
+
+from flatland import Dict, Integer, List, SkipAll, SkipAllFalse, String
+from flatland.schema.base import Element, Unevaluated
+from flatland.validation import Converted, Present
+
+MEMBERS = 500
+
+Address = Dict.named("address").of(
+    String.named("street").using(validators=[Present()]),
+    String.named("city").using(validators=[Present()]),
+    String.named("postcode"),
+)
+Wide = Dict.named("form").of(
+    *[String.named("f%d" % i).using(validators=[Present()]) for i in range(40)],
+    *[Address.named("a%d" % i) for i in range(10)],
+)
+Row = Dict.of(
+    String.named("a").using(validators=[Present()]),
+    Integer.named("b").using(validators=[Converted()]),
+    String.named("c").using(optional=True),
+)
+Rows = List.named("rows").of(Row).using(maximum_set_flat_members=MEMBERS)
+
+TREES = {
+    "Dict of 40 Strings and 10 Dicts (81 elements)": Wide.from_flat(
+        [("form_f%d" % i, "x") for i in range(40)]
+        + [("form_a%d_street" % i, "x") for i in range(10)]
+    ),
+    "List of %d Dicts (%d elements)"
+    % (MEMBERS, 4 * MEMBERS + 1): Rows.from_flat(
+        (("rows_%d_%s" % (i, f), "%d" % i) for i in range(MEMBERS) for f in "abc")
+    ),
+}
+
+
+def _validate_searched(self, state=None, recurse=True):
+    valid = True
+    elements, seen, queue = [], set(), collections.deque([self])
+    while queue:
+        element = queue.popleft()
+        if id(element) in seen:
+            continue
+        seen.add(id(element))
+        elements.append(element)
+        validated = element._validate(state, True)
+        if validated is Unevaluated:
+            element.valid = validated
+        else:
+            element.valid = bool(validated)
+            if valid:
+                valid &= validated
+        if validated is SkipAll or validated is SkipAllFalse:
+            continue
+        children, validated = element._validate_children(state)
+        if valid:
+            valid &= validated
+        queue.extend(children)
+    for element in reversed(elements):
+        validated = element._validate(state, False)
+        if validated is Unevaluated:
+            pass
+        elif element.valid:
+            element.valid = bool(validated)
+            if valid:
+                valid &= validated
+    return bool(valid)
+
+
+def best(element, number, repeat):
+    return min(timeit.repeat(element.validate, number=number, repeat=repeat)) / number
+
+
+def main(repeat=5):
+    validate = Element.validate
+    for name, element in TREES.items():
+        number = max(1, 20000 // sum(1 for _ in element.all_children))
+        planned = searched = float("inf")
+        for _ in range(repeat):
+            planned = min(planned, best(element, number, 1))
+            Element.validate = _validate_searched
+            try:
+                searched = min(searched, best(element, number, 1))
+            finally:
+                Element.validate = validate
+
+        print(name)
+        print("  searched each call: %8.1f us" % (searched * 1e6))
+        print("  compiled plan:      %8.1f us" % (planned * 1e6))
+        print("  speedup:            %8.2fx" % (searched / planned))
+
+
+if __name__ == "__main__":
+    main()
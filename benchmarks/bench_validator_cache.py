@@ -0,0 +1,79 @@
+"""Microbenchmark: validating a bulk import of 2000 repetitive records.
+
+Each record has an email address, a homepage URL, a country and a card
+number drawn from a few dozen distinct values, as imported rows repeat
+the same domains and countries.  Validates the records once with pure
+validators uncached and once sharing a
+:class:`~flatland.validation.ValidatorCache`.
+
+Run with ``python benchmarks/bench_validator_cache.py``.
+
+"""
+
+import random
+import timeit
+
+from flatland import Dict, List, Long, String
+from flatland.validation import (
+    HTTPURLValidator,
+    IsEmail,
+    URLValidator,
+    ValidatorCache,
+    ValueIn,
+)
+from flatland.validation.number import Luhn10
+
+RECORDS = 2000
+COUNTRIES = ["de", "fr", "gb", "jp", "nz", "us"]
+
+
+def schema(cache=None):
+    return List.named("rows").of(
+        Dict.of(
+            String.named("email").using(validators=[IsEmail(cache=cache)]),
+            String.named("homepage").using(
+                validators=[URLValidator(cache=cache), HTTPURLValidator(cache=cache)]
+            ),
+            String.named("country").using(validators=[ValueIn(COUNTRIES, cache=cache)]),
+            Long.named("card").using(validators=[Luhn10(cache=cache)]),
+        )
+    )
+
+
+def rows():
+    rng = random.Random(0)
+    domains = ["example%d.com" % i for i in range(20)] + ["bad domain"]
+    cards = [4111111111111111, 5500005555555559, 1234567812345678]
+    for _ in range(RECORDS):
+        domain = rng.choice(domains)
+        yield {
+            "email": "%s@%s" % (rng.choice(["info", "sales"]), domain),
+            "homepage": "https://%s/" % domain,
+            "country": rng.choice(COUNTRIES + ["xx"]),
+            "card": rng.choice(cards),
+        }
+
+
+def main(repeat=5):
+    data = list(rows())
+    cache = ValidatorCache(size=256)
+    uncached, cached = schema()(data), schema(cache)(data)
+    assert uncached.validate() == cached.validate()
+    assert [e.errors for e in uncached.all_children] == [
+        e.errors for e in cached.all_children
+    ]
+
+    plain = memoized = float("inf")
+    for _ in range(repeat):
+        plain = min(plain, timeit.timeit(uncached.validate, number=1))
+        memoized = min(memoized, timeit.timeit(cached.validate, number=1))
+
+    print("%d records, %d cached results" % (RECORDS, len(cache)))
+    print("  uncached:  %8.1f ms" % (plain * 1e3))
+    print("  cached:    %8.1f ms" % (memoized * 1e3))
+    print("  speedup:   %8.2fx" % (plain / memoized))
+    print("  %r" % cache)
+
+
+if __name__ == "__main__":
+    main()
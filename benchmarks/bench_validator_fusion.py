@@ -0,0 +1,71 @@
+"""Microbenchmark: validating records of fields with built-in validators.
+
+Each of 1000 records has 20 fields carrying a typical chain of
+``[Present(), Converted(), LengthBetween(...), ValueIn(...)]`` or
+``[Converted(), ValueBetween(...)]``.  Validates the records once with
+the chains fused (the default) and once with
+``Element.fuse_validators`` turned off, calling each validator in turn.
+
+Run with ``python benchmarks/bench_validator_fusion.py``.
+
+"""
+
+import timeit
+
+from flatland import Dict, Element, Integer, String
+from flatland.validation import (
+    Converted,
+    LengthBetween,
+    Present,
+    ValueBetween,
+    ValueIn,
+)
+
+RECORDS = 1000
+FIELDS = 20
+CODES = ["alpha", "beta", "gamma", "delta"]
+
+Record = Dict.named("record").of(
+    *[
+        String.named("s%d" % i).using(
+            validators=[Present(), Converted(), LengthBetween(1, 10), ValueIn(CODES)]
+        )
+        for i in range(FIELDS // 2)
+    ],
+    *[
+        Integer.named("n%d" % i).using(validators=[Converted(), ValueBetween(0, 99)])
+        for i in range(FIELDS // 2)
+    ],
+)
+
+
+def records():
+    for n in range(RECORDS):
+        row = {"s%d" % i: CODES[(n + i) % 5 % 4] for i in range(FIELDS // 2)}
+        row.update({"n%d" % i: str((n * i) % 120) for i in range(FIELDS // 2)})
+        yield Record(row)
+
+
+def main(repeat=7):
+    elements = list(records())
+
+    def validate():
+        return [element.validate() for element in elements]
+
+    fused = validate()
+    Element.fuse_validators = False
+    try:
+        assert validate() == fused
+        plain = min(timeit.repeat(validate, number=1, repeat=repeat))
+    finally:
+        Element.fuse_validators = True
+    fused = min(timeit.repeat(validate, number=1, repeat=repeat))
+
+    print("%d records of %d fields" % (RECORDS, FIELDS))
+    print("  validators called in turn: %8.1f ms" % (plain * 1e3))
+    print("  fused:                     %8.1f ms" % (fused * 1e3))
+    print("  speedup:                   %8.2fx" % (plain / fused))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 """Schemas for structured data."""
 
-from flatland.exc import AdaptationError
+from flatland.exc import AdaptationError, InputLimitError
 from flatland.schema import (
     Array,
     Boolean,
+    CompactList,
     Compound,
     Constrained,
     Container,
@@ -14,6 +15,7 @@ from flatland.schema import (
     Dict,
     Element,
     Enum,
+    File,
     Float,
     Form,
     Integer,
@@ -45,6 +47,7 @@ __all__ = [
     "AdaptationError",
     "Array",
     "Boolean",
+    "CompactList",
     "Compound",
     "Constrained",
     "Container",
@@ -55,8 +58,10 @@ __all__ = [
     "Dict",
     "Element",
     "Enum",
+    "File",
     "Float",
     "Form",
+    "InputLimitError",
     "Integer",
     "JoinedString",
     "List",
@@ -0,0 +1,472 @@
+"""Validation of many flat records held as columns.
+
+:func:`validate_columns` validates a table of records against a flat
+:class:`~flatland.schema.containers.Dict` schema without building an
+element tree for each record.  The table is given as a mapping of field
+names to columns, one value per row:
+
+.. testcode::
+
+  from flatland import Dict, Integer, String
+  from flatland.columnar import validate_columns
+  from flatland.validation import Converted, LengthBetween, ValueBetween
+
+  Record = Dict.named('record').of(
+      String.named('name').using(validators=[LengthBetween(1, 20)]),
+      Integer.named('age').using(validators=[Converted(),
+                                             ValueBetween(0, 150)]))
+
+  result = validate_columns(Record, {'name': ['Ada', 'Bob', ''],
+                                     'age': ['36', 'x', '200']})
+
+.. doctest::
+
+  >>> result.valid
+  [True, False, False]
+  >>> for error in result.errors:
+  ...     print(error.row, error.name, error.errors)
+  1 age ['age is not correct.']
+  2 name ['name must be between 1 and 20 characters long.']
+  2 age ['age must be in the range 0 to 150.']
+
+Each column is adapted in one pass, as
+:meth:`~flatland.schema.scalars.Scalar.set` would adapt each of its
+values, and the built-in validators of
+:mod:`flatland.validation.scalars` are each checked with one loop over
+the rows still valid, rather than one call per row.  Columns may be
+lists, :class:`array.array` instances or other sequences, or, if NumPy
+is installed, one-dimensional NumPy arrays.  Arrays of integers for
+:class:`~flatland.schema.scalars.Integer` and
+:class:`~flatland.schema.scalars.Long` fields, and of numbers for
+:class:`~flatland.schema.scalars.Float` fields, are taken as adapted
+values as they are, and numeric comparisons are made on the whole array.
+
+Fields with other validators, including built-in validators given a
+``validate`` of their own, are validated a row at a time with one
+reused element tree, as are all fields of schemas with validators of
+their own.  The results are those of validating each record as an
+element, except that :obj:`~flatland.signals.validator_validated` is not
+sent for validators checked a column at a time.
+
+"""
+
+from flatland.exc import AdaptationError
+from flatland.schema.base import Element
+from flatland.schema.compact import _validate_member
+from flatland.schema.containers import Container, Dict
+from flatland.schema.scalars import Number, Scalar, String
+from flatland.schema.util import i18n_resolution_cache
+from flatland.signals import element_set
+from flatland.validation import scalars
+from flatland.validation.fusion import _CHECKS
+
+try:
+    import numpy
+except ImportError:  # pragma:nocover
+    numpy = None
+
+__all__ = ["ColumnError", "ColumnarResult", "validate_columns"]
+
+
+def validate_columns(schema, columns, state=None):
+    """Validate the records of a table held as columns.
+
+    :param schema: a :class:`~flatland.schema.containers.Dict` class whose
+      fields are all :class:`~flatland.schema.scalars.Scalar` elements.
+
+    :param columns: a mapping of field names to sequences of raw values,
+      one for each row, all of the same length.  A field without a
+      column is unset in every row.  Columns not in the schema are
+      ignored.
+
+    :param state: optional, passed unchanged to validators.
+
+    :returns: a :class:`ColumnarResult`
+
+    Raises :exc:`TypeError` if *schema* is not a flat schema of scalars,
+    and :exc:`ValueError` if the columns differ in length.
+
+    """
+    if not (isinstance(schema, type) and issubclass(schema, Dict)):
+        raise TypeError("validate_columns requires a Dict schema, not %r" % (schema,))
+    row = schema()
+    elements = list(row.values())
+    for element in elements:
+        if not isinstance(element, Scalar) or isinstance(element, Container):
+            raise TypeError(
+                "validate_columns requires fields of scalars, not %s %r"
+                % (type(element).__name__, element.name)
+            )
+        if isinstance(type(element).value, property):
+            raise TypeError(
+                "validate_columns cannot hold values for %s %r"
+                % (type(element).__name__, element.name)
+            )
+
+    lengths = {
+        len(columns[element.name]) for element in elements if element.name in columns
+    }
+    if len(lengths) > 1:
+        raise ValueError("columns differ in length: %r" % sorted(lengths))
+    rows = lengths.pop() if lengths else 0
+    table = [
+        _Column(element, columns.get(element.name, [None] * rows))
+        for element in elements
+    ]
+
+    failed = []
+    if schema.validators or schema.descent_validators:
+        _validate_rows(row, table, rows, state, failed)
+    else:
+        by_cell = []
+        for position, column in enumerate(table):
+            if column.kernels is None:
+                by_cell.append((position, column))
+            else:
+                _validate_column(position, column, rows, state, failed)
+        if by_cell:
+            _validate_cells(table, by_cell, rows, state, failed)
+
+    if numpy is not None and any(column.array for column in table):
+        valid = numpy.ones(rows, dtype=bool)
+    else:
+        valid = [True] * rows
+    failed.sort(key=_row_order)
+    for error in failed:
+        valid[error.row] = False
+    return ColumnarResult(valid, failed, {c.element.name: c.values for c in table})
+
+
+class ColumnarResult:
+    """The outcome of :func:`validate_columns`."""
+
+    def __init__(self, valid, errors, values):
+        self.valid = valid
+        """A truth value for each row: a list of booleans, or a NumPy
+        array of booleans if any column was a NumPy array."""
+
+        self.errors = errors
+        """A :class:`ColumnError` for each invalid element, ordered by row
+        and then by field."""
+
+        self.values = values
+        """A mapping of field names to their columns of adapted values,
+        lists or NumPy arrays."""
+
+    def __repr__(self):
+        return "<ColumnarResult of %d rows, %d errors>" % (
+            len(self.valid),
+            len(self.errors),
+        )
+
+
+class ColumnError:
+    """An invalid element of a row validated by :func:`validate_columns`.
+
+    The :attr:`errors` of elements found invalid a column at a time are
+    expanded on first use, by running the validator that failed again on
+    the row's value.
+
+    """
+
+    __slots__ = ("row", "name", "_position", "_errors", "_replay")
+
+    def __init__(self, row, name, position, errors=None, replay=None):
+        self.row = row
+        """The index of the row."""
+
+        self.name = name
+        """The name of the field, or the schema's name for the record
+        itself."""
+
+        self._position = position
+        self._errors = errors
+        self._replay = replay
+
+    @property
+    def errors(self):
+        """The element's :attr:`~flatland.schema.base.Element.errors`."""
+        if self._errors is None:
+            column, validator, state = self._replay
+            self._replay = None
+            element = column.load(self.row)
+            if validator is not None:
+                validator(element, state)
+            self._errors = list(element.errors)
+        return self._errors
+
+    def __repr__(self):
+        return "<ColumnError row %d %r>" % (self.row, self.name)
+
+
+def _row_order(error):
+    return error.row, error._position
+
+
+class _Column:
+    """A column's raw and adapted values, and how to validate them."""
+
+    def __init__(self, element, raws):
+        self.element = element
+        self.array = False
+        cls = type(element)
+        if numpy is not None and isinstance(raws, numpy.ndarray):
+            if raws.ndim != 1:
+                raise ValueError("column %r is not one-dimensional" % element.name)
+            if self._adopt(raws):
+                self.array = True
+            else:
+                raws = raws.tolist()
+        self.raws = raws
+        if not self.array:
+            if cls.set is Scalar.set and not element_set.receivers:
+                self.values, self.text = _adapt(element, raws)
+            else:
+                self.values, self.text = _set(element, raws)
+            self.native = self.values
+
+        self.kernels = None
+        if cls._validate is Element._validate and not cls.validates_up:
+            validators = element.validators
+            kernels = [
+                None if "validate" in vars(fn) else _KERNELS.get(type(fn))
+                for fn in validators
+            ]
+            if None not in kernels:
+                self.kernels = list(zip(validators, kernels))
+
+    def _adopt(self, raws):
+        """Take a NumPy array of numbers as adapted values, if possible."""
+        element = self.element
+        cls = type(element)
+        if (
+            cls.set is not Scalar.set
+            or cls.adapt is not Number.adapt
+            or cls.serialize is not Number.serialize
+            or element_set.receivers
+        ):
+            return False
+        kind = raws.dtype.kind
+        if element.type_ is int and kind in "iu":
+            values = raws
+        elif element.type_ is float and kind in "iuf":
+            values = raws.astype(float)
+        else:
+            return False
+        if not element.signed and kind != "u" and len(raws) and (raws < 0).any():
+            return False
+        self.values = values
+        return True
+
+    def __getattr__(self, attribute):
+        # the Python values and text of adopted arrays, made on first use
+        if attribute == "native":
+            self.native = self.values.tolist()
+            return self.native
+        if attribute == "text":
+            serialize = self.element.serialize
+            self.text = [serialize(value) for value in self.native]
+            return self.text
+        raise AttributeError(attribute)
+
+    def load(self, row):
+        """Give the column's element the values of *row*, unvalidated."""
+        element = self.element
+        state = element.__dict__
+        for attribute in ("valid", "errors", "warnings", "_deferred_messages"):
+            state.pop(attribute, None)
+        raw = self.raws[row]
+        element.raw = raw.item() if self.array else raw
+        element.value = self.native[row]
+        element.u = self.text[row]
+        return element
+
+    def empty(self, rows):
+        """Return the *rows* in which the element would be empty."""
+        if self.array:
+            # numbers are never empty
+            return []
+        is_empty = type(self.element).is_empty
+        values, text = self.values, self.text
+        if is_empty is Element.is_empty:
+            return [r for r in rows if values[r] is None and text[r] == ""]
+        if is_empty is String.is_empty:
+            return [r for r in rows if not values[r] and text[r] == ""]
+        return [r for r in rows if self.load(r).is_empty]
+
+
+def _adapt(element, raws):
+    """Adapt *raws* as :meth:`Scalar.set` would, returning values and text."""
+    adapt, serialize = element.adapt, element.serialize
+    values, text = [], []
+    for raw in raws:
+        try:
+            value = adapt(raw)
+        except AdaptationError:
+            value = None
+            if raw is None:
+                u = ""
+            elif isinstance(raw, str):
+                u = raw
+            else:
+                try:
+                    u = str(raw)
+                except TypeError:
+                    u = ""
+                except UnicodeDecodeError:
+                    u = str(raw, errors="replace")
+        else:
+            u = "" if value is None else serialize(value)
+        values.append(value)
+        text.append(u)
+    return values, text
+
+
+def _set(element, raws):
+    """Adapt *raws* with the element's own ``set``, returning values and text."""
+    values, text = [], []
+    for raw in raws:
+        element.set(raw)
+        values.append(element.value)
+        text.append(element.u)
+    return values, text
+
+
+def _validate_column(position, column, rows, state, failed):
+    """Validate a column with its validators' kernels, noting failures."""
+    element = column.element
+    name = element.name
+    pending = range(rows)
+    if element.optional:
+        empty = set(column.empty(pending))
+        if empty:
+            pending = [r for r in pending if r not in empty]
+    if not column.kernels:
+        for r in column.empty(pending):
+            failed.append(ColumnError(r, name, position, errors=[]))
+        return
+    if column.array:
+        pending = numpy.arange(rows)
+    for validator, kernel in column.kernels:
+        if column.array:
+            ok = _ARRAY_KERNELS.get(type(validator), _unvectorized)(
+                validator, column, pending
+            )
+            rejected, pending = pending[~ok].tolist(), pending[ok]
+        else:
+            rejected = kernel(validator, column, pending)
+            if rejected:
+                skip = set(rejected)
+                pending = [r for r in pending if r not in skip]
+        for r in rejected:
+            failed.append(
+                ColumnError(r, name, position, replay=(column, validator, state))
+            )
+        if not len(pending):
+            break
+
+
+def _validate_cells(table, by_cell, rows, state, failed):
+    """Validate some columns a row at a time on a reused element tree."""
+    with i18n_resolution_cache():
+        for r in range(rows):
+            # siblings hold the row too, for validators comparing fields
+            for column in table:
+                column.load(r)
+            for position, column in by_cell:
+                element = column.element
+                if not _validate_member(element, state):
+                    failed.append(
+                        ColumnError(r, element.name, position, list(element.errors))
+                    )
+
+
+def _validate_rows(row, table, rows, state, failed):
+    """Validate a row at a time on a reused element tree."""
+    elements = [row] + [column.element for column in table]
+    with i18n_resolution_cache():
+        for r in range(rows):
+            for column in table:
+                column.load(r)
+            for attribute in ("valid", "errors", "warnings", "_deferred_messages"):
+                row.__dict__.pop(attribute, None)
+            if row.validate(state):
+                continue
+            for position, element in enumerate(elements, -1):
+                if not element.valid or element.errors:
+                    failed.append(
+                        ColumnError(r, element.name, position, list(element.errors))
+                    )
+
+
+# Kernels check a validator against a column's values in the *rows* not
+# yet rejected, returning the rejected rows, with the rows checks fused
+# validation's checks are paired with.
+
+
+def _kernel(rows_check):
+    def kernel(validator, column, rows):
+        return rows_check(validator, column.native, column.text, rows)
+
+    return kernel
+
+
+_KERNELS = {cls: _kernel(rows_check) for cls, (_, rows_check) in _CHECKS.items()}
+
+# Array kernels check adopted NumPy columns, returning a mask of the
+# *rows* (an array of row indexes) that pass.
+
+
+def _unvectorized(validator, column, rows):
+    rejected = _KERNELS[type(validator)](validator, column, rows.tolist())
+    return numpy.isin(rows, rejected, invert=True)
+
+
+def _numeric(*bounds):
+    return all(type(bound) in (int, float, bool) for bound in bounds)
+
+
+def _array_accepted(validator, column, rows):
+    # numbers always have a value and text
+    return numpy.ones(len(rows), dtype=bool)
+
+
+def _array_is_true(validator, column, rows):
+    return column.values[rows] != 0
+
+
+def _array_is_false(validator, column, rows):
+    return column.values[rows] == 0
+
+
+def _array_comparison(attribute, compare):
+    def kernel(validator, column, rows):
+        bound = getattr(validator, attribute)
+        if not _numeric(bound):
+            return _unvectorized(validator, column, rows)
+        return compare(column.values[rows], bound)
+
+    return kernel
+
+
+def _array_value_between(validator, column, rows):
+    minimum, maximum = validator.minimum, validator.maximum
+    if not _numeric(minimum, maximum):
+        return _unvectorized(validator, column, rows)
+    values = column.values[rows]
+    if validator.inclusive:
+        return (minimum <= values) & (values <= maximum)
+    return (minimum < values) & (values < maximum)
+
+
+_ARRAY_KERNELS = {
+    scalars.Present: _array_accepted,
+    scalars.Converted: _array_accepted,
+    scalars.IsTrue: _array_is_true,
+    scalars.IsFalse: _array_is_false,
+    scalars.ValueLessThan: _array_comparison("boundary", lambda v, b: v < b),
+    scalars.ValueAtMost: _array_comparison("maximum", lambda v, b: v <= b),
+    scalars.ValueGreaterThan: _array_comparison("boundary", lambda v, b: v > b),
+    scalars.ValueAtLeast: _array_comparison("minimum", lambda v, b: v >= b),
+    scalars.ValueBetween: _array_value_between,
+}
@@ -0,0 +1,198 @@
+"""Memory footprint reporting for element trees."""
+
+import collections
+import gc
+import sys
+import tracemalloc
+from types import FunctionType, MethodType, ModuleType
+
+from flatland.schema.base import Element, Slot
+from flatland.util import _symbol
+
+__all__ = ["Footprint", "measure"]
+
+# instance attributes tallied apart from the element's own values
+_MESSAGES = ("errors", "warnings", "_deferred_messages")
+_PROPERTIES = ("properties",)
+
+# shared objects never owned by a tree
+_SHARED = (type, _symbol, FunctionType, MethodType, ModuleType, bool, type(None))
+
+
+class Footprint:
+    """The memory held by an element tree, as reported by :func:`measure`.
+
+    Sizes are in bytes, as reported by :func:`sys.getsizeof` for each
+    object reachable from the tree's elements and not shared with their
+    classes.  Objects referenced from more than one element are counted
+    once.
+
+    """
+
+    def __init__(self):
+        self.elements = 0
+        """The number of elements, including List slots."""
+
+        self.counts = collections.Counter()
+        """A mapping of element type name to the number of elements."""
+
+        self.sizes = collections.Counter()
+        """A mapping of element type name to bytes held by those elements.
+
+        Includes each element's instance dictionary and container storage,
+        but not its values, messages or properties.
+        """
+
+        self.values = 0
+        """Bytes held in values and other instance attributes, such as
+        ``value``, ``u`` and ``raw``."""
+
+        self.messages = 0
+        """Bytes held in :attr:`~flatland.schema.base.Element.errors` and
+        :attr:`~flatland.schema.base.Element.warnings`."""
+
+        self.properties = 0
+        """Bytes held in per-element
+        :attr:`~flatland.schema.base.Element.properties`."""
+
+        self.traced = None
+        """Bytes allocated while building the tree, as traced by
+        :mod:`tracemalloc`, if :func:`measure` built it.  Otherwise None."""
+
+    @property
+    def total(self):
+        """The total bytes retained by the tree."""
+        return sum(self.sizes.values()) + self.values + self.messages + self.properties
+
+    def report(self):
+        """Return the footprint as a table of text lines."""
+        lines = ["%-24s %8s %12s" % ("element type", "count", "bytes")]
+        for name, size in self.sizes.most_common():
+            lines.append("%-24s %8d %12d" % (name, self.counts[name], size))
+        lines.append("%-24s %8s %12d" % ("values", "", self.values))
+        lines.append("%-24s %8s %12d" % ("errors and warnings", "", self.messages))
+        lines.append("%-24s %8s %12d" % ("properties", "", self.properties))
+        lines.append("%-24s %8d %12d" % ("total", self.elements, self.total))
+        if self.traced is not None:
+            lines.append("%-24s %8s %12d" % ("traced", "", self.traced))
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return "<Footprint %d elements, %d bytes>" % (self.elements, self.total)
+
+
+def measure(target, defaults=False):
+    """Report the memory held by an element tree.
+
+    :param target: an element, or an element class.  A class is
+      instantiated to build the tree, while :mod:`tracemalloc` records the
+      memory allocated doing so in :attr:`Footprint.traced`.
+
+    :param defaults: if true and *target* is a class, build the tree with
+      :meth:`~flatland.schema.base.Element.from_defaults`.
+
+    :returns: a :class:`Footprint`.
+
+    .. doctest::
+
+      >>> from flatland import Dict, String
+      >>> from flatland.diagnostics import measure
+      >>> footprint = measure(Dict.of(String.named('a'), String.named('b')))
+      >>> footprint.elements
+      3
+      >>> sorted(footprint.counts.items())
+      [('Dict', 1), ('String', 2)]
+
+    """
+    footprint = Footprint()
+    if isinstance(target, type):
+        build = target.from_defaults if defaults else target
+        gc.collect()
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            element = build()
+            footprint.traced = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+    else:
+        element = target
+
+    root = element
+    seen = {id(element)}
+    queue = collections.deque([element])
+    while queue:
+        element = queue.popleft()
+        _measure_element(element, footprint, seen, queue)
+        # members held by a slot, as List members are, are reached through it
+        parent = element.parent
+        if element is not root and isinstance(parent, Slot) and id(parent) not in seen:
+            seen.add(id(parent))
+            queue.append(parent)
+        for member in _storage(element):
+            if id(member) not in seen:
+                seen.add(id(member))
+                queue.append(member)
+    return footprint
+
+
+def _storage(element):
+    """Return the elements stored in a container, without creating any."""
+    if isinstance(element, dict):
+        return dict.values(element)
+    if isinstance(element, list):
+        return list.__iter__(element)
+    return ()
+
+
+def _measure_element(element, footprint, seen, queue):
+    name = type(element).__name__
+    footprint.elements += 1
+    footprint.counts[name] += 1
+    size = sys.getsizeof(element)
+    state = getattr(element, "__dict__", None)
+    if state is None:
+        footprint.sizes[name] += size
+        return
+    footprint.sizes[name] += size + sys.getsizeof(state)
+
+    cls = type(element)
+    for attribute, value in state.items():
+        if attribute == "parent" or value is getattr(cls, attribute, None):
+            continue
+        size = _sizeof(value, seen, queue)
+        if attribute in _MESSAGES:
+            footprint.messages += size
+        elif attribute in _PROPERTIES:
+            footprint.properties += size
+        else:
+            footprint.values += size
+
+
+def _sizeof(value, seen, queue):
+    """Return the size of *value* and the unseen objects it contains.
+
+    Elements found are added to *queue* rather than sized.
+
+    """
+    total = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen or isinstance(value, _SHARED):
+            continue
+        seen.add(id(value))
+        if isinstance(value, Element):
+            # held outside of any container's storage, like a reused member
+            queue.append(value)
+            continue
+        total += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+    return total
@@ -1,2 +1,6 @@
 class AdaptationError(Exception):
     """A value could not be coerced into native format."""
+
+
+class InputLimitError(ValueError):
+    """Input exceeded a configured size or count limit."""
@@ -0,0 +1,600 @@
+"""Incremental parsing of request bodies into flat ``(key, value)`` pairs.
+
+The parsers here read a body a chunk at a time and yield decoded pairs as
+soon as each is complete, so they may be handed straight to
+:meth:`~flatland.schema.base.Element.set_flat` without building an
+intermediate list of the whole body:
+
+.. testcode::
+
+  import io
+  from flatland import Dict, String
+  from flatland.ingest import iter_urlencoded
+
+  schema = Dict.named('user').of(String.named('name'), String.named('email'))
+  body = io.BytesIO(b'user_name=Ada+L&user_email=ada%40example.com')
+  element = schema.from_flat(iter_urlencoded(body))
+
+.. testcode:: :hide:
+
+  assert element.value == {'name': 'Ada L', 'email': 'ada@example.com'}
+
+Memory held by a parser is bounded by the size of the longest single
+field, which may be capped with *max_field_size*.  File uploads in
+``multipart/form-data`` bodies are streamed to spooled temporary files and
+arrive as :class:`UploadedFile` values, suitable for
+:class:`~flatland.schema.scalars.File` elements.
+
+"""
+
+from email.parser import HeaderParser
+from tempfile import SpooledTemporaryFile
+from urllib.parse import unquote_to_bytes
+
+from flatland.exc import InputLimitError
+from flatland.schema.flat import FlatTrie
+
+__all__ = [
+    "MultipartParser",
+    "UploadedFile",
+    "UrlencodedParser",
+    "aread_multipart",
+    "aread_urlencoded",
+    "iter_multipart",
+    "iter_urlencoded",
+    "multipart_boundary",
+]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_SPOOL_SIZE = 1024 * 1024
+DEFAULT_MAX_HEADER_SIZE = 16 * 1024
+
+
+class UrlencodedParser:
+    """A push parser for ``application/x-www-form-urlencoded`` bodies.
+
+    Feed it bytes with :meth:`feed` and collect completed pairs from the
+    return value; call :meth:`close` at the end of the body to collect the
+    final pair.
+
+    :param charset: the character set of the decoded keys and values.
+
+    :param errors: the error handling scheme for decoding, as in
+      :meth:`bytes.decode`.
+
+    :param max_field_size: optional, the largest number of bytes allowed in
+      a single encoded ``key=value`` field.  Exceeding it raises
+      :exc:`~flatland.exc.InputLimitError`.
+
+    :param max_size: optional, the largest number of body bytes accepted.
+      Exceeding it raises :exc:`~flatland.exc.InputLimitError`.
+
+    Fields without an ``=`` are given an empty value, and empty fields are
+    skipped.
+
+    """
+
+    def __init__(
+        self, charset="utf-8", errors="replace", max_field_size=None, max_size=None
+    ):
+        self.charset = charset
+        self.errors = errors
+        self.max_field_size = max_field_size
+        self.max_size = max_size
+        self.size = 0
+        self._pending = []
+        self._pending_size = 0
+
+    def feed(self, data):
+        """Parse a chunk of body bytes, returning a list of completed pairs."""
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            raise InputLimitError("urlencoded body exceeds %d bytes" % self.max_size)
+        if b"&" not in data:
+            # mid-field: hold on to the chunk without re-joining
+            self._pending.append(data)
+            self._pending_size += len(data)
+            self._check_field_size(self._pending_size)
+            return []
+        self._pending.append(data)
+        fields = b"".join(self._pending).split(b"&")
+        tail = fields.pop()
+        self._pending = [tail]
+        self._pending_size = len(tail)
+        self._check_field_size(self._pending_size)
+        return [self._decode(field) for field in fields if field]
+
+    def close(self):
+        """Finish parsing, returning a list of any remaining pairs."""
+        field = b"".join(self._pending)
+        self._pending, self._pending_size = [], 0
+        return [self._decode(field)] if field else []
+
+    def _check_field_size(self, size):
+        limit = self.max_field_size
+        if limit is not None and size > limit:
+            raise InputLimitError("urlencoded field exceeds %d bytes" % limit)
+
+    def _decode(self, field):
+        self._check_field_size(len(field))
+        key, _, value = field.partition(b"=")
+        return (
+            unquote_to_bytes(key.replace(b"+", b" ")).decode(self.charset, self.errors),
+            unquote_to_bytes(value.replace(b"+", b" ")).decode(
+                self.charset, self.errors
+            ),
+        )
+
+
+def iter_urlencoded(
+    body,
+    charset="utf-8",
+    errors="replace",
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    content_length=None,
+    max_field_size=None,
+    max_size=None,
+):
+    """Yield ``(key, value)`` pairs from an urlencoded request body.
+
+    :param body: a file-like object with a ``read`` method, such as a WSGI
+      ``wsgi.input`` stream, an iterable of :class:`bytes` chunks, or a
+      single :class:`bytes` object.
+
+    :param chunk_size: the number of bytes to read from a file-like *body*
+      at a time.
+
+    :param content_length: optional, the number of bytes to read from a
+      file-like *body*.  WSGI applications should pass ``CONTENT_LENGTH``
+      here: reading past it may block.
+
+    The remaining arguments are as for :class:`UrlencodedParser`.
+
+    """
+    parser = UrlencodedParser(charset, errors, max_field_size, max_size)
+    for chunk in _iter_chunks(body, chunk_size, content_length):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aread_urlencoded(body, sep="_", **options):
+    r"""Parse an asynchronous urlencoded body into a :class:`FlatTrie`.
+
+    :param body: an asynchronous iterable of :class:`bytes` chunks, such as
+      the body stream of an ASGI request.
+
+    :param sep: the separator the trie will be used with.
+
+    :param \*\*options: as for :class:`UrlencodedParser`.
+
+    Pairs are added to the trie as they are decoded.  The result may be
+    passed directly to :meth:`~flatland.schema.base.Element.set_flat` with
+    the same *sep*::
+
+      trie = await aread_urlencoded(request.stream())
+      element = schema.from_flat(trie)
+
+    """
+    return await _aread(UrlencodedParser(**options), body, sep)
+
+
+class UploadedFile:
+    """A file received in a ``multipart/form-data`` body.
+
+    File-like: reading, seeking and closing are delegated to :attr:`file`,
+    which is positioned at the start of the content when received.
+
+    """
+
+    def __init__(self, file, filename, content_type=None, headers=None, size=0):
+        self.file = file
+        """The content, a :class:`tempfile.SpooledTemporaryFile`."""
+
+        self.filename = filename
+        """The client-supplied file name."""
+
+        self.content_type = content_type
+        """The client-supplied ``Content-Type`` of the part, or None."""
+
+        self.headers = headers
+        """All headers of the part, an :class:`email.message.Message`."""
+
+        self.size = size
+        """The length of the content in bytes."""
+
+    def read(self, *args):
+        return self.file.read(*args)
+
+    def readline(self, *args):
+        return self.file.readline(*args)
+
+    def seek(self, *args):
+        return self.file.seek(*args)
+
+    def tell(self):
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return "<{} {!r}; {} bytes>".format(
+            type(self).__name__, self.filename, self.size
+        )
+
+
+_PREAMBLE, _DELIMITED, _HEADERS, _BODY, _EPILOGUE = range(5)
+
+
+class MultipartParser:
+    """A push parser for ``multipart/form-data`` bodies.
+
+    Feed it bytes with :meth:`feed` and collect completed pairs from the
+    return value; call :meth:`close` at the end of the body.
+
+    Ordinary fields are decoded to text.  File parts, those carrying a
+    ``filename``, are written to a :class:`~tempfile.SpooledTemporaryFile`
+    as they arrive and produced as :class:`UploadedFile` values.  A file
+    part with an empty file name and no content, as sent by browsers for a
+    file input left blank, produces an empty string.
+
+    :param boundary: the boundary from the request's ``Content-Type``.
+
+    :param charset: the default character set of field names and values.
+      A ``charset`` in a part's own ``Content-Type`` takes precedence.
+
+    :param errors: the error handling scheme for decoding, as in
+      :meth:`bytes.decode`.
+
+    :param max_field_size: optional, the largest number of bytes allowed in
+      an ordinary, non-file field value.
+
+    :param max_part_size: optional, the largest number of content bytes
+      allowed in any part, file or not.
+
+    :param max_size: optional, the largest number of body bytes accepted.
+
+    :param max_parts: optional, the largest number of parts accepted.
+
+    :param max_header_size: the largest number of bytes allowed in the
+      headers of a part.
+
+    :param spool_size: the number of bytes of a file upload held in memory
+      before it is rolled over to a temporary file on disk.
+
+    Exceeding any limit raises :exc:`~flatland.exc.InputLimitError`.  A
+    body that is not valid multipart data raises :exc:`ValueError`.
+
+    """
+
+    def __init__(
+        self,
+        boundary,
+        charset="utf-8",
+        errors="replace",
+        max_field_size=None,
+        max_part_size=None,
+        max_size=None,
+        max_parts=None,
+        max_header_size=DEFAULT_MAX_HEADER_SIZE,
+        spool_size=DEFAULT_SPOOL_SIZE,
+    ):
+        if isinstance(boundary, str):
+            boundary = boundary.encode("latin-1")
+        if not boundary:
+            raise ValueError("multipart boundary is required")
+        self.charset = charset
+        self.errors = errors
+        self.max_field_size = max_field_size
+        self.max_part_size = max_part_size
+        self.max_size = max_size
+        self.max_parts = max_parts
+        self.max_header_size = max_header_size
+        self.spool_size = spool_size
+        self.size = 0
+        self.parts = 0
+        self._delimiter = b"--" + boundary
+        self._needle = b"\r\n" + self._delimiter
+        self._buffer = b""
+        self._state = _PREAMBLE
+        self._part = None
+
+    def feed(self, data):
+        """Parse a chunk of body bytes, returning a list of completed pairs."""
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            self._abort()
+            raise InputLimitError("multipart body exceeds %d bytes" % self.max_size)
+        self._buffer += data
+        pairs = []
+        try:
+            while self._step(pairs):
+                pass
+        except ValueError:
+            self._abort()
+            raise
+        return pairs
+
+    def close(self):
+        """Finish parsing, returning a list of any remaining pairs."""
+        if self._state != _EPILOGUE:
+            self._abort()
+            raise ValueError("multipart body ended before the closing boundary")
+        return []
+
+    def _step(self, pairs):
+        """Advance the parser state, returning True if it may advance again."""
+        buffer, state = self._buffer, self._state
+        if state == _PREAMBLE:
+            index = buffer.find(self._delimiter)
+            if index == -1:
+                # keep only enough to recognize a split delimiter
+                self._buffer = buffer[-len(self._delimiter) :]
+                return False
+            self._buffer = buffer[index + len(self._delimiter) :]
+            self._state = _DELIMITED
+            return True
+        elif state == _DELIMITED:
+            if len(buffer) < 2:
+                return False
+            if buffer.startswith(b"--"):
+                self._buffer = b""
+                self._state = _EPILOGUE
+                return False
+            index = buffer.find(b"\r\n")
+            if index == -1:
+                if len(buffer) > self.max_header_size:
+                    raise InputLimitError("multipart boundary line is too long")
+                return False
+            self._buffer = buffer[index + 2 :]
+            self._state = _HEADERS
+            return True
+        elif state == _HEADERS:
+            if buffer.startswith(b"\r\n"):
+                raw, self._buffer = b"", buffer[2:]
+            else:
+                index = buffer.find(b"\r\n\r\n")
+                if index == -1:
+                    if len(buffer) > self.max_header_size:
+                        raise InputLimitError(
+                            "multipart part headers exceed %d bytes"
+                            % self.max_header_size
+                        )
+                    return False
+                raw, self._buffer = buffer[:index], buffer[index + 4 :]
+            if len(raw) > self.max_header_size:
+                raise InputLimitError(
+                    "multipart part headers exceed %d bytes" % self.max_header_size
+                )
+            self._begin_part(raw)
+            self._state = _BODY
+            return True
+        elif state == _BODY:
+            index = buffer.find(self._needle)
+            if index == -1:
+                # everything but a possible partial delimiter is content
+                keep = len(self._needle) - 1
+                if len(buffer) > keep:
+                    self._write(buffer[: len(buffer) - keep])
+                    self._buffer = buffer[len(buffer) - keep :]
+                return False
+            self._write(buffer[:index])
+            self._buffer = buffer[index + len(self._needle) :]
+            pair = self._end_part()
+            if pair is not None:
+                pairs.append(pair)
+            self._state = _DELIMITED
+            return True
+        else:
+            # epilogue is ignored
+            self._buffer = b""
+            return False
+
+    def _begin_part(self, raw):
+        self.parts += 1
+        if self.max_parts is not None and self.parts > self.max_parts:
+            raise InputLimitError("multipart body exceeds %d parts" % self.max_parts)
+        headers = HeaderParser().parsestr(raw.decode(self.charset, self.errors))
+        name = headers.get_param("name", header="content-disposition")
+        filename = headers.get_filename()
+        self._part = _Part(_param_text(name), filename, headers)
+
+    def _write(self, data):
+        part = self._part
+        if not data:
+            return
+        part.size += len(data)
+        if self.max_part_size is not None and part.size > self.max_part_size:
+            raise InputLimitError(
+                "multipart part exceeds %d bytes" % self.max_part_size
+            )
+        if part.name is None:
+            # unnamed parts can't be addressed; discard the content
+            return
+        if part.filename is None:
+            if self.max_field_size is not None and part.size > self.max_field_size:
+                raise InputLimitError(
+                    "multipart field exceeds %d bytes" % self.max_field_size
+                )
+            part.chunks.append(data)
+        else:
+            if part.file is None:
+                part.file = SpooledTemporaryFile(max_size=self.spool_size)
+            part.file.write(data)
+
+    def _end_part(self):
+        part, self._part = self._part, None
+        if part.name is None:
+            return None
+        if part.filename is None:
+            charset = part.headers.get_content_charset() or self.charset
+            return part.name, b"".join(part.chunks).decode(charset, self.errors)
+        if part.file is None:
+            if not part.filename:
+                return part.name, ""
+            part.file = SpooledTemporaryFile(max_size=self.spool_size)
+        part.file.seek(0)
+        content_type = part.headers.get("content-type")
+        upload = UploadedFile(
+            part.file, part.filename, content_type, part.headers, part.size
+        )
+        return part.name, upload
+
+    def _abort(self):
+        part, self._part = self._part, None
+        if part is not None and part.file is not None:
+            part.file.close()
+
+
+class _Part:
+    __slots__ = ("name", "filename", "headers", "size", "chunks", "file")
+
+    def __init__(self, name, filename, headers):
+        self.name = name
+        self.filename = filename
+        self.headers = headers
+        self.size = 0
+        self.chunks = []
+        self.file = None
+
+
+def _param_text(value):
+    if isinstance(value, tuple):
+        # an RFC 2231 encoded parameter
+        charset, _, text = value
+        return unquote_to_bytes(text).decode(charset or "us-ascii", "replace")
+    return value
+
+
+def multipart_boundary(content_type):
+    """Return the boundary parameter of a ``Content-Type`` header value.
+
+    Raises :exc:`ValueError` if *content_type* is not ``multipart/form-data``
+    or has no boundary.
+
+    """
+    headers = HeaderParser().parsestr("Content-Type: %s\r\n\r\n" % content_type)
+    if headers.get_content_type() != "multipart/form-data":
+        raise ValueError("not a multipart/form-data content type: %r" % content_type)
+    boundary = headers.get_boundary()
+    if not boundary:
+        raise ValueError("multipart content type has no boundary: %r" % content_type)
+    return boundary
+
+
+def iter_multipart(
+    body,
+    content_type,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    content_length=None,
+    **options,
+):
+    r"""Yield ``(key, value)`` pairs from a ``multipart/form-data`` body.
+
+    :param body: a file-like object with a ``read`` method, such as a WSGI
+      ``wsgi.input`` stream, an iterable of :class:`bytes` chunks, or a
+      single :class:`bytes` object.
+
+    :param content_type: the request's ``Content-Type`` header value,
+      holding the multipart boundary.
+
+    :param chunk_size: the number of bytes to read from a file-like *body*
+      at a time.
+
+    :param content_length: optional, the number of bytes to read from a
+      file-like *body*.
+
+    :param \*\*options: as for :class:`MultipartParser`.
+
+    File parts are produced as :class:`UploadedFile` values.  Pairs follow
+    the usual flattened naming, so uploads and ordinary fields are loaded
+    into the element tree together:
+
+    .. testcode::
+
+      from flatland import Dict, File, String
+      from flatland.ingest import iter_multipart
+
+      body = (b'--XX\r\n'
+              b'Content-Disposition: form-data; name="doc_title"\r\n\r\n'
+              b'Report\r\n'
+              b'--XX\r\n'
+              b'Content-Disposition: form-data; name="doc_upload"; '
+              b'filename="report.txt"\r\n'
+              b'Content-Type: text/plain\r\n\r\n'
+              b'All quiet.\r\n'
+              b'--XX--\r\n')
+
+      schema = Dict.named('doc').of(String.named('title'), File.named('upload'))
+      element = schema.from_flat(
+          iter_multipart(body, 'multipart/form-data; boundary=XX'))
+
+    .. doctest::
+
+      >>> element['title'].value
+      'Report'
+      >>> element['upload'].value.filename
+      'report.txt'
+      >>> element['upload'].value.read()
+      b'All quiet.'
+
+    """
+    parser = MultipartParser(multipart_boundary(content_type), **options)
+    for chunk in _iter_chunks(body, chunk_size, content_length):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aread_multipart(body, content_type, sep="_", **options):
+    r"""Parse an asynchronous multipart body into a :class:`FlatTrie`.
+
+    :param body: an asynchronous iterable of :class:`bytes` chunks, such as
+      the body stream of an ASGI request.
+
+    :param content_type: the request's ``Content-Type`` header value.
+
+    :param sep: the separator the trie will be used with.
+
+    :param \*\*options: as for :class:`MultipartParser`.
+
+    As :func:`aread_urlencoded`, the result may be passed directly to
+    :meth:`~flatland.schema.base.Element.set_flat`.
+
+    """
+    parser = MultipartParser(multipart_boundary(content_type), **options)
+    return await _aread(parser, body, sep)
+
+
+async def _aread(parser, body, sep):
+    trie, ordinal = FlatTrie(), 0
+    async for chunk in body:
+        for key, value in parser.feed(chunk):
+            trie.insert(ordinal, key, value, sep)
+            ordinal += 1
+    for key, value in parser.close():
+        trie.insert(ordinal, key, value, sep)
+        ordinal += 1
+    return trie
+
+
+def _iter_chunks(body, chunk_size, content_length):
+    if isinstance(body, (bytes, bytearray)):
+        yield bytes(body)
+    elif hasattr(body, "read"):
+        remaining = content_length
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = body.read(size)
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    else:
+        yield from body
@@ -16,6 +16,7 @@ from .scalars import (
     DateTime,
     Decimal,
     Enum,
+    File,
     Float,
     Integer,
     Long,
@@ -35,6 +36,9 @@ from .containers import (
     Sequence,
     SparseDict,
 )
+from .compact import (
+    CompactList,
+)
 from .compound import (
     Compound,
     DateYYYYMMDD,
@@ -0,0 +1,591 @@
+"""Compact storage for Lists of scalar values."""
+
+from array import array
+from collections import defaultdict
+
+from flatland.schema import base
+from flatland.schema.base import Element, Unevaluated
+from flatland.schema.containers import Container, List
+from flatland.schema.flat import FlatTrie
+from flatland.schema.scalars import Float, Integer, Long, Scalar
+from flatland.signals import element_set
+from flatland.util import Unspecified
+
+__all__ = ["CompactList"]
+
+# per-member flags
+_NONE = 1  # value is None; the member's entry in the values is a placeholder
+_VALID = 2
+_INVALID = 4
+# flags with validation results cleared, as a translation table
+_UNVALIDATED = bytes(flags & ~(_VALID | _INVALID) for flags in range(256))
+
+
+class CompactList(List):
+    """A :class:`~flatland.schema.containers.List` of scalars, stored compactly.
+
+    A List holds a :class:`~flatland.schema.containers.ListSlot` and a
+    member element for every item.  A CompactList instead keeps the
+    members' values in contiguous storage: an :class:`array.array` for
+    :class:`~flatland.schema.scalars.Integer` and
+    :class:`~flatland.schema.scalars.Float` members, and a list of values
+    otherwise, with a byte of flags for each member.  Member elements are
+    only created when indexed or iterated, and persist from then on.
+
+    :meth:`set`, :meth:`~flatland.schema.base.Element.set_flat`,
+    :meth:`~flatland.schema.base.Element.flatten`,
+    :meth:`~flatland.schema.base.Element.validate`, :attr:`value` and
+    :attr:`u` work through the storage, passing each member in turn
+    through a single reusable element, and cost time and memory in
+    proportion to the data rather than to a tree of elements:
+
+    .. doctest::
+
+      >>> from flatland import CompactList, Integer
+      >>> Numbers = CompactList.named('n').of(Integer)
+      >>> numbers = Numbers.from_flat([('n_0', '1'), ('n_1', '2')])
+      >>> numbers.value
+      [1, 2]
+      >>> numbers.flatten()
+      [('n_0', '1'), ('n_1', '2')]
+
+    The :attr:`member_schema` must be a
+    :class:`~flatland.schema.scalars.Scalar` that is not a container.
+    Members keep their ``value``, ``raw`` and ``valid`` state in storage;
+    their ``u`` is derived from the value with ``serialize()``, unless
+    adaptation failed.  A member given validation errors or warnings is
+    kept as an element.
+
+    Validators and :data:`~flatland.signals.element_set` receivers called
+    for members not yet created as elements are passed the reused element,
+    and should not hold on to it.
+
+    """
+
+    typecodes = ((Integer, "q"), (Long, "q"), (Float, "d"))
+    """Pairs of scalar types and the :mod:`array` typecode storing them.
+
+    Members of other types are stored in a list.  Storage falls back to a
+    list if a value does not fit its array.
+    """
+
+    def __init__(self, value=Unspecified, **kw):
+        schema = kw.get("member_schema", self.member_schema)
+        if schema and not (
+            issubclass(schema, Scalar) and not issubclass(schema, Container)
+        ):
+            raise TypeError(
+                "Invalid schema: %r requires a Scalar member_schema, got %r"
+                % (type(self), schema)
+            )
+        self._clear_storage(schema)
+        List.__init__(self, value, **kw)
+
+    def _clear_storage(self, schema=None):
+        schema = schema or self.member_schema
+        self._values = []
+        for type_, typecode in self.typecodes:
+            if schema and issubclass(schema, type_):
+                self._values = array(typecode)
+                break
+        self._flags = bytearray()
+        self._raw = []
+        self._u = {}
+        self._elements = {}
+
+    def _flyweight(self):
+        """Return the element reused to process members in storage."""
+        fly = self.__dict__.get("_fly")
+        if fly is None:
+            fly = self._fly = self.member_schema()
+            self.slot_type("0", self, fly)
+        return fly
+
+    def _load(self, element, index):
+        """Copy the stored state of the member at *index* into *element*."""
+        flags = self._flags[index]
+        if flags & _NONE:
+            element.value = None
+            element.u = self._u.get(index, "")
+        else:
+            element.value = value = self._values[index]
+            element.u = element.serialize(value)
+        element.raw = self._raw[index]
+        if flags & _VALID:
+            element.valid = True
+        elif flags & _INVALID:
+            element.valid = False
+        else:
+            element.valid = Unevaluated
+
+    def _store(self, index, element):
+        """Copy the state of *element* into storage for the member at *index*."""
+        self._note_change()
+        value = element.value
+        if value is None:
+            flags = _NONE
+            if element.u:
+                self._u[index] = element.u
+            else:
+                self._u.pop(index, None)
+            value = 0 if type(self._values) is array else None
+        else:
+            flags = 0
+            if self._u:
+                self._u.pop(index, None)
+        try:
+            self._values[index] = value
+        except (TypeError, OverflowError):
+            self._values = list(self._values)
+            self._values[index] = value
+        self._raw[index] = element.raw
+        valid = element.valid
+        if valid is not Unevaluated:
+            flags |= _VALID if valid else _INVALID
+        self._flags[index] = flags
+
+    def _append_stored(self, element):
+        """Add a member to storage with the state of *element*."""
+        self._note_change()
+        value = element.value
+        if value is None:
+            flags = _NONE
+            if element.u:
+                self._u[len(self._flags)] = element.u
+            value = 0 if type(self._values) is array else None
+        else:
+            flags = 0
+        valid = element.valid
+        if valid is not Unevaluated:
+            flags |= _VALID if valid else _INVALID
+        try:
+            self._values.append(value)
+        except (TypeError, OverflowError):
+            self._values = list(self._values)
+            self._values.append(value)
+        self._flags.append(flags)
+        self._raw.append(element.raw)
+
+    def _element(self, index):
+        """Return the member element at *index*, creating it if needed."""
+        element = self._elements.get(index)
+        if element is None:
+            element = self.member_schema()
+            self._load(element, index)
+            self.slot_type(str(index), self, element)
+            self._elements[index] = element
+        return element
+
+    def _peek(self, index):
+        """Return the member at *index*, or the flyweight loaded with it."""
+        element = self._elements.get(index)
+        if element is None:
+            element = self._flyweight()
+            element.parent.name = str(index)
+            self._load(element, index)
+        return element
+
+    def _position(self, index):
+        length = len(self._flags)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("list index out of range")
+        return index
+
+    def _splice(self, start, stop, items):
+        """Replace members *start* to *stop* with new members for *items*."""
+        tail = self._detach(start)
+        del tail[: stop - start]
+        for item in items:
+            self._append_item(item)
+        self._attach(tail)
+
+    def _detach(self, start):
+        """Remove members from *start* on, returning them as records."""
+        self._note_change()
+        values, flags, raw = self._values, self._flags, self._raw
+        records = [
+            (values[i], flags[i], raw[i], self._u.get(i), self._elements.get(i))
+            for i in range(start, len(flags))
+        ]
+        del values[start:], flags[start:], raw[start:]
+        for mapping in (self._u, self._elements):
+            for index in [i for i in mapping if i >= start]:
+                del mapping[index]
+        return records
+
+    def _attach(self, records):
+        """Append members previously removed by :meth:`_detach`."""
+        index = len(self._flags)
+        for index, (value, flags, raw, u, element) in enumerate(records, index):
+            try:
+                self._values.append(value)
+            except (TypeError, OverflowError):
+                self._values = list(self._values)
+                self._values.append(value)
+            self._flags.append(flags)
+            self._raw.append(raw)
+            if u is not None:
+                self._u[index] = u
+            if element is not None:
+                element.parent.name = str(index)
+                self._elements[index] = element
+
+    def _append_item(self, value):
+        if isinstance(value, Element):
+            self._append_stored(value)
+            index = len(self._flags) - 1
+            self.slot_type(str(index), self, value)
+            self._elements[index] = value
+        else:
+            fly = self._flyweight()
+            fly.reset()
+            if value is not Unspecified:
+                fly.set(value)
+            self._append_stored(fly)
+
+    def _member_matches(self, index, element):
+        member = self._peek(index)
+        return member.value == element.value and member.u == element.u
+
+    def _member_equals(self, index, element):
+        """True if the member at *index* equals *element*, as by ``==``.
+
+        Compares storage directly, leaving the flyweight, which *element*
+        may be, untouched.
+
+        """
+        member = self._elements.get(index)
+        if member is not None:
+            return member.value == element.value and member.u == element.u
+        if self._flags[index] & _NONE:
+            return element.value is None and self._u.get(index, "") == element.u
+        value = self._values[index]
+        return value == element.value and element.serialize(value) == element.u
+
+    def __len__(self):
+        return len(self._flags)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._element(i) for i in range(*index.indices(len(self)))]
+        return self._element(self._position(index))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                self._splice(start, max(start, stop), list(value))
+                return
+            indexes, value = range(start, stop, step), list(value)
+            if len(indexes) != len(value):
+                raise ValueError(
+                    "attempt to assign sequence of size %d to extended slice "
+                    "of size %d" % (len(value), len(indexes))
+                )
+            for i, item in zip(indexes, value):
+                self._splice(i, i + 1, [item])
+            return
+        index = self._position(index)
+        element = self._elements.get(index)
+        if element is not None:
+            element.set(value)
+        else:
+            fly = self._peek(index)
+            fly.set(value)
+            self._store(index, fly)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                self._splice(start, max(start, stop), ())
+                return
+            for i in sorted(range(start, stop, step), reverse=True):
+                self._splice(i, i + 1, ())
+            return
+        index = self._position(index)
+        self._splice(index, index + 1, ())
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._element(index)
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self._element(index)
+
+    @property
+    def _slots(self):
+        return (element.parent for element in self)
+
+    def append(self, value):
+        self._append_item(value)
+
+    def clear(self):
+        del self[:]
+
+    def insert(self, index, value):
+        length = len(self)
+        if index < 0:
+            index = max(0, index + length)
+        index = min(index, length)
+        self._splice(index, index, [value])
+
+    def pop(self, index=-1):
+        index = self._position(index)
+        slot = self._element(index).parent
+        self._splice(index, index + 1, ())
+        slot.parent = None
+        return slot
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def index(self, value):
+        element = self._as_element(value)
+        for index in range(len(self)):
+            if self._member_matches(index, element):
+                return index
+        raise ValueError("%r is not in list" % (value,))
+
+    def count(self, value):
+        element = self._as_element(value)
+        return sum(1 for i in range(len(self)) if self._member_matches(i, element))
+
+    def __contains__(self, value):
+        element = self._as_element(value)
+        return any(self._member_matches(i, element) for i in range(len(self)))
+
+    def sort(self, cmp=None, key=None, reverse=False):
+        assert cmp is None  # no cmp for list.sort in py3
+        slots = list(self._slots)
+        order = sorted(
+            range(len(slots)),
+            key=(lambda i: slots[i]) if key is None else (lambda i: key(slots[i])),
+            reverse=reverse,
+        )
+        self._reorder(order)
+
+    def reverse(self):
+        self._reorder(reversed(range(len(self))))
+
+    def _reorder(self, order):
+        records = self._detach(0)
+        self._attach([records[i] for i in order])
+
+    @property
+    def children(self):
+        return iter(self)
+
+    @property
+    def is_empty(self):
+        return not self._flags
+
+    @property
+    def value(self):
+        values, flags, elements = self._values, self._flags, self._elements
+        return [
+            (
+                elements[i].value
+                if i in elements
+                else None if flags[i] & _NONE else values[i]
+            )
+            for i in range(len(flags))
+        ]
+
+    @property
+    def u(self):
+        return "[%s]" % ", ".join(repr(self._peek(i).u) for i in range(len(self)))
+
+    def set(self, iterable):
+        del self[:]
+        self.raw = iterable
+        converted = True
+        fly = self._flyweight()
+        try:
+            for value in iterable:
+                fly.reset()
+                converted &= fly.set(value)
+                self._append_stored(fly)
+        except TypeError:
+            del self[:]
+            element_set.send(self, adapted=False)
+            return False
+        else:
+            element_set.send(self, adapted=converted)
+            return converted
+
+    def set_default(self):
+        default = self.default_value
+        if default is None or default is Unspecified:
+            return
+
+        del self[:]
+        if not isinstance(default, int):
+            self.set(default)
+            return
+        fly = self._flyweight()
+        for _ in range(0, default):
+            fly.reset()
+            fly.set_default()
+            self._append_stored(fly)
+
+        # a prototype of this list must refresh the list, not the flyweight
+        calls = getattr(base._factory_calls, "elements", None)
+        if calls and any(element is fly for element in calls):
+            calls[:] = [element for element in calls if element is not fly]
+            if not fly.pure_default_factory:
+                calls.append(self)
+
+    def _set_flat_trie(self, node, sep):
+        del self[:]
+
+        plan = self._flat_plan(sep)
+        node = node.find(plan.segments)
+        if node is None:
+            return
+
+        prune = plan.prune
+        if prune:
+            node = node.pruned()
+            if node is None:
+                return
+
+        indexes = defaultdict(list)
+        for segment, child in node.children.items():
+            if not segment.isdecimal():
+                continue
+            try:
+                index = int(segment)
+            except ValueError:
+                continue
+            indexes[index].append(child)
+        if not indexes:
+            return
+
+        fly = self._flyweight()
+        if prune:
+            present = sorted(indexes)[: plan.maximum]
+        else:
+            present = range(0, min(max(indexes) + 1, plan.maximum))
+        for index in present:
+            fly.reset()
+            flat = indexes.get(index)
+            if flat:
+                fly._set_flat_node(FlatTrie.merged(flat, sep), sep)
+            self._append_stored(fly)
+
+    def _flatten_children(self, prefix, sep, value):
+        return [(None, self._iter_flat_members(prefix, sep, value), None)]
+
+    def _iter_flat_members(self, prefix, sep, value):
+        if not self.member_schema.flattenable:
+            return
+        for index in range(len(self)):
+            key = str(index) if prefix is None else prefix + sep + str(index)
+            element = self._peek(index)
+            if element.name is not None:
+                key = key + sep + element.name
+            yield (key, value(element))
+
+    def _validate_children(self, state, fail_fast=False):
+        # every member is validated here, in order: members already
+        # created in place, and the others through the flyweight
+        valid = True
+        values, flags, raw, elements = (
+            self._values,
+            self._flags,
+            self._raw,
+            self._elements,
+        )
+        fly = self._flyweight()
+        slot, members = fly.parent, fly.__dict__
+        for index in range(len(flags)):
+            element = elements.get(index)
+            if element is not None:
+                validated = _validate_member(element, state)
+                if not validated and fail_fast:
+                    raise base._Halt(element)
+                if valid:
+                    valid &= validated
+                continue
+            # as _peek, inlined
+            slot.name = str(index)
+            bits = flags[index] & _NONE
+            if bits:
+                value, u = None, self._u.get(index, "")
+            else:
+                value = values[index]
+                u = fly.serialize(value)
+            members["value"], members["u"], members["raw"] = value, u, raw[index]
+
+            validated = _validate_member(fly, state)
+            if valid:
+                valid &= validated
+            halt = not validated and fail_fast
+            if (
+                halt
+                or members.get("errors")
+                or members.get("warnings")
+                or "_deferred_messages" in members
+            ):
+                # keep the messages, or the member stopped at: the
+                # flyweight becomes the member
+                elements[index] = fly
+                del self._fly
+                if halt:
+                    raise base._Halt(fly)
+                fly = self._flyweight()
+                slot, members = fly.parent, fly.__dict__
+            elif members["value"] is value and members["u"] is u:
+                member_valid = members["valid"]
+                if member_valid is not Unevaluated:
+                    bits |= _VALID if member_valid else _INVALID
+                flags[index] = bits
+            else:
+                self._store(index, fly)
+                values = self._values
+        return (), valid
+
+    def _forget_validation(self):
+        Element._forget_validation(self)
+        self._flags = self._flags.translate(_UNVALIDATED)
+        return list(self._elements.values())
+
+    def _clone(self, parent, memo):
+        clone = Element._clone(self, parent, memo)
+        clone.__dict__.pop("_fly", None)
+        clone._values = self._values[:]
+        clone._flags = bytearray(self._flags)
+        clone._raw = self._raw[:]
+        clone._u = dict(self._u)
+        clone._elements = {}
+        for index, element in self._elements.items():
+            element = element._clone(None, memo)
+            self.slot_type(str(index), clone, element)
+            clone._elements[index] = element
+        return clone
+
+    def __repr__(self):
+        return "[%s]" % ", ".join(repr(self._peek(i)) for i in range(len(self)))
+
+
+def _validate_member(element, state):
+    """Validate a scalar *element* down and up, as Element.validate would."""
+    valid = True
+    validated = element._validate(state, True)
+    if validated is Unevaluated:
+        element.valid = validated
+    else:
+        element.valid = bool(validated)
+        valid = validated
+    if not element.validates_up:
+        return valid
+    validated = element._validate(state, False)
+    if validated is not Unevaluated and element.valid:
+        element.valid = bool(validated)
+        if valid:
+            valid &= validated
+    return valid
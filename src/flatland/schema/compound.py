@@ -105,6 +105,9 @@ class Compound(Mapping, Scalar, metaclass=_MetaCompound):
 
     """
 
+    # prepared on first use, so derived classes are never interned
+    _intern_derived = False
+
     def __compound_init__(cls):
         """.. TODO:: doc
 
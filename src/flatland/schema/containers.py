@@ -1,4 +1,5 @@
 from collections import defaultdict
+import itertools
 import re
 
 from flatland.util import (
@@ -11,7 +12,8 @@ from flatland.util import (
     to_pairs,
 )
 from flatland.signals import element_set
-from .base import Element, Unevaluated, Slot, validate_element
+from .base import _MAPPING, Element, Unset, Slot
+from .flat import FlatPlan, FlatTrie, split_name
 from .scalars import Scalar
 
 __all__ = (
@@ -49,6 +51,9 @@ class Container(Element):
     descent_validators = ()
     """.. TODO:: doc descent_validators"""
 
+    # no default validation on the downward pass
+    _descent_default = False
+
     @class_cloner
     def descent_validated_by(cls, *validators):
         r"""Return a class with descent validators set to *\*validators*.
@@ -93,22 +98,6 @@ class Container(Element):
         cls.descent_validators = mutable
         return cls
 
-    def _validate(self, state, descending):
-        """Run validation, transforming None into success. Internal."""
-        # FIXME: refactor this to allow for this logic ("Don't apply default
-        # validation on downward pass") to be defined declaratively.
-        if descending:
-            if self.validates_down:
-                validators = getattr(self, self.validates_down, None)
-                if not validators:
-                    return Unevaluated
-                return validate_element(self, state, validators)
-        else:
-            if self.validates_up:
-                validators = getattr(self, self.validates_up, None)
-                return validate_element(self, state, validators)
-        return Unevaluated
-
 
 class Sequence(Container, list):
     """Abstract base of sequence-like Containers.
@@ -149,6 +138,16 @@ class Sequence(Container, list):
         if not self.member_schema:
             raise TypeError("Invalid schema: %r has no member_schema" % type(self))
 
+    def reset(self):
+        Element.reset(self)
+        del self[:]
+
+    def _clone(self, parent, memo):
+        clone = Element._clone(self, parent, memo)
+        for member in list.__iter__(self):
+            list.append(clone, member._clone(clone, memo))
+        return clone
+
     @class_cloner
     def of(cls, *schema):
         r"""Declare the class to hold a sequence of *\*schema*.
@@ -221,6 +220,7 @@ class Sequence(Container, list):
 
         """
 
+        self._note_change()
         del self[:]
         self.raw = iterable
         values, converted = [], True
@@ -272,6 +272,7 @@ class Sequence(Container, list):
             value = self.member_schema(value=value)
         value.parent = self
         list.append(self, value)
+        self._note_change()
 
     def extend(self, iterable):
         """Append *iterable* values to the end.
@@ -294,6 +295,7 @@ class Sequence(Container, list):
             value = self.member_schema(value=value)
         value.parent = self
         list.insert(self, index, value)
+        self._note_change()
 
     def __setitem__(self, index, value):
         if isinstance(index, slice):
@@ -309,6 +311,7 @@ class Sequence(Container, list):
                 value = self.member_schema(value=value)
                 value.parent = self
         list.__setitem__(self, index, value)
+        self._note_change()
 
     def __setslice__(self, i, j, value):
         self.__setitem__(slice(i, j), value)
@@ -324,6 +327,16 @@ class Sequence(Container, list):
         if not isinstance(value, Element):
             value = self.member_schema(value=value)
         list.remove(self, value)
+        self._note_change()
+
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._note_change()
+
+    def pop(self, index=-1):
+        member = list.pop(self, index)
+        self._note_change()
+        return member
 
     def index(self, value):
         """Return first index of *value*.
@@ -386,11 +399,26 @@ class ListSlot(Container, Slot):
     """
 
     def __init__(self, name, parent, element):
-        self.name = name
         self.parent = parent
+        self.name = name
         self.element = element
         element.parent = self
 
+    @property
+    def name(self):
+        """The index of the slot in its List, as a string."""
+        parent = self.parent
+        if parent is not None:
+            stale = parent._renumber_from
+            if stale is not None and self._position >= stale:
+                parent._refresh_names()
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        self._position = int(name)
+
     @property
     def u(self):
         return self.element.u
@@ -429,6 +457,9 @@ class List(Sequence):
 
     """
 
+    # the lowest index of slots that may be misnamed, or None
+    _renumber_from = None
+
     def _as_element(self, value):
         """.. TODO::"""
         if value is Unspecified:
@@ -440,6 +471,7 @@ class List(Sequence):
 
     def _new_slot(self, value=Unspecified):
         """Wrap *value* in a Slot named as the element's index in the list."""
+        self._note_change()
         new_idx = len(self)
         name = str(new_idx)
         if not isinstance(name, str):
@@ -451,6 +483,14 @@ class List(Sequence):
         """An iterator of the List's otherwise hidden Slots."""
         return list.__iter__(self)
 
+    def _clone(self, parent, memo):
+        self._refresh_names()
+        clone = Element._clone(self, parent, memo)
+        for slot in list.__iter__(self):
+            element = slot.element._clone(None, memo)
+            list.append(clone, self.slot_type(slot._name, clone, element))
+        return clone
+
     def append(self, value):
         list.append(self, self._new_slot(value))
 
@@ -469,8 +509,9 @@ class List(Sequence):
     def __setitem__(self, index, value):
         if isinstance(index, slice):
             value = [self._new_slot(item) for item in value]
+            start = _slice_start(index, len(self))
             list.__setitem__(self, index, value)
-            self._renumber()
+            self._renumber(start)
         else:
             slot = self[index]
             slot.set(value)
@@ -483,27 +524,39 @@ class List(Sequence):
             yield i.element
 
     def __delitem__(self, index):
-        # Optimizing __delitem__ or pop when removing only the last item
-        # doesn't seem worth it.
-        list.__delitem__(self, index)  # slices ok
-        self._renumber()
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            removed = list.__getitem__(self, index)
+            start = min(positions, default=len(self))
+        else:
+            start = index + len(self) if index < 0 else index
+            positions, removed = (start,), (list.__getitem__(self, index),)
+        # removed slots keep the names they had
+        for position, slot in zip(positions, removed):
+            slot.name = str(position)
+        list.__delitem__(self, index)
+        self._renumber(start)
 
     def __delslice__(self, i, j):
         return self.__delitem__(slice(i, j))
 
     def pop(self, index=-1):
+        position = index + len(self) if index < 0 else index
         value = list.pop(self, index)
-        self._renumber()
+        value.name = str(position)
+        self._renumber(position)
         value.parent = None
         return value
 
     def insert(self, index, value):
         list.insert(self, index, self._new_slot(value))
-        self._renumber()
+        self._renumber(max(0, index + len(self) - 1) if index < 0 else index)
 
     def remove(self, value):
-        list.remove(self, self._as_element(value))
-        self._renumber()
+        index = list.index(self, self._as_element(value))
+        list.__getitem__(self, index).name = str(index)
+        list.__delitem__(self, index)
+        self._renumber(index)
 
     def sort(self, cmp=None, key=None, reverse=False):
         assert cmp is None  # no cmp for list.sort in py3
@@ -514,48 +567,75 @@ class List(Sequence):
         list.reverse(self)
         self._renumber()
 
-    def _renumber(self):
-        for idx, slot in enumerate(self._slots):
-            slot.name = str(idx)
+    def _renumber(self, start=0):
+        """Note that slots from index *start* on may have moved.
+
+        Slots are renamed when a name at or past *start* is next read, so
+        that runs of mutations cost one pass over the moved slots rather
+        than one per mutation.
+
+        """
+        self._note_change()
+        if start < len(self):
+            stale = self._renumber_from
+            self._renumber_from = start if stale is None else min(stale, start)
+
+    def _refresh_names(self):
+        """Rename slots from the first that may have moved. Internal."""
+        start = self._renumber_from
+        if start is None:
+            return
+        del self._renumber_from
+        for index in range(start, list.__len__(self)):
+            slot = list.__getitem__(self, index)
+            slot._name = str(index)
+            slot._position = index
 
     @property
     def children(self):
         return iter(child.element for child in self._slots)
 
     def _set_flat(self, pairs, sep):
+        self._set_flat_trie(FlatTrie.from_pairs(pairs, sep), sep)
+
+    def _set_flat_node(self, node, sep):
+        if type(self)._set_flat is not List._set_flat:
+            # honor _set_flat overrides in subclasses
+            Element._set_flat_node(self, node, sep)
+        else:
+            self._set_flat_trie(node, sep)
+
+    def _set_flat_iterable(self, pairs, sep):
+        if type(self)._set_flat is not List._set_flat:
+            Element._set_flat_iterable(self, pairs, sep)
+        else:
+            self._set_flat_trie(FlatTrie.from_pairs(pairs, sep), sep)
+
+    def _set_flat_trie(self, node, sep):
         del self[:]
 
-        if not pairs:
+        plan = self._flat_plan(sep)
+        node = node.find(plan.segments)
+        if node is None:
             return
 
-        if self.name:
-            regex = re.compile(
-                "^{}(\\d+)(?:{}|$)".format(
-                    re_uescape(self.name + sep), re_uescape(sep)
-                ),
-                re.UNICODE,
-            )
-        else:
-            regex = re.compile("^(\\d+)(?:%s|$)" % (re_uescape(sep)), re.UNICODE)
+        prune = plan.prune
+        if prune:
+            node = node.pruned()
+            if node is None:
+                return
 
         indexes = defaultdict(list)
-        prune = self.prune_empty
-
-        for key, value in pairs:
-            if value == "" and prune:
-                continue
-            m = regex.match(key)
-            if not m:
+        for segment, child in node.children.items():
+            if not segment.isdecimal():
                 continue
             try:
-                index = int(m.group(1))
-            except TypeError:
+                index = int(segment)
+            except ValueError:
                 # Ignore keys with outrageously large indexes- they
                 # aren't valid data for us.
-                pass
-            else:
-                child_key = key[len(m.group(0)) :] or None
-                indexes[index].append((child_key, value))
+                continue
+            indexes[index].append(child)
 
         if not indexes:
             return
@@ -564,21 +644,33 @@ class List(Sequence):
         #        the python indexes may not match the flat indexes
         if prune:
             for offset, index in enumerate(sorted(indexes)):
-                if offset == self.maximum_set_flat_members:
+                if offset == plan.maximum:
                     break
                 slot = self._new_slot()
                 list.append(self, slot)
-                slot.element.set_flat(indexes[index], sep)
+                slot.element.raw = Unset
+                slot.element._set_flat_node(FlatTrie.merged(indexes[index], sep), sep)
         # lossless: elements are built up to the highest seen index or a
         #           schema-configured maximum. flat + python indexes match.
         else:
-            max_index = min(max(indexes) + 1, self.maximum_set_flat_members)
+            max_index = min(max(indexes) + 1, plan.maximum)
             for index in range(0, max_index):
                 slot = self._new_slot()
                 list.append(self, slot)
                 flat = indexes.get(index, None)
                 if flat:
-                    slot.element.set_flat(flat, sep)
+                    slot.element.raw = Unset
+                    slot.element._set_flat_node(FlatTrie.merged(flat, sep), sep)
+
+    _flat_plan_attributes = ("name", "prune_empty", "maximum_set_flat_members")
+
+    def _compile_flat_plan(self, sep):
+        return FlatPlan(
+            sep,
+            self.name,
+            prune=self.prune_empty,
+            maximum=self.maximum_set_flat_members,
+        )
 
     def set_default(self):
         """set() the element to the schema default.
@@ -625,6 +717,7 @@ class Array(Sequence):
     flattenable = False
 
     def _set_flat(self, pairs, sep):
+        self._note_change()
         del self[:]
         prune = self.prune_empty
         child_name = self.member_schema.name
@@ -647,10 +740,7 @@ class Array(Sequence):
                 member = self.member_schema.from_flat([(key, value)])
                 self.append(member)
         else:
-            regex = re.compile(
-                f"^({re_uescape(self.name)}(?:{re_uescape(sep)}|$))",
-                re.UNICODE,
-            )
+            regex = self._flat_plan(sep).regex
             for key, value in pairs:
                 m = regex.match(key)
                 if not m:
@@ -665,6 +755,16 @@ class Array(Sequence):
                 member = self.member_schema.from_flat([(remainder, value)])
                 self.append(member)
 
+    def _compile_flat_plan(self, sep):
+        if self.name is None:
+            regex = None
+        else:
+            regex = re.compile(
+                f"^({re_uescape(self.name)}(?:{re_uescape(sep)}|$))",
+                re.UNICODE,
+            )
+        return FlatPlan(sep, self.name, regex=regex)
+
 
 class MultiValue(Array, Scalar):
     """A transparent homogeneous Container, for multivalued form elements.
@@ -725,6 +825,24 @@ class Mapping(Container, dict):
     field_schema = ()
     """.. TODO:: doc field_schema"""
 
+    lazy_children = False
+    """If True, child elements are created on first use.
+
+    By default every field in :attr:`field_schema` is instantiated, all the
+    way down, when the mapping is constructed or :meth:`set`.  In lazy mode
+    a child is only created when it is first reached: by key, through
+    :meth:`find`, or by :meth:`set` and :meth:`set_flat` input naming it.
+    Operations over the whole mapping, such as iteration, :attr:`children`,
+    :attr:`value`, :meth:`flatten` and :meth:`validate`, first create any
+    children not yet present, and see exactly the tree an eager mapping
+    would hold.
+
+    Useful for schemas with large, rarely submitted sections.  Has no
+    effect on :class:`SparseDict`, which never creates absent fields.
+    """
+
+    _pending = False
+
     def __init__(self, value=Unspecified, **kw):
         Container.__init__(self, **kw)
         if not self.field_schema:
@@ -758,10 +876,109 @@ class Mapping(Container, dict):
 
     def _reset(self):
         """Place blank children in all fields."""
+        self._note_change()
+        if self.lazy_children:
+            dict.clear(self)
+            self._pending = True
+            return
         for member_schema in self.field_schema:
             key = member_schema.name
             dict.__setitem__(self, key, member_schema(parent=self))
 
+    def reset(self):
+        Element.reset(self)
+        for child in dict.values(self):
+            child.reset()
+
+    def _clone(self, parent, memo):
+        clone = Element._clone(self, parent, memo)
+        for key, child in dict.items(self):
+            dict.__setitem__(clone, key, child._clone(clone, memo))
+        return clone
+
+    @classmethod
+    def _plan_members(cls, entries, index):
+        if (
+            cls.children is not Mapping.children
+            or cls._reset is not Mapping._reset
+            or cls._validate_children is not Element._validate_children
+        ):
+            return super()._plan_members(entries, index)
+        for member_schema in cls.field_schema:
+            member_schema._plan_validation(entries, index, member_schema.name)
+        return _MAPPING
+
+    def _materialize(self):
+        """Create children not yet created in lazy mode, in schema order."""
+        created = dict(dict.items(self))
+        dict.clear(self)
+        for member_schema in self.field_schema:
+            key = member_schema.name
+            child = created.get(key)
+            if child is None:
+                child = member_schema(parent=self)
+            dict.__setitem__(self, key, child)
+        self._pending = False
+
+    def __missing__(self, key):
+        if self._pending:
+            schema = self._field_schema_for(key)
+            if schema is not None:
+                child = schema(parent=self)
+                dict.__setitem__(self, key, child)
+                return child
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if self._pending:
+            return self._field_schema_for(key) is not None
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        if self._pending:
+            self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        if self._pending:
+            return len(self.field_schema)
+        return dict.__len__(self)
+
+    def keys(self):
+        if self._pending:
+            self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        if self._pending:
+            self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        if self._pending:
+            self._materialize()
+        return dict.items(self)
+
+    def __repr__(self):
+        if self._pending:
+            self._materialize()
+        return dict.__repr__(self)
+
+    def __reversed__(self):
+        if self._pending:
+            self._materialize()
+        return dict.__reversed__(self)
+
+    def __or__(self, other):
+        if self._pending:
+            self._materialize()
+        return dict.__or__(self, other)
+
+    def copy(self):
+        if self._pending:
+            self._materialize()
+        return dict.copy(self)
+
     def popitem(self):
         raise TypeError("%s keys are immutable." % type(self).__name__)
 
@@ -829,35 +1046,65 @@ class Mapping(Container, dict):
         return converted
 
     def _set_flat(self, pairs, sep):
-        if self.name is None:
-            possibles = pairs  # accept all
+        self._set_flat_trie(FlatTrie.from_pairs(pairs, sep), sep)
+
+    def _set_flat_node(self, node, sep):
+        if type(self)._set_flat is not Mapping._set_flat:
+            # honor _set_flat overrides in subclasses
+            Element._set_flat_node(self, node, sep)
         else:
-            possibles = []
-            prefix = self.name + sep
-            plen = len(prefix)
-            for key, value in pairs:
-                if key == prefix:
-                    # No flat representation of mappings, ignore.
-                    pass
-                if key.startswith(prefix):
-                    # accept child element
-                    possibles.append((key[plen:], value))
-
-        if not possibles:
+            self._set_flat_trie(node, sep)
+
+    def _set_flat_iterable(self, pairs, sep):
+        if type(self)._set_flat is not Mapping._set_flat:
+            Element._set_flat_iterable(self, pairs, sep)
+        else:
+            self._set_flat_trie(FlatTrie.from_pairs(pairs, sep), sep)
+
+    def _set_flat_trie(self, node, sep):
+        plan = self._flat_plan(sep)
+
+        # keys equal to the mapping's own name end at this node and are
+        # ignored: there is no flat representation of mappings.
+        node = node.find(plan.segments)
+        if node is None or not node.children:
             return
 
-        for schema in self.field_schema:
-            field = schema.name
-            accum = []
-            for key, value in possibles:
-                if key.startswith(field):
-                    accum.append((key, value))
-            if accum:
-                if dict.__contains__(self, field):
-                    self[field].set_flat(accum, sep)
-                else:
-                    self[field] = schema()
-                    self[field].set_flat(accum, sep=sep)
+        fields = plan.fields
+        if len(node.children) < len(fields):
+            # sparse input: visit only fields whose leading segment is
+            # present, in schema order.
+            dispatch = plan.dispatch
+            candidates = sorted(
+                itertools.chain(
+                    dispatch.get(None, ()),
+                    *(dispatch.get(segment, ()) for segment in node.children),
+                )
+            )
+        else:
+            candidates = range(len(fields))
+
+        for index in candidates:
+            field, segments, schema = fields[index]
+            if node.find(segments) is None:
+                continue
+            if dict.__contains__(self, field) or self._pending:
+                child = self[field]
+            else:
+                self[field] = schema()
+                child = self[field]
+            child.raw = Unset
+            child._set_flat_node(node, sep)
+
+    _flat_plan_attributes = ("name", "field_schema")
+
+    def _compile_flat_plan(self, sep):
+        fields, dispatch = [], defaultdict(list)
+        for index, schema in enumerate(self.field_schema):
+            segments = split_name(schema.name, sep)
+            fields.append((schema.name, segments, schema))
+            dispatch[segments[0] if segments else None].append(index)
+        return FlatPlan(sep, self.name, fields=fields, dispatch=dict(dispatch))
 
     def set_default(self):
         default = self.default_value
@@ -899,11 +1146,18 @@ class Mapping(Container, dict):
         return {schema.name: schema for schema in field_schema}
 
     def _field_schema_for(self, key):
-        """Return the schema for field ``*key* or None."""
-        for schema in self.field_schema:
-            if schema.name == key:
-                return schema
-        return None
+        """Return the schema for field *key*, or None."""
+        # the field_schema_mapping of the class, or of an instance given its
+        # own field_schema, is memoized alongside the field_schema it maps
+        if "field_schema" in self.__dict__:
+            holder, owner = self.__dict__, self
+        else:
+            holder, owner = type(self).__dict__, type(self)
+        memo = holder.get("_field_schema_memo")
+        if memo is None or memo[0] is not owner.field_schema:
+            memo = (owner.field_schema, owner.field_schema_mapping)
+            setattr(owner, "_field_schema_memo", memo)
+        return memo[1].get(key)
 
 
 class Dict(Mapping, dict):
@@ -1022,7 +1276,7 @@ class Dict(Mapping, dict):
         for key, value in pairs:
             if key not in fields:
                 continue
-            if dict.__contains__(self, key):
+            if dict.__contains__(self, key) or self._pending:
                 converted &= self[key].set(value)
             else:
                 self[key] = el = fields[key]()
@@ -1087,7 +1341,7 @@ class Dict(Mapping, dict):
           >>> new_user = User(**user_keywords)
 
         """
-        fields = set(self.keys())
+        fields = {schema.name for schema in self.field_schema}
         attributes = fields.copy()
         if rename:
             rename = list(to_pairs(rename))
@@ -1152,7 +1406,12 @@ class SparseDict(Dict):
     def may_contain(self, key):
         return key in self or self._field_schema_for(key) is not None
 
+    def reset(self):
+        Element.reset(self)
+        self._reset()
+
     def _reset(self):
+        self._note_change()
         dict.clear(self)
         for member_schema in self.field_schema:
             key = member_schema.name
@@ -1171,11 +1430,14 @@ class SparseDict(Dict):
             elif isinstance(value, schema):
                 value.parent = self
                 dict.__setitem__(self, key, value)
+                self._note_change()
                 return
             dict.__setitem__(self, key, schema(value, parent=self))
+            self._note_change()
         elif isinstance(value, schema):
             value.parent = self
             dict.__setitem__(self, key, value)
+            self._note_change()
         else:
             self[key].set(value)
 
@@ -1183,6 +1445,7 @@ class SparseDict(Dict):
         if self.minimum_fields is None:
             try:
                 dict.__delitem__(self, key)
+                self._note_change()
                 return
             except KeyError:
                 if not self.may_contain(key):
@@ -1207,6 +1470,7 @@ class SparseDict(Dict):
                 % (key, type(self).__name__, self.name)
             )
         dict.__delitem__(self, key)
+        self._note_change()
 
     def clear(self):
         self._reset()
@@ -1222,6 +1486,7 @@ class SparseDict(Dict):
                 "May not pop required key %r on %s %r"
                 % (key, type(self).__name__, self.name)
             )
+        self._note_change()
         return dict.pop(self, key)
 
     def setdefault(self, key, default=None):
@@ -1265,6 +1530,12 @@ class SparseDict(Dict):
             )
 
 
+def _slice_start(index, length):
+    """Return the lowest list index affected by slice *index*."""
+    start, stop, step = index.indices(length)
+    return min(start, stop) if step > 0 else max(0, stop + 1)
+
+
 def _textset(iterable):
     values = set()
     for value in iterable:
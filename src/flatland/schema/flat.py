@@ -0,0 +1,352 @@
+"""Flat ``(key, value)`` pair ingestion."""
+
+from flatland.exc import InputLimitError
+
+__all__ = [
+    "FlatBudget",
+    "FlatPlan",
+    "FlatTemplate",
+    "FlatTrie",
+    "split_name",
+]
+
+
+class FlatTrie:
+    """A prefix tree of flattened ``(key, value)`` pairs.
+
+    Each key is split on *sep* exactly once, and each segment becomes an
+    edge in the tree.  A node holds the pairs whose keys end at it, and
+    its :attr:`children` hold every longer key sharing the same prefix.
+
+    Containers use the tree to hand each child element only the pairs
+    under that child's name, rather than rescanning the full pair list at
+    every level of the element hierarchy.
+
+    """
+
+    __slots__ = ("children", "pairs", "offset", "empty")
+
+    def __init__(self, offset=0):
+        self.children = {}
+        """A mapping of key segment to child :class:`FlatTrie` node."""
+
+        self.pairs = []
+        """``(ordinal, key, value)`` triples for keys ending at this node."""
+
+        self.offset = offset
+        """The position in a key where the segments of children begin."""
+
+        self.empty = 0
+        """The number of empty-string values in this subtree."""
+
+    @classmethod
+    def from_pairs(cls, pairs, sep):
+        """Return a new tree populated from ``(key, value)`` *pairs*.
+
+        Pairs with non-string keys can never match an element name and
+        are ignored.
+
+        """
+        root = cls()
+        for ordinal, (key, value) in enumerate(pairs):
+            if isinstance(key, str):
+                root.insert(ordinal, key, value, sep)
+        return root
+
+    def insert(self, ordinal, key, value, sep):
+        """Add a pair, splitting *key* on *sep* below this node.
+
+        Returns the node the key ends at.
+
+        """
+        empty = value == ""
+        node = self
+        for segment in key[self.offset :].split(sep):
+            if empty:
+                node.empty += 1
+            child = node.children.get(segment)
+            if child is None:
+                child = type(self)(node.offset + len(segment) + len(sep))
+                node.children[segment] = child
+            node = child
+        if empty:
+            node.empty += 1
+        node.pairs.append((ordinal, key, value))
+        return node
+
+    def lookup(self, name, sep):
+        """Return the node for element *name*, or None if absent.
+
+        A *name* of None is a transparent element, and is served by this
+        node directly.
+
+        """
+        return self.find(split_name(name, sep))
+
+    def find(self, segments):
+        """Return the node at the path *segments*, or None if absent.
+
+        *segments* is a sequence of key segments as produced by
+        :func:`split_name`.  None addresses this node.
+
+        """
+        node = self
+        if segments is not None:
+            for segment in segments:
+                node = node.children.get(segment)
+                if node is None:
+                    return None
+        return node
+
+    def walk(self):
+        """Yield every ``(ordinal, key, value)`` in this subtree."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield from node.pairs
+            stack.extend(node.children.values())
+
+    def flat_pairs(self, segments):
+        """Return ``(key, value)`` pairs under *segments*, in input order.
+
+        Keys are relative to this node, the level of the element's parent,
+        and so begin with the element's name.  A key that is fully consumed
+        by the path to this node is returned as None.  This is the pair list
+        the element's ``_set_flat`` would have been given by its parent.
+
+        """
+        node = self.find(segments)
+        if node is None:
+            return []
+        offset = self.offset
+        return [
+            (key[offset:] or None, value)
+            for _, key, value in sorted(node.walk(), key=_ordinal)
+        ]
+
+    def pruned(self):
+        """Return a copy of the subtree without empty-string values.
+
+        Returns None if nothing remains.
+
+        """
+        if not self.empty:
+            return self
+        copy = type(self)(self.offset)
+        copy.pairs = [pair for pair in self.pairs if pair[2] != ""]
+        for segment, child in self.children.items():
+            child = child.pruned()
+            if child is not None:
+                copy.children[segment] = child
+        if not copy.pairs and not copy.children:
+            return None
+        return copy
+
+    @classmethod
+    def merged(cls, nodes, sep):
+        """Return a single node holding the contents of *nodes*.
+
+        Used when distinct key segments address the same logical child,
+        such as the ``1`` and ``01`` indexes of a list.  Keys in the new
+        node are re-anchored to begin at the merged node.
+
+        """
+        if len(nodes) == 1:
+            return nodes[0]
+        root = cls()
+        triples = []
+        for node in nodes:
+            offset = node.offset
+            triples.extend(
+                (ordinal, key[offset:], value) for ordinal, key, value in node.walk()
+            )
+        for ordinal, key, value in sorted(triples, key=_ordinal):
+            if key:
+                root.insert(ordinal, key, value, sep)
+            else:
+                root.empty += value == ""
+                root.pairs.append((ordinal, key, value))
+        return root
+
+
+class FlatTemplate:
+    """A reusable :class:`FlatTrie` for rows of pairs sharing the same keys.
+
+    Bulk imports, such as the rows of a CSV file, present the same keys in
+    the same order for every record.  A template splits those keys once;
+    :meth:`fill` then rebinds the values of the tree for each row in a
+    single pass, without rebuilding it.
+
+    The tree returned by :meth:`fill` is reused by the next call, and is
+    only valid until then.
+
+    :param keys: the keys of the rows, in order.
+
+    :param sep: the separator the tree will be used with.
+
+    """
+
+    __slots__ = ("keys", "trie", "_slots", "_paths", "_nodes", "_dirty")
+
+    def __init__(self, keys, sep):
+        self.keys = tuple(keys)
+        self.trie = FlatTrie()
+        self._slots = []
+        self._paths = []
+        for ordinal, key in enumerate(self.keys):
+            if not isinstance(key, str):
+                self._slots.append(None)
+                self._paths.append(())
+                continue
+            node = self.trie.insert(ordinal, key, None, sep)
+            self._slots.append((node.pairs, len(node.pairs) - 1, key))
+            path, node = [self.trie], self.trie
+            for segment in key.split(sep):
+                node = node.children[segment]
+                path.append(node)
+            self._paths.append(path)
+        self._nodes = list(_iter_nodes(self.trie))
+        self._dirty = False
+
+    def fill(self, values):
+        """Return the tree with *values* bound to the template keys.
+
+        *values* is a sequence of values in the order of :attr:`keys`.
+
+        """
+        if self._dirty:
+            for node in self._nodes:
+                node.empty = 0
+            self._dirty = False
+        for ordinal, (slot, value) in enumerate(zip(self._slots, values)):
+            if slot is None:
+                continue
+            pairs, index, key = slot
+            pairs[index] = (ordinal, key, value)
+            if value == "":
+                self._dirty = True
+                for node in self._paths[ordinal]:
+                    node.empty += 1
+        return self.trie
+
+
+class FlatBudget:
+    """Limits on the flat input accepted by
+    :meth:`~flatland.schema.base.Element.set_flat`.
+
+    Checked in a single pass over the pairs, so oversized input is
+    rejected in time proportional to its size.  Sequences and tries are
+    checked before they are dispatched to any element; iterators are
+    checked as they are consumed.  Input over budget raises
+    :exc:`~flatland.exc.InputLimitError`.
+
+    :param pairs: optional, the largest number of pairs accepted.
+
+    :param key_length: optional, the length of the longest key accepted.
+
+    :param depth: optional, the largest number of separator-delimited
+      segments in any key, bounding how deeply a key may nest.
+
+    :param value_size: optional, the largest total length of all string
+      values.
+
+    Limits of None are not enforced.
+
+    """
+
+    def __init__(self, pairs=None, key_length=None, depth=None, value_size=None):
+        self.pairs = pairs
+        self.key_length = key_length
+        self.depth = depth
+        self.value_size = value_size
+
+    def apply(self, pairs, sep):
+        """Check *pairs* against the budget, returning pairs to ingest.
+
+        Sequences, mappings' ``items()`` and :class:`FlatTrie` trees are
+        checked in full and returned unchanged.  Other iterables are
+        returned wrapped in an iterator that checks each pair as it is
+        consumed, so streams are never buffered to be measured.
+
+        """
+        if isinstance(pairs, FlatTrie):
+            for _ in self._checked(
+                ((key, value) for _, key, value in pairs.walk()), sep
+            ):
+                pass
+            return pairs
+        if not hasattr(pairs, "__len__"):
+            return self._checked(pairs, sep)
+        if self.pairs is not None and len(pairs) > self.pairs:
+            raise InputLimitError("input exceeds %d pairs" % self.pairs)
+        for _ in self._checked(pairs, sep):
+            pass
+        return pairs
+
+    def _checked(self, pairs, sep):
+        max_pairs, max_key, max_depth = self.pairs, self.key_length, self.depth
+        max_size, size = self.value_size, 0
+        for count, pair in enumerate(pairs, 1):
+            if max_pairs is not None and count > max_pairs:
+                raise InputLimitError("input exceeds %d pairs" % max_pairs)
+            key, value = pair
+            if isinstance(key, str):
+                if max_key is not None and len(key) > max_key:
+                    raise InputLimitError(
+                        "input key exceeds %d characters: %r..." % (max_key, key[:32])
+                    )
+                if max_depth is not None and key.count(sep) >= max_depth:
+                    raise InputLimitError(
+                        "input key exceeds %d segments: %r..." % (max_depth, key[:32])
+                    )
+            if max_size is not None and isinstance(value, (str, bytes)):
+                size += len(value)
+                if size > max_size:
+                    raise InputLimitError(
+                        "input values exceed %d characters in total" % max_size
+                    )
+            yield pair
+
+
+class FlatPlan:
+    r"""Compiled :meth:`~flatland.schema.base.Element.set_flat` state.
+
+    Plans are derived once per element class and separator and memoized on
+    the class, holding the pieces of flat ingestion that do not vary from
+    instance to instance: the element's name split into key segments, and
+    any regular expressions, child dispatch tables or pruning rules the
+    element type uses.
+
+    :param sep: the separator the plan was compiled for.
+
+    :param name: the element name, or None.
+
+    :param \*\*compiled: type-specific members, set as attributes.
+
+    """
+
+    def __init__(self, sep, name, **compiled):
+        self.sep = sep
+        self.segments = split_name(name, sep)
+        self.sources = None
+        self.source_getter = None
+        self.__dict__.update(compiled)
+
+
+def split_name(name, sep):
+    """Split an element *name* into a tuple of key segments, or None."""
+    if name is None:
+        return None
+    return tuple(name.split(sep))
+
+
+def _iter_nodes(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children.values())
+
+
+def _ordinal(triple):
+    return triple[0]
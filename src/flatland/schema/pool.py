@@ -0,0 +1,85 @@
+"""Reuse of element trees across requests."""
+
+import contextlib
+
+from flatland.util import threading
+
+__all__ = ["ElementPool"]
+
+
+class ElementPool:
+    """A thread-safe pool of reusable element trees, keyed by schema class.
+
+    Constructing a large schema allocates every element in the tree.  A
+    pool keeps trees released after use, :meth:`reset
+    <flatland.schema.base.Element.reset>` to their freshly constructed
+    state, and hands them out again in place of new ones:
+
+    .. testcode::
+
+      from flatland import Dict, String
+      from flatland.schema.pool import ElementPool
+
+      pool = ElementPool()
+      Search = Dict.named('search').of(String.named('keywords'))
+
+      with pool.element(Search) as form:
+          form.set_flat([('search_keywords', 'foo bar')])
+          keywords = form['keywords'].value
+
+    .. doctest::
+
+      >>> keywords
+      'foo bar'
+      >>> with pool.element(Search) as form:
+      ...     print(form['keywords'].value)
+      None
+
+    A pooled tree must not be used after it is released, so references to
+    it or its children should not outlive the request.
+
+    :param size: the largest number of idle trees kept for each schema.
+
+    """
+
+    def __init__(self, size=16):
+        self.size = size
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, schema):
+        """Return an unset element of *schema*, reused if one is idle."""
+        with self._lock:
+            idle = self._idle.get(schema)
+            if idle:
+                return idle.pop()
+        return schema()
+
+    def release(self, element):
+        """Reset *element* and keep it for reuse by :meth:`acquire`.
+
+        Only the root of a tree may be released.  If the pool already holds
+        :attr:`size` idle trees of the element's schema, it is discarded.
+
+        """
+        if element.parent is not None:
+            raise ValueError("only root elements may be pooled")
+        element.reset()
+        with self._lock:
+            idle = self._idle.setdefault(type(element), [])
+            if len(idle) < self.size:
+                idle.append(element)
+
+    @contextlib.contextmanager
+    def element(self, schema):
+        """A context manager acquiring and releasing an element of *schema*."""
+        element = self.acquire(schema)
+        try:
+            yield element
+        finally:
+            self.release(element)
+
+    def clear(self):
+        """Discard all idle trees."""
+        with self._lock:
+            self._idle.clear()
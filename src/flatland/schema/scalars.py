@@ -19,6 +19,7 @@ __all__ = (
     "Date",
     "DateTime",
     "Enum",
+    "File",
     "Float",
     "Integer",
     "Long",
@@ -67,6 +68,7 @@ class Scalar(Element):
         contain ``str(obj)``, or ``''`` for none.
 
         """
+        self._note_change()
         self.raw = obj
         try:
             # adapt and normalize the value, if possible
@@ -85,7 +87,8 @@ class Scalar(Element):
                     self.u = ""
                 except UnicodeDecodeError:
                     self.u = str(obj, errors="replace")
-            element_set.send(self, adapted=False)
+            if element_set.receivers:
+                element_set.send(self, adapted=False)
             return False
 
         # stringify it, possibly storing what we received verbatim or a
@@ -94,7 +97,8 @@ class Scalar(Element):
             self.u = ""
         else:
             self.u = self.serialize(obj)
-        element_set.send(self, adapted=True)
+        if element_set.receivers:
+            element_set.send(self, adapted=True)
         return True
 
     def adapt(self, obj):
@@ -130,6 +134,26 @@ class Scalar(Element):
                 self.set(value)
                 break
 
+    def _set_flat_node(self, node, sep):
+        if type(self)._set_flat is not Scalar._set_flat:
+            # honor _set_flat overrides in subclasses
+            return Element._set_flat_node(self, node, sep)
+
+        segments = self._flat_plan(sep).segments
+        if segments is not None:
+            node = node.find(segments)
+            if node is not None and node.pairs:
+                self.set(node.pairs[0][2])
+            return
+
+        # unnamed: the first key ending at this node, or with a trailing sep
+        candidates = list(node.pairs)
+        trailing = node.children.get("")
+        if trailing is not None:
+            candidates.extend(trailing.pairs)
+        if candidates:
+            self.set(min(candidates)[2])
+
     def set_default(self):
         default = self.default_value
         if default is not Unspecified:
@@ -540,6 +564,38 @@ class Time(Temporal):
     used = ("hour", "minute", "second")
 
 
+class File(Scalar):
+    """An uploaded file.
+
+    Holds a file-like object as its native value, such as the
+    :class:`~flatland.ingest.UploadedFile` values produced by
+    :func:`~flatland.ingest.iter_multipart`.  The text value is the
+    client-supplied file name.
+
+    Any object with a ``read`` method is accepted.  An empty string, as
+    submitted for a file input left blank, adapts to None.
+
+    """
+
+    def adapt(self, value):
+        """Coerces value to a file-like object.
+
+        Returns None for None or an empty string.  Objects with a ``read``
+        method are returned unchanged.  Anything else fails adaptation.
+
+        """
+        if value is None or value == "":
+            return None
+        elif hasattr(value, "read"):
+            return value
+        else:
+            raise AdaptationError()
+
+    def serialize(self, value):
+        """Serializes value to its file name, or ``''`` if it has none."""
+        return getattr(value, "filename", None) or ""
+
+
 class Ref(Scalar):
     flattenable = False
 
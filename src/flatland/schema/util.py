@@ -1,7 +1,11 @@
+import contextvars
 import itertools
 
 import builtins
 
+# find_i18n_function results by finder and tree root, while validating
+_resolutions = contextvars.ContextVar("flatland.i18n_resolutions", default=None)
+
 
 def element_ancestry(element):
     """Iterates element plus element.parents."""
@@ -43,7 +47,45 @@ def find_i18n_function(element, finder):
     ala :func:`search_ancestry`, falling back to a search against
     ``builtins``.
 
+    Within :class:`i18n_resolution_cache`, the result is kept for
+    *element* and for each ancestor searched, so later lookups for it
+    return at once and lookups for its relatives stop at the nearest
+    ancestor already resolved.
+
     """
+    resolutions = _resolutions.get()
+    if resolutions is None:
+        return _find_i18n_function(element, finder)
+    resolved = resolutions.get(finder)
+    if resolved is None:
+        resolved = resolutions[finder] = {}
+    return _resolve_i18n_function(resolved, element, finder)
+
+
+def _resolve_i18n_function(resolved, element, finder):
+    # entries hold their element, so ids are not reused, and the parent it
+    # had, which must still be its parent
+    parent = element.parent
+    entry = resolved.get(id(element))
+    if entry is not None and entry[1] is parent:
+        return entry[2]
+    try:
+        transformer = finder(element)
+    except AttributeError:
+        transformer = None
+    if not transformer:
+        if parent is not None:
+            transformer = _resolve_i18n_function(resolved, parent, finder)
+        else:
+            try:
+                transformer = finder(builtins)
+            except AttributeError:
+                transformer = None
+    resolved[id(element)] = (element, parent, transformer)
+    return transformer
+
+
+def _find_i18n_function(element, finder):
     transformer = search_ancestry(element, finder)
     if transformer:
         return transformer
@@ -51,3 +93,43 @@ def find_i18n_function(element, finder):
         return finder(builtins)
     except AttributeError:
         return None
+
+
+class i18n_resolution_cache:
+    """A context manager caching :func:`find_i18n_function` results.
+
+    Entered by :meth:`~flatland.schema.base.Element.validate`, so that the
+    messages expanded while validating a tree search each element's
+    ancestry once.  Results are kept until the outermost cache exits, or
+    until :meth:`forget` is called: containers call it whenever their
+    members change, so that elements reparented meanwhile find the
+    functions of their new tree.
+
+    """
+
+    __slots__ = ("_token",)
+
+    #: The ids of the caches entered, in any thread or task.
+    active = set()
+
+    def __enter__(self):
+        if _resolutions.get() is None:
+            resolutions = {}
+            self._token = _resolutions.set(resolutions)
+            self.active.add(id(resolutions))
+        else:
+            self._token = None
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._token is not None:
+            self.active.discard(id(_resolutions.get()))
+            _resolutions.reset(self._token)
+            self._token = None
+
+    @staticmethod
+    def forget():
+        """Discard the results of the cache entered, if any."""
+        resolutions = _resolutions.get()
+        if resolutions:
+            resolutions.clear()
@@ -1,6 +1,9 @@
+import collections
+import functools
 import re
 import string
 import sys
+import weakref
 
 try:
     import threading
@@ -122,6 +125,13 @@ class class_cloner:
 
     """
 
+    interner = None
+    """Optional, a :class:`ClassInterner` shared by all class_cloners.
+
+    When set, identical derivations return the same class rather than a
+    new copy.  Off by default.
+    """
+
     def __init__(self, fn):
         self.name = fn.__name__
         self.cloner = classmethod(fn)
@@ -133,13 +143,24 @@ class class_cloner:
                 return instance.__dict__[self.name]
             except KeyError:
                 raise AttributeError(self.name)
+        interner = class_cloner.interner
+        if interner is not None:
+            return functools.partial(interner, self, cls)
+        return self.cloner.__get__(None, self._copy(cls, 2))
+
+    def _copy(self, cls, depth=1):
+        """Return a new direct subclass of *cls*.
+
+        The subclass takes its ``__module__`` from the caller *depth* frames
+        up the stack.
+
+        """
         members = {"__doc__": getattr(cls, "__doc__", "")}
         try:
-            members["__module__"] = sys._getframe(1).f_globals["__name__"]
-        except (AttributeError, KeyError, TypeError):  # pragma: nocover
+            members["__module__"] = sys._getframe(depth).f_globals["__name__"]
+        except (AttributeError, KeyError, TypeError, ValueError):  # pragma: nocover
             members["__module__"] = cls.__module__
-        clone = type(cls.__name__, (cls,), members)
-        return self.cloner.__get__(None, clone)
+        return type(cls.__name__, (cls,), members)
 
     def __set__(self, instance, value):
         instance.__dict__[self.name] = value
@@ -155,6 +176,120 @@ class class_cloner:
             )
 
 
+class ClassInterner:
+    """A cache of classes derived by :class:`class_cloner` methods.
+
+    Schemas built on the fly, such as ``String.using(optional=True)`` in a
+    view function, derive a new class on every call.  Installed as
+    :attr:`class_cloner.interner`, an interner returns the class already
+    derived from the same base class by the same method and arguments:
+
+    .. doctest::
+
+      >>> from flatland import String
+      >>> from flatland.util import ClassInterner, class_cloner
+      >>> class_cloner.interner = ClassInterner()
+      >>> String.using(optional=True) is String.using(optional=True)
+      True
+      >>> class_cloner.interner = None
+
+    Arguments are compared by type and value, with lists compared as
+    tuples.  Calls with other unhashable arguments derive a new class as
+    usual.  An interned class is shared by all of its callers, so the
+    arguments it was derived from should not be modified afterwards.  A
+    class whose own attributes have changed since it was derived, as by
+    assigning ``schema.default``, is no longer returned; a new class is
+    derived in its place.  Classes with a false ``_intern_derived``, such
+    as :class:`~flatland.schema.compound.Compound` schemas, which prepare
+    themselves on first use, are never interned.
+
+    Classes are held weakly, and remain available for as long as they are
+    in use elsewhere.  The *size* most recently used are also held
+    strongly, so that classes derived per request survive between
+    requests.
+
+    :param size: the number of recently used classes kept alive.
+
+    """
+
+    def __init__(self, size=256):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._classes = weakref.WeakValueDictionary()
+        # the members of each class as derived, to notice later changes
+        self._members = weakref.WeakKeyDictionary()
+        self._recent = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, cloner, cls, *args, **kw):
+        key = _intern_key((cls, cloner.name, args, sorted(kw.items())))
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+        if key is None or not getattr(cls, "_intern_derived", True):
+            return cloner.cloner.__get__(None, cloner._copy(cls, 2))(*args, **kw)
+
+        with self._lock:
+            derived = self._classes.get(key)
+            if derived is not None:
+                if _unchanged(derived, self._members[derived]):
+                    self.hits += 1
+                    self._keep(key, derived)
+                    return derived
+                # changed since derived: no longer what the arguments say
+                del self._classes[key]
+                self._recent.pop(key, None)
+        derived = cloner.cloner.__get__(None, cloner._copy(cls, 2))(*args, **kw)
+        if isinstance(derived, type):
+            with self._lock:
+                self.misses += 1
+                self._classes[key] = derived
+                self._members[derived] = _public_members(derived)
+                self._keep(key, derived)
+        return derived
+
+    def __len__(self):
+        return len(self._classes)
+
+    def _keep(self, key, derived):
+        recent = self._recent
+        recent[key] = derived
+        recent.move_to_end(key)
+        while len(recent) > self.size:
+            recent.popitem(last=False)
+
+    def clear(self):
+        """Discard all interned classes."""
+        with self._lock:
+            self._classes.clear()
+            self._members.clear()
+            self._recent.clear()
+
+
+def _public_members(cls):
+    # the attributes a schema is configured by; private ones include
+    # results memoized on the class as it is used
+    return {name: value for name, value in cls.__dict__.items() if name[:1] != "_"}
+
+
+def _unchanged(cls, members):
+    current = _public_members(cls)
+    return len(current) == len(members) and all(
+        current.get(name, current) is value for name, value in members.items()
+    )
+
+
+def _intern_key(value):
+    kind = type(value)
+    if kind is tuple or kind is list:
+        return kind, tuple(_intern_key(item) for item in value)
+    if kind is frozenset:
+        return kind, frozenset(_intern_key(item) for item in value)
+    return kind, value
+
+
 class as_mapping:
     """Provide a mapping view of an instance.
 
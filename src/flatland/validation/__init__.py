@@ -1,6 +1,7 @@
 """Data validation tools."""
 
-from .base import Validator, as_format_mapping
+from .base import DeferredMessage, Validator, as_format_mapping
+from .cache import ValidatorCache
 from .scalars import (
     Converted,
     IsFalse,
@@ -24,6 +25,7 @@ from .containers import (
     HasAtLeast,
     HasAtMost,
     HasBetween,
+    HasNoDuplicates,
     NotDuplicated,
     SetWithKnownFields,
     SetWithAllFields,
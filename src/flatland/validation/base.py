@@ -1,5 +1,6 @@
 """Base functionality for fancy validation."""
 
+import contextvars
 from operator import attrgetter
 
 from flatland.schema.util import find_i18n_function
@@ -9,10 +10,36 @@ P_ = lambda *translatable: translatable
 _ugettext_finder = attrgetter("ugettext")
 _ungettext_finder = attrgetter("ungettext")
 
+# messages noted while a ValidatorCache records a validator's result
+_recording = contextvars.ContextVar("flatland.validation.recording", default=None)
+
 
 class Validator:
     """Base class for fancy validators."""
 
+    pure = False
+    """True if :meth:`validate` is a function of the element's value alone.
+
+    The result and messages of a pure validator may be recorded by its
+    :attr:`cache` and replayed for the next element with an equal value.
+    A pure validator reports failures through :meth:`note_error` and
+    :meth:`note_warning`, and does not modify the element.
+    """
+
+    cache = None
+    """A :class:`~flatland.validation.cache.ValidatorCache` for :attr:`pure`
+    validators, or None to validate every element.  Assign a cache to an
+    instance, or to a Validator class to share it with all of its pure
+    subclasses.
+    """
+
+    defer_messages = False
+    """If true, :meth:`note_error` and :meth:`note_warning` record a
+    :class:`DeferredMessage`, expanded when the element's messages are
+    next read, rather than expanding the message immediately.  Set on an instance, or on a
+    Validator class to defer the messages of all of its subclasses.
+    """
+
     def __init__(self, **kw):
         r"""Construct a validator.
 
@@ -32,6 +59,9 @@ class Validator:
 
     def __call__(self, element, state):
         """Adapts Validator to the Element.validate callable interface."""
+        cache = self.cache
+        if cache is not None and self.pure:
+            return cache.validate(self, element, state)
         return self.validate(element, state)
 
     def validate(self, element, state):
@@ -51,6 +81,23 @@ class Validator:
         """
         return False
 
+    def references(self, element):
+        """Return the elements besides *element* that validation reads.
+
+        Consulted by :meth:`Element.validate(incremental=True)
+        <flatland.schema.base.Element.validate>`: a change to any of these
+        elements, or to their children, revalidates *element*.  Validators
+        comparing an element with others return them.  The default returns
+        none.
+
+        :param element:
+          an :class:`~flatland.schema.base.Element` instance.
+
+        :returns: an iterable of elements.
+
+        """
+        return ()
+
     def note_error(self, element, state, key=None, message=None, **info):
         r"""Record a validation error message on an element.
 
@@ -107,9 +154,16 @@ class Validator:
           assert el.errors == ['Oh noes!']
 
         """
+        recording = _recording.get()
+        if recording is not None:
+            recording.append((element, "note_error", key, message, info))
         message = message or getattr(self, key)
         if message:
-            element.add_error(self.expand_message(element, state, message, **info))
+            if self.defer_messages:
+                message = DeferredMessage(self, element, state, message, info)
+            else:
+                message = self.expand_message(element, state, message, **info)
+            element.add_error(message)
         return False
 
     def note_warning(self, element, state, key=None, message=None, **info):
@@ -142,9 +196,16 @@ class Validator:
 
         Always returns False.
         """
+        recording = _recording.get()
+        if recording is not None:
+            recording.append((element, "note_warning", key, message, info))
         message = message or getattr(self, key)
         if message:
-            element.add_warning(self.expand_message(element, state, message, **info))
+            if self.defer_messages:
+                message = DeferredMessage(self, element, state, message, info)
+            else:
+                message = self.expand_message(element, state, message, **info)
+            element.add_warning(message)
         return False
 
     def find_transformer(self, type, element, state, message):
@@ -260,6 +321,68 @@ class Validator:
         return message % format_map
 
 
+class DeferredMessage:
+    """A validation message expanded when first read.
+
+    Noted by validators with :attr:`~Validator.defer_messages` set, in
+    place of the expanded message string.  The element holds it apart
+    from its :attr:`~flatland.schema.base.Element.errors` and
+    :attr:`~flatland.schema.base.Element.warnings` until that attribute is
+    next read, when each held message is expanded by
+    :meth:`Validator.expand_message` and the list holds only strings.
+    Until then the validator, element and validation state are held, and
+    expansion sees them as they are at that time.
+
+    Noting a message the element already holds unexpanded, from the same
+    validator, element, state, message and format values, is recognized
+    without expanding either.  Messages held beside strings already
+    present are compared with them when expanded, and dropped if
+    duplicates.
+
+    .. doctest::
+
+      >>> from flatland import String
+      >>> from flatland.validation import Present
+      >>> schema = String.named('name').using(
+      ...     validators=[Present(defer_messages=True)])
+      >>> element = schema()
+      >>> element.validate()
+      False
+      >>> ', '.join(element.errors)
+      'name may not be blank.'
+
+    """
+
+    __slots__ = "validator", "element", "state", "message", "info"
+
+    def __init__(self, validator, element, state, message, info):
+        self.validator = validator
+        self.element = element
+        self.state = state
+        self.message = message
+        self.info = info
+
+    def expand(self):
+        """Return the expanded message."""
+        return self.validator.expand_message(
+            self.element, self.state, self.message, **self.info
+        )
+
+    def _same(self, other):
+        """True if *other* will expand identically, without expanding."""
+        return (
+            isinstance(other, DeferredMessage)
+            and self.validator is other.validator
+            and self.element is other.element
+            and self.state is other.state
+            and self.message == other.message
+            and self.info == other.info
+        )
+
+    def __repr__(self):
+        return "<DeferredMessage %r>" % (self.message,)
+
+
 class as_format_mapping:
     """A unified, optionally transformed, mapping view over multiple instances.
 
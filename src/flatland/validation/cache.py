@@ -0,0 +1,143 @@
+"""Memoization of pure validators."""
+
+import collections
+import inspect
+
+from flatland.util import threading
+
+from .base import _recording
+
+__all__ = ["ValidatorCache"]
+
+
+class ValidatorCache:
+    """A thread-safe, least recently used cache of validator results.
+
+    Validators marked :attr:`~flatland.validation.Validator.pure`, such as
+    :class:`~flatland.validation.IsEmail` and
+    :class:`~flatland.validation.ValueIn`, depend only on the value being
+    validated.  When bulk data repeats the same values, a cache records
+    the result and messages of each validator for each value and replays
+    them for later elements, skipping the validator's work:
+
+    .. doctest::
+
+      >>> from flatland import String
+      >>> from flatland.validation import IsEmail, ValidatorCache
+      >>> cache = ValidatorCache(size=1024)
+      >>> Email = String.named('email').using(
+      ...     validators=[IsEmail(cache=cache)])
+      >>> for address in ['a@example.com', 'oops', 'a@example.com', 'oops']:
+      ...     email = Email(address)
+      ...     valid = email.validate()
+      >>> email.errors
+      ['email is not a valid email address.']
+      >>> cache.hits, cache.misses
+      (2, 2)
+
+    Messages are recorded as noted, before formatting, and expanded for
+    each element they are replayed on, so labels, values and translations
+    follow the element and validation state.  Validators adding messages
+    to an element other than the one validated, or bypassing
+    :meth:`~flatland.validation.Validator.note_error`, are not cached.
+
+    Values are cached by type and equality, and must be hashable;
+    unhashable values are always validated.  A cached validator's
+    attributes must not change while its results are held.
+
+    :param size: the largest number of results held.  The least recently
+      used result is discarded to make room for a new one.
+
+    """
+
+    def __init__(self, size=1024):
+        self.size = size
+        self.hits = 0
+        """The number of validations replayed from the cache."""
+        self.misses = 0
+        """The number of validations performed by validators."""
+        self._results = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return "<ValidatorCache %d/%d results, %d hits, %d misses>" % (
+            len(self._results),
+            self.size,
+            self.hits,
+            self.misses,
+        )
+
+    def validate(self, validator, element, state):
+        """Validate *element* with *validator*, replaying a cached result.
+
+        Called by :attr:`~flatland.validation.Validator.pure` validators
+        given this cache.
+
+        """
+        value = element.value
+        key = (validator, type(value), value)
+        try:
+            with self._lock:
+                cached = self._results.get(key)
+                if cached is not None:
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        except TypeError:
+            # unhashable value
+            with self._lock:
+                self.misses += 1
+            return validator.validate(element, state)
+
+        if cached is not None:
+            valid, notes = cached
+            for note, message_key, message, info in notes:
+                getattr(validator, note)(element, state, message_key, message, **info)
+            return valid
+
+        messages = _message_count(element)
+        recording = []
+        token = _recording.set(recording)
+        try:
+            valid = validator.validate(element, state)
+        finally:
+            _recording.reset(token)
+
+        outer = _recording.get()
+        if outer is not None:
+            outer.extend(recording)
+        if inspect.isawaitable(valid):
+            return valid
+        # messages added without note_error can not be replayed
+        if _message_count(element) - messages > len(recording):
+            return valid
+        notes = []
+        for noted, note, message_key, message, info in recording:
+            if noted is not element:
+                return valid
+            notes.append((note, message_key, message, info))
+
+        with self._lock:
+            self._results[key] = (valid, tuple(notes))
+            self._results.move_to_end(key)
+            while len(self._results) > self.size:
+                self._results.popitem(last=False)
+        return valid
+
+    def clear(self):
+        """Discard all results and reset :attr:`hits` and :attr:`misses`."""
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
+
+
+def _message_count(element):
+    messages = element.__dict__
+    count = len(messages.get("errors", ())) + len(messages.get("warnings", ()))
+    for listed, held, moved in messages.get("_deferred_messages", {}).values():
+        count += len(held) + len(listed) - moved
+    return count
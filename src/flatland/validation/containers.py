@@ -1,11 +1,12 @@
 import operator
 
 from flatland.schema.base import Slot, Unset
+from flatland.schema.compact import CompactList
 from flatland.schema.containers import (
     _evaluate_dict_strict_policy,
     _evaluate_dict_subset_policy,
 )
-from flatland.util import to_pairs
+from flatland.util import Unspecified, to_pairs
 from .base import N_, P_, Validator
 
 
@@ -14,7 +15,11 @@ class NotDuplicated(Validator):
 
     Marks the second and any subsequent occurrences of a value as
     invalid.  Only useful on immediate children of sequence fields
-    such as :class:`flatland.List`.
+    such as :class:`flatland.List`.  Each member is compared with every
+    member before it; for long sequences, give :class:`HasNoDuplicates`
+    to the sequence instead.  Members of a
+    :class:`~flatland.schema.compact.CompactList` are compared in its
+    storage with the default *comparator*, without creating elements.
 
     Example:
 
@@ -87,6 +92,12 @@ class NotDuplicated(Validator):
 
     comparator = operator.eq
 
+    def references(self, element):
+        container = element.parent
+        if isinstance(container, Slot):
+            container = container.parent
+        return () if container is None else (container,)
+
     def validate(self, element, state):
         if element.parent is None:
             raise TypeError(
@@ -98,12 +109,23 @@ class NotDuplicated(Validator):
             container = container.parent
         valid, position = True, 0
         op = self.comparator
-        for idx, sibling in enumerate(container.children):
-            if sibling is element:
-                position = idx + 1
-                break
-            if valid and op(element, sibling):
-                valid = False
+        if isinstance(container, CompactList):
+            # members may be validated through a flyweight, never among
+            # the children: find the member by its index instead
+            position = int(element.parent.name)
+            if op is operator.eq:
+                matches = container._member_equals
+                valid = not any(matches(idx, element) for idx in range(position))
+            else:
+                valid = not any(op(element, container[idx]) for idx in range(position))
+            position += 1
+        else:
+            for idx, sibling in enumerate(container.children):
+                if sibling is element:
+                    position = idx + 1
+                    break
+                if valid and op(element, sibling):
+                    valid = False
         if not valid:
             return self.note_error(
                 element,
@@ -115,6 +137,115 @@ class NotDuplicated(Validator):
         return True
 
 
+class HasNoDuplicates(Validator):
+    """A sequence validator that ensures all member values are unique.
+
+    Marks the second and any subsequent occurrences of a value among the
+    members of a sequence such as :class:`~flatland.List` as invalid, as
+    :class:`NotDuplicated` does when given to each member.  Applied to the
+    sequence itself, it checks all members in one pass, finding repeats
+    with a :class:`dict` of member keys rather than comparing each member
+    with every member before it.  Prefer it for long sequences.
+
+    Example:
+
+    .. testcode::
+
+      from flatland import List, String
+      from flatland.validation import HasNoDuplicates
+
+      schema = List.of(String.named('favorite_color')).\\
+                    using(validators=[HasNoDuplicates()])
+
+    .. testcode:: :hide:
+
+      el = schema(['red', 'blue', 'red'])
+      assert not el.validate()
+      assert [m.valid for m in el] == [True, True, False]
+
+    .. rubric:: Attributes
+
+    .. attribute:: key
+
+      A callable returning a hashable key for a member.  Members with
+      equal keys are duplicates.  By default a tuple of the member's
+      ``value`` and ``u``, which are equal for members that compare equal.
+      Members such as Dicts have unhashable values; give a key for them:
+
+      .. testcode::
+
+        from flatland import Dict, List, String
+        from flatland.validation import HasNoDuplicates
+
+        def street_and_city(element):
+            return element['street'].value, element['city'].value
+
+        schema = List.of(Dict.of(String.named('street'),
+                                 String.named('city'))).\\
+                      using(validators=[HasNoDuplicates(key=street_and_city)])
+
+    .. attribute:: comparator
+
+      A callable boolean predicate, by default ``operator.eq``, called
+      positionally with two members.  Used only for members with
+      unhashable keys, which are compared with each member before them.
+
+    .. rubric:: Messages
+
+    .. attribute:: failure
+
+      Emitted on each member that has already appeared in the sequence.
+      ``container_label`` will substitute the label of the sequence.
+      ``position`` is the position of the member in the sequence,
+      counting up from 1.
+
+    """
+
+    # TRANSLATORS: HasNoDuplicates.failure
+    failure = N_("%(label)s may not be repeated within %(container_label)s.")
+
+    key = operator.attrgetter("value", "u")
+
+    comparator = operator.eq
+
+    def __init__(self, key=Unspecified, **kw):
+        Validator.__init__(self, **kw)
+        if key is not Unspecified:
+            self.key = key
+
+    def validate(self, element, state):
+        valid = True
+        seen, members = set(), []
+        key, op = self.key, self.comparator
+        for position, member in enumerate(element.children, 1):
+            if member.optional and member.is_empty:
+                # as NotDuplicated, never run for empty optional members
+                continue
+            member_key = key(member)
+            try:
+                repeated = member_key in seen
+            except TypeError:
+                # unhashable: compare with each member before it
+                repeated = any(op(member, sibling) for sibling in members)
+            else:
+                seen.add(member_key)
+            members.append(member)
+            if repeated:
+                valid = False
+                member.valid = False
+                self.note_error(
+                    member,
+                    state,
+                    "failure",
+                    position=position,
+                    container_label=element.label,
+                )
+                # revisited by the next incremental validation, which would
+                # otherwise keep this mark after the repeat is gone
+                member._note_change()
+        return valid
+
+
 class HasAtLeast(Validator):
     """A sequence validator that ensures a minimum number of members.
 
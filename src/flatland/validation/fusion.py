@@ -0,0 +1,246 @@
+"""Fusion of built-in scalar validator chains."""
+
+from flatland.schema.base import Skip, SkipAll
+from . import scalars
+
+__all__ = ["fuse"]
+
+
+def fuse(validators):
+    """Return one function validating with *validators* in turn, or None.
+
+    Runs of the built-in validators of :mod:`flatland.validation.scalars`
+    are fused into a single function checking each validator's condition
+    directly, skipping the calls to each validator and its ``validate``.
+    Other validators are called in turn as usual.  The result is that of
+    :func:`~flatland.schema.base.validate_element` applying the
+    validators, with the same messages and stopping at the same
+    validator, but without sending
+    :obj:`~flatland.signals.validator_validated`.
+
+    Validators are fused by type and read their attributes on every
+    call, so changes to a fused validator's bounds or messages take
+    effect.  Subclasses, validators with a ``validate`` of their own and
+    validators given a :attr:`~flatland.validation.Validator.cache` are
+    not fused, and a fused validator given either later is called as
+    usual.  Returns None if none of *validators* can be fused.
+
+    """
+    steps, run, fused = [], [], False
+    for fn in validators:
+        check = _CHECKS.get(type(fn), (None,))[0]
+        if check is None or "validate" in fn.__dict__ or fn.cache is not None:
+            if run:
+                steps.append(_fuse_run(run))
+                run = []
+            steps.append(fn)
+        else:
+            run.append((check, fn))
+            fused = True
+    if not fused:
+        return None
+    if run:
+        steps.append(_fuse_run(run))
+    if len(steps) == 1:
+        return steps[0]
+    return _chain(steps)
+
+
+def _fuse_run(run):
+    """Fuse a run of ``(check, validator)`` pairs into one function."""
+    run = tuple(run)
+
+    def fused(element, state):
+        for check, validator in run:
+            if validator.cache is not None or "validate" in validator.__dict__:
+                # changed since fusion; validate as validate_element would
+                valid = validator(element, state)
+                if valid is None:
+                    return False
+                elif valid is Skip:
+                    return True
+                elif not valid or valid is SkipAll:
+                    return valid
+                continue
+            key = check(validator, element.value, element.u)
+            if key is not None:
+                return validator.note_error(element, state, key)
+        return True
+
+    return fused
+
+
+def _chain(steps):
+    """Apply *steps* in turn as validate_element applies validators."""
+    steps = tuple(steps)
+
+    def chain(element, state):
+        for fn in steps:
+            valid = fn(element, state)
+            if valid is None:
+                return False
+            elif valid is Skip:
+                return True
+            elif not valid or valid is SkipAll:
+                return valid
+        return True
+
+    return chain
+
+
+# Checks take a validator and an element's value and text, returning the
+# key of the message the validator would note, or None if it would pass,
+# testing exactly as the validator's ``validate`` does.  Each has a rows
+# form for columnar validation, taking lists of values and text and
+# returning those of the *rows* the validator would fail.
+
+
+def _present(validator, value, text):
+    if text == "":
+        return "missing"
+
+
+def _present_rows(validator, values, text, rows):
+    return [r for r in rows if text[r] == ""]
+
+
+def _is_true(validator, value, text):
+    if not bool(value):
+        return "false"
+
+
+def _is_true_rows(validator, values, text, rows):
+    return [r for r in rows if not values[r]]
+
+
+def _is_false(validator, value, text):
+    if bool(value):
+        return "true"
+
+
+def _is_false_rows(validator, values, text, rows):
+    return [r for r in rows if values[r]]
+
+
+def _value_in(validator, value, text):
+    if value not in validator.valid_options:
+        return "fail"
+
+
+def _value_in_rows(validator, values, text, rows):
+    options = validator.valid_options
+    return [r for r in rows if values[r] not in options]
+
+
+def _converted(validator, value, text):
+    if value is None:
+        return "incorrect"
+
+
+def _converted_rows(validator, values, text, rows):
+    return [r for r in rows if values[r] is None]
+
+
+def _shorter_than(validator, value, text):
+    if len(text) > validator.maxlength:
+        return "exceeded"
+
+
+def _shorter_than_rows(validator, values, text, rows):
+    maxlength = validator.maxlength
+    return [r for r in rows if len(text[r]) > maxlength]
+
+
+def _longer_than(validator, value, text):
+    if len(text) < validator.minlength:
+        return "short"
+
+
+def _longer_than_rows(validator, values, text, rows):
+    minlength = validator.minlength
+    return [r for r in rows if len(text[r]) < minlength]
+
+
+def _length_between(validator, value, text):
+    l = len(text)
+    if l < validator.minlength or l > validator.maxlength:
+        return "breached"
+
+
+def _length_between_rows(validator, values, text, rows):
+    minlength, maxlength = validator.minlength, validator.maxlength
+    return [r for r in rows if not minlength <= len(text[r]) <= maxlength]
+
+
+def _value_less_than(validator, value, text):
+    if not value < validator.boundary:
+        return "failure"
+
+
+def _value_less_than_rows(validator, values, text, rows):
+    boundary = validator.boundary
+    return [r for r in rows if not values[r] < boundary]
+
+
+def _value_at_most(validator, value, text):
+    if not value <= validator.maximum:
+        return "failure"
+
+
+def _value_at_most_rows(validator, values, text, rows):
+    maximum = validator.maximum
+    return [r for r in rows if not values[r] <= maximum]
+
+
+def _value_greater_than(validator, value, text):
+    if not value > validator.boundary:
+        return "failure"
+
+
+def _value_greater_than_rows(validator, values, text, rows):
+    boundary = validator.boundary
+    return [r for r in rows if not values[r] > boundary]
+
+
+def _value_at_least(validator, value, text):
+    if not value >= validator.minimum:
+        return "failure"
+
+
+def _value_at_least_rows(validator, values, text, rows):
+    minimum = validator.minimum
+    return [r for r in rows if not values[r] >= minimum]
+
+
+def _value_between(validator, value, text):
+    if validator.inclusive:
+        if not validator.minimum <= value <= validator.maximum:
+            return "failure_inclusive"
+    else:
+        if not validator.minimum < value < validator.maximum:
+            return "failure_exclusive"
+
+
+def _value_between_rows(validator, values, text, rows):
+    minimum, maximum = validator.minimum, validator.maximum
+    if validator.inclusive:
+        return [r for r in rows if not minimum <= values[r] <= maximum]
+    return [r for r in rows if not minimum < values[r] < maximum]
+
+
+# validator types, by the check and rows check of their condition
+_CHECKS = {
+    scalars.Present: (_present, _present_rows),
+    scalars.IsTrue: (_is_true, _is_true_rows),
+    scalars.IsFalse: (_is_false, _is_false_rows),
+    scalars.ValueIn: (_value_in, _value_in_rows),
+    scalars.Converted: (_converted, _converted_rows),
+    scalars.ShorterThan: (_shorter_than, _shorter_than_rows),
+    scalars.LongerThan: (_longer_than, _longer_than_rows),
+    scalars.LengthBetween: (_length_between, _length_between_rows),
+    scalars.ValueLessThan: (_value_less_than, _value_less_than_rows),
+    scalars.ValueAtMost: (_value_at_most, _value_at_most_rows),
+    scalars.ValueGreaterThan: (_value_greater_than, _value_greater_than_rows),
+    scalars.ValueAtLeast: (_value_at_least, _value_at_least_rows),
+    scalars.ValueBetween: (_value_between, _value_between_rows),
+}
@@ -64,6 +64,8 @@ class IsEmail(Validator):
 
     domain_pattern = re.compile(r"^(?:[a-z0-9\-]+\.)*[a-z0-9\-]+$", re.IGNORECASE)
 
+    pure = True
+
     def validate(self, element, state):
         addr = element.value
         if addr.count("@") != 1:
@@ -159,6 +161,8 @@ class URLValidator(Validator):
     allowed_parts = set(_url_parts)
     urlparse = urlparse
 
+    pure = True
+
     def validate(self, element, state):
         if element.value is None:
             return self.note_error(element, state, "bad_format")
@@ -255,6 +259,8 @@ class HTTPURLValidator(Validator):
     forbidden_parts = dict(username=True, password=True)
     urlparse = urlparse
 
+    pure = True
+
     def validate(self, element, state):
         url = element.value
         if url is None:
@@ -6,6 +6,8 @@ class Luhn10(Validator):
 
     invalid = N_("The %(label)s was not entered correctly.")
 
+    pure = True
+
     def validate(self, element, state):
         num = element.value
         if num is None:
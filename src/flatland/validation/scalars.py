@@ -94,6 +94,8 @@ class ValueIn(Validator):
 
     valid_options = ()
 
+    pure = True
+
     def __init__(self, valid_options=Unspecified, **kw):
         Validator.__init__(self, **kw)
         if valid_options is not Unspecified:
@@ -565,6 +567,12 @@ class MapEqual(Validator):
             self.field_paths = field_paths
         Validator.__init__(self, **kw)
 
+    def references(self, element):
+        found = []
+        for name in self.field_paths:
+            found.extend(element.find(name, strict=False))
+        return found
+
     def validate(self, element, state):
         elements = [element.find(name, single=True) for name in self.field_paths]
         fn = self.transform
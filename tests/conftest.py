@@ -0,0 +1,10 @@
+import pytest
+from flatland import util
+
+
+@pytest.fixture
+def interner():
+    interner = util.ClassInterner(size=2)
+    util.class_cloner.interner = interner
+    yield interner
+    util.class_cloner.interner = None
@@ -271,3 +271,74 @@ def test_xml_helpers():
 
     assert el.x == '&lt;foo\t&amp;\r\n"bar"&gt;'
     assert el.xa == "&lt;foo&#9;&amp;&#13;&#10;&quot;bar&quot;&gt;"
+
+
+def test_iter_flatten():
+    from flatland import Dict, List, String
+
+    schema = Dict.named("d").of(
+        String.named("s"),
+        List.named("l").of(Dict.of(String.named("x"))),
+    )
+    el = schema({"s": "a", "l": [{"x": "b"}, {"x": "c"}]})
+    expected = [("d_s", "a"), ("d_l_0_x", "b"), ("d_l_1_x", "c")]
+
+    seen = []
+    pairs = el.iter_flatten(value=lambda e: seen.append(e) or e.u)
+    assert not seen
+    assert next(pairs) == expected[0]
+    assert len(seen) == 1
+    assert list(pairs) == expected[1:]
+
+    assert el.flatten() == expected
+    assert el.flatten(".") == [(k.replace("_", "."), v) for k, v in expected]
+    for child in el.all_children:
+        assert child.flatten() == list(child.iter_flatten())
+    assert el["l"][1].flatten() == [("d_l_1_x", "c")]
+    assert el["l"][1]["x"].flatten() == [("d_l_1_x", "c")]
+
+
+def test_lazy_messages():
+    import copy
+    import pickle
+
+    el = Element()
+    assert "errors" not in el.__dict__
+    assert el.errors == [] and el.warnings == []
+    assert "errors" in el.__dict__
+    assert el.parent is None
+    assert el.valid is Unevaluated
+
+    el.add_error("a")
+    el.add_error("a")
+    el.errors.append("b")
+    assert el.errors == ["a", "b"]
+    assert el.warnings == []
+    assert Element().errors == []
+
+    el = Element()
+    el.warnings += ["w"]
+    el.errors[:] = ["x"]
+    el.errors.extend(["y"])
+    el.errors.insert(0, "z")
+    assert el.warnings == ["w"]
+    assert el.errors == ["z", "x", "y"]
+
+    el.errors = ["replaced"]
+    assert el.errors == ["replaced"]
+
+    assert copy.deepcopy(el).errors == ["replaced"]
+    assert type(pickle.loads(pickle.dumps(Element().errors))) is list
+
+    # one list, however it is reached
+    el = Element()
+    errors = el.errors
+    el.add_error("x")
+    assert errors == ["x"] and el.errors is errors
+
+    el = Element()
+    a, b = el.warnings, el.warnings
+    a.append(1)
+    b.append(2)
+    assert a is b is el.warnings
+    assert el.warnings == [1, 2]
@@ -0,0 +1,179 @@
+from array import array
+
+import pytest
+from flatland import (
+    CompactList,
+    Dict,
+    Integer,
+    List,
+    String,
+    Unevaluated,
+)
+from flatland.validation import Converted, NotDuplicated, ValueAtLeast
+
+
+def _schemas(member, **kw):
+    return (
+        CompactList.named("l").of(member).using(**kw),
+        List.named("l").of(member).using(**kw),
+    )
+
+
+def _state(el):
+    return (
+        el.value,
+        el.u,
+        el.flatten(),
+        [(m.value, m.u, m.raw, m.valid, m.parent.name) for m in el],
+    )
+
+
+def test_requires_scalar_members():
+    with pytest.raises(TypeError):
+        CompactList.of(Dict.of(String))()
+    with pytest.raises(TypeError):
+        CompactList.of(List.of(String))()
+
+
+def test_set_flat_matches_list():
+    pairs = [("l_0_i", "1"), ("l_2_i", "x"), ("l_3_i", ""), ("l_5_i", " 7 ")]
+    for prune in True, False:
+        compact, plain = _schemas(Integer.named("i"), prune_empty=prune)
+        el = compact.from_flat(pairs)
+        assert _state(el) == _state(plain.from_flat(pairs))
+
+
+def test_storage():
+    compact, _ = _schemas(Integer)
+    el = compact([1, None, "x"])
+    assert isinstance(el._values, array)
+    assert el.value == [1, None, None]
+    assert el.u == "['1', '', 'x']"
+    assert el._elements == {}
+
+    el.append(2**70)
+    assert el.value == [1, None, None, 2**70]
+    assert not isinstance(el._values, array)
+
+
+def test_members_created_on_access():
+    compact, _ = _schemas(String.named("s"))
+    el = compact(["a", "b", "c"])
+    assert el._elements == {}
+
+    member = el[1]
+    assert el[1] is member
+    assert member.parent.parent is el
+    assert member.flattened_name() == "l_1_s"
+    member.set("B")
+    assert el.value == ["a", "B", "c"]
+
+    del el[0]
+    assert el[0] is member
+    assert el.flatten() == [("l_0_s", "B"), ("l_1_s", "c")]
+    el.insert(0, "z")
+    assert el.index("B") == 1
+    assert member.flattened_name() == "l_1_s"
+
+
+def test_validation():
+    member = Integer.validated_by(Converted(), ValueAtLeast(minimum=2))
+    compact, plain = _schemas(member)
+    values = ["2", "1", "x", "3"]
+    el = compact(values)
+
+    assert not el.validate()
+    assert not plain(values).validate()
+    # only the members with errors are kept as elements
+    assert sorted(el._elements) == [1, 2]
+    assert [m.valid for m in el] == [True, False, False, True]
+    assert el[1].errors and el[2].errors and not el[0].errors
+
+    el[1] = "5"
+    el[2] = "6"
+    assert el.validate()
+
+
+def test_validation_order():
+    seen = []
+
+    def counting(element, state):
+        seen.append(element.value)
+        if element.value == 1:
+            element.add_error("one")
+            return False
+        return True
+
+    el = CompactList.of(Integer.using(validators=[counting]))([0, 1, 2])
+    # each member once, in order, including the one kept for its error
+    assert not el.validate()
+    assert seen == [0, 1, 2]
+    assert sorted(el._elements) == [1]
+
+    seen[:] = []
+    assert not el.validate()
+    assert seen == [0, 1, 2]
+
+
+def test_not_duplicated():
+    def errors(el):
+        assert not el.validate()
+        return [(m.parent.name, m.errors) for m in el if m.errors]
+
+    values = [1, 2, 1, None, 2, None]
+    for comparator in NotDuplicated.comparator, lambda a, b: a.value == b.value:
+        member = Integer.named("i").using(
+            validators=[NotDuplicated(comparator=comparator)]
+        )
+        compact, plain = _schemas(member)
+        assert errors(compact(values)) == errors(plain(values))
+        assert [name for name, _ in errors(compact(values))] == ["2", "4", "5"]
+
+    # compared in storage, creating only the members with errors
+    el = CompactList.of(Integer.using(validators=[NotDuplicated()]))([1, 2, 1, 2])
+    assert not el.validate()
+    assert sorted(el._elements) == [2, 3]
+
+
+def test_fail_fast():
+    member = Integer.validated_by(Converted(), ValueAtLeast(minimum=2))
+    schema = Dict.of(Integer.named("i"), CompactList.named("n").of(member))
+    el = schema({"i": 1, "n": ["2", "3"]})
+    assert el.validate()
+    assert [m.valid for m in el["n"]] == [True, True]
+
+    el["n"].extend(["1", "x"])
+    assert not el.validate(fail_fast=True)
+    # stopping at the first invalid member, members after it unvalidated
+    assert el.stopped_at is el["n"][2]
+    assert el["n"][2].value == 1
+    assert [m.valid for m in el["n"]] == [True, True, False, Unevaluated]
+
+    # earlier results of members not reached are cleared
+    el["i"].set(None)
+    assert not el.validate(fail_fast=True)
+    assert el.stopped_at is el["i"]
+    assert [m.valid for m in el["n"]] == [Unevaluated] * 4
+
+    # a member invalid without messages is kept to be stopped at
+    silent = CompactList.of(Integer.using(validators=[lambda e, s: e.value != 1]))
+    el = silent([0, 1, 2])
+    assert not el.validate(fail_fast=True)
+    assert el.stopped_at is el[1]
+    assert [m.valid for m in el] == [True, False, Unevaluated]
+
+
+def test_within_dict():
+    schema = Dict.named("d").of(
+        String.named("a"),
+        CompactList.named("n").of(Integer).using(default=2),
+    )
+    el = schema.from_flat([("d_a", "x"), ("d_n_0", "1"), ("d_n_1", "2")])
+    assert el.flatten() == [("d_a", "x"), ("d_n_0", "1"), ("d_n_1", "2")]
+    assert el.validate()
+    assert el.find_one("n/1").value == 2
+
+    clone = schema.from_prototype(defaults=True)
+    assert clone.value == schema.from_defaults().value
+    clone["n"][0].set(5)
+    assert schema.from_prototype(defaults=True)["n"].value == [None, None]
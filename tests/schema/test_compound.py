@@ -461,6 +461,13 @@ def test_compound_optional():
     assert f.validate()
 
 
+def test_compound_optional_interned(interner):
+    # a class prepared with other settings is not handed back
+    DateYYYYMMDD.named("s")()
+    test_compound_optional()
+    assert DateYYYYMMDD.named("s") is not DateYYYYMMDD.named("s")
+
+
 def test_compound_is_empty():
     element = DateYYYYMMDD()
     assert element.is_empty
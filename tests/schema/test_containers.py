@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from flatland import (
     Dict,
@@ -8,6 +10,7 @@ from flatland import (
     SkipAllFalse,
     String,
     Unevaluated,
+    Unset,
 )
 from flatland.schema.base import Root
 
@@ -175,6 +178,307 @@ class TestContainerValidation:
         assert el.valid
         assert el.all_valid
 
+    def test_preorder(self):
+        v = self.validator
+        schema = Dict.named("r").of(
+            Dict.named("a")
+            .of(Integer.named("x").using(validators=[v("ax", True)]))
+            .using(descent_validators=[v("a+", True)], validators=[v("a-", True)]),
+            Dict.named("b")
+            .of(Integer.named("y").using(validators=[v("by", True)]))
+            .using(descent_validators=[v("b+", SkipAll)], validators=[v("b-", True)]),
+            List.named("c")
+            .of(Integer.named("z").using(validators=[v("cz", True)]))
+            .using(validators=[v("c-", True)]),
+        )
+        el = schema.from_defaults()
+        el["c"].extend([1, 2])
+        assert el.validate()
+        assert self.canary == ["a+", "ax", "b+", "cz", "cz", "c-", "b-", "a-"]
+        assert el["b"]["y"].valid is Unevaluated
+
+    def test_plan_overrides(self):
+        schema = Dict.of(
+            Integer.named("i").using(validators=[self.validator("class", True)])
+        )
+        el = schema()
+        el["i"].set(1)
+        assert el.validate()
+        assert self.canary == ["class"]
+
+        # instance overrides of the compiled schema are honored
+        dict.__setitem__(
+            el,
+            "i",
+            Integer(1, name="i", validators=[self.validator("instance", False)]),
+        )
+        assert not el.validate()
+        assert self.canary == ["class", "instance"]
+        assert schema._validation_plan() is schema._validation_plan()
+
+    def test_avalidate(self):
+        v = self.validator
+        schema = (
+            Dict.named("r")
+            .of(
+                Dict.named("a")
+                .of(Integer.named("x").using(validators=[v("ax", True)]))
+                .using(descent_validators=[v("a+", True)], validators=[v("a-", True)]),
+                Dict.named("b")
+                .of(Integer.named("y").using(validators=[v("by", True)]))
+                .using(
+                    descent_validators=[v("b+", SkipAll)], validators=[v("b-", True)]
+                ),
+            )
+            .using(validators=[v("r-", False)])
+        )
+        el = schema()
+        assert not asyncio.run(el.avalidate())
+        assert self.canary[:2] == ["a+", "b+"]
+        assert sorted(self.canary[2:-1]) == ["a-", "ax", "b-"]
+        assert self.canary[-1] == "r-"
+        assert self.canary.index("ax") < self.canary.index("a-")
+        assert el["b"]["y"].valid is Unevaluated
+        assert not el.valid
+        assert el["a"].valid and el["a"]["x"].valid
+
+
+def test_avalidate_concurrent():
+    started = []
+
+    async def lookup(element, state):
+        started.append(element.name)
+        # both lookups must be waiting at once for either to finish
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        return element.value != "taken"
+
+    schema = Dict.of(
+        String.named("username").using(validators=[lookup]),
+        String.named("coupon").using(validators=[lookup]),
+    )
+    el = schema({"username": "free", "coupon": "taken"})
+    assert not asyncio.run(asyncio.wait_for(el.avalidate(), 1))
+    assert sorted(started) == ["coupon", "username"]
+    assert el["username"].valid
+    assert not el["coupon"].valid
+
+    started[:] = []
+    el["coupon"].set("free")
+    assert asyncio.run(asyncio.wait_for(el.avalidate(), 1))
+    assert el.all_valid
+
+
+def test_avalidate_matches_validate():
+    from flatland.validation import Converted, Present
+
+    schema = Dict.of(
+        String.named("a").using(validators=[Present()]),
+        List.named("b").of(Integer.named("i").using(validators=[Converted()])),
+    )
+    for data in ({}, {"a": "x", "b": [1, "y"]}, {"a": "x", "b": [1, 2]}):
+        sync, concurrent = schema(data), schema(data)
+        assert sync.validate() == asyncio.run(concurrent.avalidate())
+        assert [e.valid for e in sync.all_children] == [
+            e.valid for e in concurrent.all_children
+        ]
+
+
+def _counted(calls, name, result=True):
+    def validator(element, state):
+        calls.append(name)
+        return result(element) if callable(result) else result
+
+    return validator
+
+
+def test_incremental_validation():
+    calls = []
+    present = lambda element: element.value is not None
+    Section = Dict.of(
+        *[
+            String.named(name).using(validators=[_counted(calls, name, present)])
+            for name in "abc"
+        ]
+    ).using(validators=[_counted(calls, "section")])
+    schema = (
+        Dict.named("form")
+        .of(Section.named("x"), Section.named("y"))
+        .using(validators=[_counted(calls, "form")])
+    )
+    el = schema({"x": {"a": "1", "b": "2", "c": "3"}, "y": {"a": "1"}})
+
+    assert not el.validate(incremental=True)
+    assert len(calls) == 9
+
+    del calls[:]
+    assert not el.validate(incremental=True)
+    assert calls == []
+
+    el["y"]["b"].set("2")
+    el["y"]["c"].set("3")
+    assert el.validate(incremental=True)
+    assert sorted(calls) == ["b", "c", "form", "section"]
+    assert el.all_valid
+
+    del calls[:]
+    el["x"]["a"].set(None)
+    assert not el.validate(incremental=True)
+    assert sorted(calls) == ["a", "form", "section"]
+    assert not el["x"]["a"].valid and el["x"]["b"].valid
+
+    # a branch validated in full in between is revisited in full
+    del calls[:]
+    el["x"].validate()
+    el["x"]["a"].set("1")
+    assert el.validate(incremental=True)
+    assert sorted(calls[4:]) == ["a", "b", "c", "form", "section"]
+
+
+def test_incremental_validation_lists():
+    from flatland.validation import NotDuplicated
+
+    calls = []
+    schema = List.named("l").of(
+        String.named("s").using(validators=[_counted(calls, "member"), NotDuplicated()])
+    )
+    el = schema(["a", "b"])
+    assert el.validate(incremental=True)
+
+    del calls[:]
+    el.append("c")
+    assert el.validate(incremental=True)
+    # NotDuplicated compares every member with the others
+    assert calls == ["member"] * 3
+
+    del calls[:]
+    el[0].set("c")
+    assert not el.validate(incremental=True)
+    assert calls == ["member"] * 3
+    assert not el[2].valid
+
+    del el[2]
+    assert el.validate(incremental=True)
+
+
+def test_incremental_validation_references():
+    from flatland.validation import ValuesEqual
+
+    schema = Dict.of(
+        String.named("password"),
+        String.named("again").using(validators=[ValuesEqual("../password", ".")]),
+        String.named("name"),
+    )
+    el = schema({"password": "x", "again": "x", "name": "n"})
+    assert el.validate(incremental=True)
+
+    el["password"].set("y")
+    assert not el.validate(incremental=True)
+    assert not el["again"].valid
+
+    el["again"].set("y")
+    assert el.validate(incremental=True)
+
+
+def test_incremental_validation_skipped():
+    calls = []
+    skip = lambda element, state: SkipAll if element["skip"].value else True
+    schema = Dict.of(
+        Integer.named("skip"),
+        Integer.named("i").using(validators=[_counted(calls, "i", False)]),
+    ).using(descent_validators=[skip])
+    el = schema({"skip": 1, "i": 1})
+    assert el.validate(incremental=True)
+    assert calls == []
+
+    # changed while skipped, then validated once no longer skipped
+    el["i"].set(2)
+    assert el.validate(incremental=True)
+    el["skip"].set(None)
+    assert not el.validate(incremental=True)
+    assert calls == ["i"]
+
+
+def test_incremental_validation_after_avalidate():
+    calls = []
+    Section = Dict.of(
+        *[String.named(name).using(validators=[_counted(calls, name)]) for name in "ab"]
+    ).using(validators=[_counted(calls, "section")])
+    schema = Dict.named("form").of(Section.named("x"), Section.named("y"))
+
+    # as after validate, ancestors validated incrementally revisit them
+    for avalidate, expected in (
+        (lambda el: el["x"]["a"].avalidate(recurse=False), ["a", "section"]),
+        (lambda el: el["x"].avalidate(), ["a", "b", "section"]),
+    ):
+        el = schema({"x": {"a": "1", "b": "2"}, "y": {"a": "1"}})
+        assert el.validate(incremental=True)
+        assert asyncio.run(avalidate(el))
+        del calls[:]
+        assert el.validate(incremental=True)
+        assert sorted(calls) == expected
+
+
+def test_fail_fast():
+    calls = []
+    present = lambda element: element.value is not None
+    schema = Dict.named("form").of(
+        *[
+            String.named(name).using(validators=[_counted(calls, name, present)])
+            for name in "abc"
+        ],
+        List.named("l").of(Integer.using(validators=[_counted(calls, "i")])),
+    )
+    el = schema({"a": "1", "c": "3", "l": [1, 2]})
+
+    assert not el.validate(fail_fast=True)
+    assert calls == ["a", "b"]
+    assert el.stopped_at is el["b"]
+    assert el["a"].valid is True
+    assert el["b"].valid is False
+    assert el["c"].valid is Unevaluated
+    assert el["l"][0].valid is Unevaluated
+    # the form's own validators, run on the way up, were not reached
+    assert el.valid is Unevaluated
+
+    # a full validation forgets where fail-fast validation stopped, and a
+    # later fail-fast validation forgets the full one's results
+    del calls[:]
+    assert not el.validate()
+    assert el.stopped_at is None
+    assert calls == ["a", "b", "c", "i", "i"]
+    assert el["c"].valid is True
+    assert not el.validate(fail_fast=True)
+    assert el["c"].valid is Unevaluated
+    assert el["l"][0].valid is Unevaluated
+
+    el["b"].set("2")
+    assert el.validate(fail_fast=True)
+    assert el.stopped_at is None
+    assert el.valid is True
+
+    with pytest.raises(TypeError):
+        el.validate(incremental=True, fail_fast=True)
+
+
+def test_fail_fast_ascending():
+    calls = []
+    schema = Dict.of(
+        Dict.named("x")
+        .of(String.named("a"))
+        .using(validators=[_counted(calls, "x", False)]),
+        Dict.named("y").of(String.named("a")).using(validators=[_counted(calls, "y")]),
+    ).using(validators=[_counted(calls, "root")])
+    el = schema({"x": {"a": "1"}, "y": {"a": "2"}})
+
+    assert not el.validate(fail_fast=True)
+    # containers validate on the way up, in reverse: y before x
+    assert calls == ["y", "x"]
+    assert el.stopped_at is el["x"]
+    assert el["y"].valid is True
+    assert el["x"].valid is False
+    assert el.valid is Unevaluated
+
 
 def test_sequence():
     schema = Sequence.named("s")
@@ -341,3 +645,98 @@ def test_naming_list_list():
         assert leaf.find_one("/") is root
 
         assert root.find_one(["0", "0"]) is leaf
+
+
+def test_reset():
+    from flatland import Array, SparseDict
+
+    schema = Dict.named("d").of(
+        String.named("s").using(optional=True),
+        List.named("l").of(Integer.named("i")),
+        Array.named("a").of(String),
+        SparseDict.named("sd").of(Integer.named("x")),
+    )
+    el = schema.from_flat(
+        [("d_s", "a"), ("d_l_0_i", "1"), ("d_a", "b"), ("d_sd_x", "2")]
+    )
+    el.validate()
+    el["s"].add_error("oops")
+    children = {key: el[key] for key in el}
+
+    el.reset()
+    assert el.flatten() == schema().flatten()
+    assert el.value == schema().value
+    assert el.raw is Unset
+    assert el.valid is Unevaluated
+    for key, child in children.items():
+        assert el[key] is child
+        assert child.valid is Unevaluated
+        assert child.raw is Unset
+    assert el["s"].errors == []
+    assert len(el["l"]) == 0 and len(el["a"]) == 0
+    assert "x" not in el["sd"]
+
+    el.set_flat([("d_l_0_i", "3")])
+    assert el.value == schema.from_flat([("d_l_0_i", "3")]).value
+
+
+def test_reset_keeps_overrides():
+    el = String(validators=[lambda element, state: False], label="L")
+    el.set("x")
+    el.reset()
+    assert el.label == "L"
+    assert el.value is None and el.u == ""
+    el.set("y")
+    assert not el.validate()
+
+
+def _prototype_schema(factory, pure=False):
+    return Dict.named("d").of(
+        String.named("s").using(default="x"),
+        Integer.named("n").using(default_factory=factory, pure_default_factory=pure),
+        List.named("l").of(Integer.named("i")).using(default=[1, 2]),
+        Dict.named("sub").of(String.named("t")),
+    )
+
+
+def test_from_prototype():
+    schema = _prototype_schema(lambda element: 5)
+
+    for defaults, expected in ((False, schema()), (True, schema.from_defaults())):
+        el = schema.from_prototype(defaults=defaults)
+        assert el.value == expected.value
+        assert el.flatten() == expected.flatten()
+        assert el.parent is None
+        for child in el.all_children:
+            assert child.root is el
+
+        other = schema.from_prototype(defaults=defaults)
+        assert not set(map(id, el.all_children)) & set(map(id, other.all_children))
+
+    el = schema.from_prototype(defaults=True)
+    el["l"].append(3)
+    el["sub"]["t"] = "y"
+    assert schema.from_prototype(defaults=True).value == schema.from_defaults().value
+    assert el["l"][2].parent.name == "2"
+
+
+def test_from_prototype_factories():
+    calls = []
+
+    def factory(element):
+        calls.append(element)
+        return len(calls)
+
+    schema = _prototype_schema(factory)
+    first = schema.from_prototype(defaults=True)
+    second = schema.from_prototype(defaults=True)
+    # one call builds the prototype, then one for each clone
+    assert len(calls) == 3
+    assert (first["n"].value, second["n"].value) == (2, 3)
+    assert calls[1] is first["n"] and calls[2] is second["n"]
+
+    calls[:] = []
+    pure = _prototype_schema(factory, pure=True)
+    assert pure.from_prototype(defaults=True)["n"].value == 1
+    assert pure.from_prototype(defaults=True)["n"].value == 1
+    assert len(calls) == 1
@@ -289,6 +289,15 @@ class TestEmptySparseDictRequiredSet(DictSetTest):
     schema = SparseDict.using(minimum_fields="required")
 
 
+@pytest.mark.parametrize(
+    "case", [TestEmptyDictSet, TestDefaultDictSet, TestEmptySparseDictRequiredSet]
+)
+def test_set_default_interned(case, interner):
+    # the schema of test_set_default is changed after it is derived
+    case().test_set_default()
+    case().test_set_default_from_children()
+
+
 def test_dict_valid_policies():
     schema = Dict.of(Integer)
     el = schema()
@@ -649,3 +658,99 @@ def test_sparsedict_flattening():
     for el in els:
         got = sorted(el.flatten())
         assert wanted == got
+
+
+def _created(el):
+    return set(dict.keys(el))
+
+
+def test_lazy_children():
+    inner = Dict.named("inner").of(String.named("a"), String.named("b"))
+    schema = Dict.named("d").of(Integer.named("x"), Integer.named("y"), inner)
+    lazy = schema.using(lazy_children=True)
+
+    el = lazy()
+    assert _created(el) == set()
+    assert len(el) == 3
+    assert "x" in el and "inner" in el and "z" not in el
+    assert el["x"].value is None
+    assert _created(el) == {"x"}
+    assert el.find("y", single=True).parent is el
+    assert _created(el) == {"x", "y"}
+    with pytest.raises(KeyError):
+        el["z"]
+
+    el = lazy.from_flat([("d_x", "1")])
+    assert _created(el) == {"x"}
+    el["y"] = 2
+    assert _created(el) == {"x", "y"}
+
+    el = lazy({"x": 1})
+    assert _created(el) == {"x"}
+    assert list(el) == ["x", "y", "inner"]
+    assert el.value == {"x": 1, "y": None, "inner": {"a": None, "b": None}}
+
+
+def test_lazy_children_dict_methods():
+    schema = Dict.named("d").of(Integer.named("x"), Integer.named("y"))
+    lazy = schema.using(lazy_children=True)
+
+    def view(el, method):
+        result = method(el)
+        return {key: child.value for key, child in dict(result).items()}
+
+    for method in (
+        lambda el: el.copy(),
+        lambda el: el | {},
+        lambda el: {} | el,
+        lambda el: dict(el),
+        lambda el: {key: el.get(key) for key in reversed(el)},
+    ):
+        assert view(lazy({"x": 1}), method) == view(schema({"x": 1}), method)
+        assert list(view(lazy(), method)) in (["x", "y"], ["y", "x"])
+    assert lazy({"x": 1}) == schema({"x": 1})
+    with pytest.raises(TypeError):
+        lazy().popitem()
+
+
+def test_lazy_children_field_lookup():
+    lazy = Dict.named("d").of(Integer.named("x"), Integer.named("y"))
+    lazy = lazy.using(lazy_children=True)
+    el = lazy()
+    assert "x" in el and "z" not in el
+    # fields are found by name in a mapping kept with the class
+    memo = lazy.__dict__["_field_schema_memo"]
+    assert memo[1] == {"x": lazy.field_schema[0], "y": lazy.field_schema[1]}
+    assert "y" in lazy() and lazy.__dict__["_field_schema_memo"] is memo
+
+    own = lazy(field_schema=[String.named("z")])
+    assert "z" in own and "x" not in own
+    assert own["z"].value is None
+    assert "_field_schema_memo" in own.__dict__
+    assert lazy.__dict__["_field_schema_memo"] is memo
+
+
+def test_lazy_children_same_tree():
+    inner = Dict.named("inner").of(String.named("a"), String.named("b"))
+    schema = Dict.named("d").of(Integer.named("x"), Integer.named("y"), inner)
+    lazy = Dict.named("d").of(
+        Integer.named("x"), Integer.named("y"), inner.using(lazy_children=True)
+    )
+    lazy = lazy.using(lazy_children=True)
+
+    for pairs in ([], [("d_y", "2")], [("d_inner_b", "b"), ("d_x", "1")]):
+        eager_el, lazy_el = schema.from_flat(pairs), lazy.from_flat(pairs)
+        assert lazy_el.flatten() == eager_el.flatten()
+        assert lazy_el.validate() == eager_el.validate()
+        assert lazy_el.value == eager_el.value
+        assert lazy_el.u == eager_el.u
+        assert [e.errors for e in lazy_el.all_children] == [
+            e.errors for e in eager_el.all_children
+        ]
+
+
+def test_lazy_children_sparse():
+    schema = SparseDict.of(Integer.named("x")).using(lazy_children=True)
+    el = schema()
+    assert "x" not in el
+    assert el.value == {}
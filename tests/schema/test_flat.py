@@ -0,0 +1,365 @@
+import pytest
+
+from flatland import (
+    Dict,
+    Integer,
+    List,
+    SparseDict,
+    String,
+    Unevaluated,
+    Unset,
+)
+from flatland.exc import InputLimitError
+from flatland.schema.flat import (
+    FlatBudget,
+    FlatPlan,
+    FlatTemplate,
+    FlatTrie,
+    split_name,
+)
+
+
+def test_trie_splits_keys():
+    trie = FlatTrie.from_pairs([("a_b", 1), ("a", 2), ("a_c_d", 3)], "_")
+    assert sorted(trie.children) == ["a"]
+    node = trie.lookup("a", "_")
+    assert [p[2] for p in node.pairs] == [2]
+    assert sorted(node.children) == ["b", "c"]
+    assert trie.lookup("a_c_d", "_").pairs == [(2, "a_c_d", 3)]
+    assert trie.lookup("a_x", "_") is None
+    assert trie.lookup(None, "_") is trie
+    assert trie.find(("a", "c")) is trie.lookup("a_c", "_")
+    assert trie.find(None) is trie
+
+
+def test_trie_ignores_non_string_keys():
+    trie = FlatTrie.from_pairs([(None, 1), (3, 2), ("a", 3)], "_")
+    assert list(trie.children) == ["a"]
+    assert trie.pairs == []
+
+
+def test_trie_flat_pairs():
+    pairs = [("a_x", 1), ("b", 2), ("a", 3), ("a_y_z", 4), ("ab", 5)]
+    trie = FlatTrie.from_pairs(pairs, "_")
+    assert trie.flat_pairs(("a",)) == [("a_x", 1), ("a", 3), ("a_y_z", 4)]
+    assert trie.flat_pairs(("c",)) == []
+
+    node = trie.lookup("a", "_")
+    assert node.flat_pairs(None) == [("x", 1), (None, 3), ("y_z", 4)]
+    assert node.flat_pairs(("y",)) == [("y_z", 4)]
+
+
+def test_trie_multichar_sep():
+    trie = FlatTrie.from_pairs([("a__b", 1), ("a_b", 2)], "__")
+    assert sorted(trie.children) == ["a", "a_b"]
+    assert trie.lookup("a", "__").flat_pairs(("b",)) == [("b", 1)]
+
+
+def test_trie_pruned():
+    trie = FlatTrie.from_pairs([("a_x", ""), ("a_y", "1"), ("b", "")], "_")
+    pruned = trie.pruned()
+    assert sorted(pruned.children) == ["a"]
+    assert sorted(pruned.lookup("a", "_").children) == ["y"]
+    assert pruned.pruned() is pruned
+
+    assert FlatTrie.from_pairs([("a", "")], "_").pruned() is None
+
+
+def test_trie_merged():
+    pairs = [("l_1_x", "a"), ("l_01_x", "b"), ("l_1", "c")]
+    node = FlatTrie.from_pairs(pairs, "_").lookup("l", "_")
+    merged = FlatTrie.merged([node.children["1"], node.children["01"]], "_")
+    assert merged.flat_pairs(None) == [("x", "a"), ("x", "b"), (None, "c")]
+    assert merged.flat_pairs(("x",)) == [("x", "a"), ("x", "b")]
+
+
+def test_set_flat_separator_in_field_name():
+    schema = Dict.named("p").of(
+        String.named("first_name"), String.named("first"), String.named("name")
+    )
+    el = schema.from_flat([("p_first_name", "a"), ("p_first", "b"), ("p_name", "c")])
+    assert el.value == {"first_name": "a", "first": "b", "name": "c"}
+
+
+def test_set_flat_nested_buckets():
+    schema = Dict.named("f").of(
+        List.named("rows").of(
+            Dict.of(Integer.named("id"), List.named("tags").of(String))
+        ),
+        String.named("title"),
+    )
+    pairs = [
+        ("f_rows_1_tags_0", "b"),
+        ("f_title", "t"),
+        ("f_rows_0_id", "1"),
+        ("f_rows_1_id", "2"),
+        ("f_rows_0_tags_0", "a"),
+        ("f_rows_1_tags_1", "c"),
+        ("f_rowsx_0_id", "3"),
+    ]
+    el = schema.from_flat(pairs)
+    assert el.value == {
+        "title": "t",
+        "rows": [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": ["b", "c"]}],
+    }
+    assert sorted(el.flatten()) == sorted(pairs[:-1])
+
+
+def test_set_flat_leading_zero_indexes():
+    schema = List.named("l").of(Dict.of(String.named("x"), String.named("y")))
+    el = schema.from_flat([("l_1_x", "a"), ("l_01_y", "b"), ("l_0_x", "c")])
+    assert el.value == [{"x": "c", "y": None}, {"x": "a", "y": "b"}]
+
+
+def test_set_flat_anonymous_dict_member_bare_index():
+    schema = List.named("l").of(Dict.of(String.named("x")))
+    el = schema.from_flat([("l_0", "junk"), ("l_0_x", "a")])
+    assert el.value == [{"x": "a"}]
+
+
+def test_set_flat_only_touches_addressed_children():
+    schema = Dict.of(String.named("x"), String.named("y"))
+    el = schema.from_flat([("x", "a")])
+    assert el["x"].raw == "a"
+    assert el["y"].raw is Unset
+
+
+def test_set_flat_sparse_dict_aligned_names():
+    schema = SparseDict.named("s").of(String.named("a"), String.named("ab"))
+    el = schema.from_flat([("s_ab", "1")])
+    assert el.value == {"ab": "1"}
+
+
+def test_set_flat_subclass_override():
+    canary = []
+
+    class Custom(Dict):
+        def _set_flat(self, pairs, sep):
+            canary.append(pairs)
+            Dict._set_flat(self, pairs, sep)
+
+    schema = Dict.named("d").of(Custom.named("c").of(String.named("x")))
+    el = schema.from_flat([("d_c_x", "1"), ("d_y", "2")])
+    assert canary == [[("c_x", "1")]]
+    assert el.value == {"c": {"x": "1"}}
+
+
+def test_split_name():
+    assert split_name(None, "_") is None
+    assert split_name("a_b", "_") == ("a", "b")
+    assert split_name("a_b", "__") == ("a_b",)
+
+
+def test_plan_memoized_per_class():
+    schema = List.named("l").of(Dict.of(String.named("x"), String.named("y")))
+    el = schema()
+    plan = el._flat_plan("_")
+    assert isinstance(plan, FlatPlan)
+    assert plan.segments == ("l",)
+    assert schema()._flat_plan("_") is plan
+    assert el._flat_plan("-") is not plan
+    assert schema.__dict__["_flat_plans"]["_"] is plan
+    assert "_flat_plans" not in List.__dict__
+
+    member = el.member_schema()
+    member_plan = member._flat_plan("_")
+    assert [f[0] for f in member_plan.fields] == ["x", "y"]
+    assert member_plan.dispatch == {"x": [0], "y": [1]}
+    assert el.member_schema()._flat_plan("_") is member_plan
+
+
+def test_plan_respects_instance_overrides():
+    schema = List.named("l").of(String)
+    plan = schema()._flat_plan("_")
+
+    el = schema(name="m", prune_empty=False)
+    override = el._flat_plan("_")
+    assert override is not plan
+    assert override.segments == ("m",)
+    assert not override.prune
+    assert schema()._flat_plan("_") is plan
+
+    el.set_flat([("m_1", "a"), ("l_0", "b")])
+    assert el.value == [None, "a"]
+
+
+def test_plan_tracks_class_mutation():
+    schema = Dict.named("d").of(String.named("x"))
+    assert schema.from_flat([("d_x", "1")]).value == {"x": "1"}
+    schema.name = "e"
+    assert schema.from_flat([("e_x", "2")]).value == {"x": "2"}
+
+
+def test_set_flat_sparse_input_dispatch():
+    fields = [String.named("f%s" % i) for i in range(10)]
+    schema = Dict.of(*fields, Dict.named("f3_sub").of(String.named("z")))
+    el = schema.from_flat([("f7", "a"), ("f3_sub_z", "b"), ("f3", "c")])
+    assert el["f7"].value == "a"
+    assert el["f3"].value == "c"
+    assert el["f3_sub"].value == {"z": "b"}
+    assert el["f0"].raw is Unset
+
+
+def test_template_fill():
+    keys = ["d_a", "d_l_0", 1, "d_l_1", "x"]
+    template = FlatTemplate(keys, "_")
+    for values in (["1", "", "?", "3", ""], ["1", "2", "?", "3", "4"]):
+        trie = template.fill(values)
+        expected = FlatTrie.from_pairs(zip(keys, values), "_")
+        assert sorted(trie.walk()) == sorted(expected.walk())
+        for node, other in zip(_nodes(trie), _nodes(expected)):
+            assert node.empty == other.empty
+            assert node.offset == other.offset
+
+
+def _nodes(trie):
+    yield trie
+    for segment in sorted(trie.children):
+        yield from _nodes(trie.children[segment])
+
+
+def test_from_flat_many():
+    from flatland.validation import Converted
+
+    schema = Dict.named("d").of(
+        Integer.named("i").using(validators=[Converted()]),
+        List.named("l").of(String),
+    )
+    rows = [
+        {"d_i": "1", "d_l_0": "a"},
+        {"d_i": "x", "d_l_0": ""},
+        [("d_i", "2"), ("d_l_1", "b"), ("d_l_0", "c")],
+        [("d_i", "3"), ("d_l_1", "d"), ("d_l_0", "e")],
+        {"d_i": "4", "d_l_0": "f"},
+    ]
+    results = list(schema.from_flat_many(iter(rows), chunk_size=2))
+    assert len(results) == len(rows)
+    for row, (element, valid) in zip(rows, results):
+        expected = schema.from_flat(row)
+        assert element.value == expected.value
+        assert valid == expected.validate()
+    assert [valid for _, valid in results] == [True, False, True, True, True]
+    assert results[3][0].value == {"i": 3, "l": ["e", "d"]}
+
+
+def test_from_flat_many_is_lazy():
+    consumed = []
+
+    def rows():
+        for i in range(5):
+            consumed.append(i)
+            yield [("i", str(i))]
+
+    results = Integer.named("i").from_flat_many(rows(), chunk_size=2)
+    element, valid = next(results)
+    assert element.value == 0
+    assert consumed == [0, 1]
+    assert [el.value for el, _ in results] == [1, 2, 3, 4]
+
+
+def test_from_flat_many_options():
+    seen = []
+
+    def validator(element, state):
+        seen.append(state)
+        return True
+
+    schema = String.named("s").using(validators=[validator])
+    results = list(schema.from_flat_many([[("s", "a")]], validate=False))
+    assert results[0][1] is Unevaluated
+    assert not seen
+
+    results = list(schema.from_flat_many([[("s", "a")]], state="st"))
+    assert results[0][1] is True
+    assert seen == ["st"]
+
+    results = list(schema.from_flat_many([[("s.t", "a")]], sep=".", name="s.t"))
+    assert results[0][0].value == "a"
+
+
+def test_budget():
+    schema = Dict.named("d").of(String.named("a"), List.named("l").of(String))
+    pairs = [("d_a", "xy"), ("d_l_0", "z"), ("d_l_1", "w")]
+
+    for budget in (
+        FlatBudget(pairs=3, key_length=5, depth=3, value_size=4),
+        FlatBudget(),
+    ):
+        limited = schema.using(set_flat_budget=budget)
+        for source in (
+            pairs,
+            dict(pairs),
+            iter(pairs),
+            FlatTrie.from_pairs(pairs, "_"),
+        ):
+            assert limited.from_flat(source).value == {"a": "xy", "l": ["z", "w"]}
+
+    for budget in (
+        FlatBudget(pairs=2),
+        FlatBudget(key_length=4),
+        FlatBudget(depth=2),
+        FlatBudget(value_size=3),
+    ):
+        limited = schema.using(set_flat_budget=budget)
+        for source in (
+            pairs,
+            dict(pairs),
+            iter(pairs),
+            FlatTrie.from_pairs(pairs, "_"),
+        ):
+            with pytest.raises(InputLimitError):
+                limited.from_flat(source)
+
+    el = schema(set_flat_budget=FlatBudget(pairs=1))
+    with pytest.raises(InputLimitError):
+        el.set_flat(pairs)
+    assert schema.from_flat(pairs).value == {"a": "xy", "l": ["z", "w"]}
+
+
+def test_budget_rejects_before_loading():
+    consumed = []
+
+    def pairs():
+        for i in range(1000):
+            consumed.append(i)
+            yield "l_%d" % i, "x"
+
+    schema = List.named("l").of(String).using(set_flat_budget=FlatBudget(pairs=10))
+    with pytest.raises(InputLimitError):
+        schema.from_flat(pairs())
+    assert len(consumed) == 11
+
+    class Exploding(list):
+        def __iter__(self):
+            raise AssertionError("pairs should not be iterated")
+
+    with pytest.raises(InputLimitError):
+        schema.from_flat(Exploding([("l_0", "x")] * 11))
+
+
+def test_budget_iterators_checked_as_consumed():
+    pairs = [("d_a", "x"), ("d_b", "y"), ("d_c", "z")]
+    schema = Dict.named("d").of(String.named("a"), String.named("b"), String.named("c"))
+    limited = schema.using(set_flat_budget=FlatBudget(pairs=2))
+
+    # built-in containers gather an iterator before loading any of it
+    el = limited({"a": "1", "b": "2", "c": "3"})
+    with pytest.raises(InputLimitError):
+        el.set_flat(iter(pairs))
+    assert el.value == {"a": "1", "b": "2", "c": "3"}
+
+    loaded = []
+
+    class Streaming(String):
+        def _set_flat_iterable(self, pairs, sep):
+            for key, value in pairs:
+                loaded.append(key)
+
+    el = Streaming.named("s").using(set_flat_budget=FlatBudget(pairs=2))()
+    with pytest.raises(InputLimitError):
+        el.set_flat(iter(pairs))
+    assert loaded == ["d_a", "d_b"]
+    del loaded[:]
+    with pytest.raises(InputLimitError):
+        el.set_flat(pairs)
+    assert loaded == []
@@ -460,6 +460,32 @@ def test_sort():
     assert el.flatten() == [("l_0_i", "2"), ("l_1_i", "1")]
 
 
+def test_lazy_renumbering():
+    schema = List.named("l").of(Integer.named("i"))
+    el = schema(list(range(6)))
+    members = list(el)
+
+    del el[3]
+    el.insert(4, 9)
+    removed = el.pop(-1)
+    assert el._renumber_from == 3
+    # slots ahead of the first change are not renamed
+    assert members[1].parent.name == "1"
+    assert el._renumber_from == 3
+
+    assert removed.name == "5" and removed.value == 5
+    assert el.value == [0, 1, 2, 4, 9]
+    assert [m.fq_name() for m in el] == ["/0", "/1", "/2", "/3", "/4"]
+    assert members[4].flattened_name() == "l_3_i"
+    assert el.find_one("3") is members[4]
+    assert el._renumber_from is None
+
+    # removal from the tail moves nothing
+    el.pop()
+    del el[-1]
+    assert el._renumber_from is None
+
+
 def test_slots():
     schema = List.named("l").of(Integer.named("i"))
     el = schema([1, 2])
@@ -0,0 +1,90 @@
+import threading
+
+import pytest
+
+from flatland import Dict, Integer, String
+from flatland.schema.pool import ElementPool
+
+Point = Dict.named("point").of(Integer.named("x"), Integer.named("y"))
+
+
+def test_pool_reuses_reset_trees():
+    pool = ElementPool()
+    el = pool.acquire(Point)
+    el.set({"x": 1, "y": 2})
+    pool.release(el)
+
+    again = pool.acquire(Point)
+    assert again is el
+    assert again.value == {"x": None, "y": None}
+    assert pool.acquire(Point) is not el
+
+
+def test_pool_resets_properties():
+    pool = ElementPool()
+    schema = Point.with_properties(shared=True)
+    el = pool.acquire(schema)
+    el.properties["request"] = 1
+    el["x"].properties["request"] = 2
+    pool.release(el)
+
+    again = pool.acquire(schema)
+    assert again is el
+    assert dict(again.properties) == {"shared": True}
+    assert "request" not in again["x"].properties
+
+
+def test_pool_keyed_by_schema():
+    pool = ElementPool()
+    other = Dict.named("other").of(String.named("s"))
+    pool.release(Point())
+    assert isinstance(pool.acquire(other), other)
+
+
+def test_pool_size():
+    pool = ElementPool(size=1)
+    first, second = Point(), Point()
+    pool.release(first)
+    pool.release(second)
+    assert pool.acquire(Point) is first
+    assert pool.acquire(Point) is not second
+
+    pool.release(first)
+    pool.clear()
+    assert pool.acquire(Point) is not first
+
+
+def test_pool_rejects_children():
+    pool = ElementPool()
+    with pytest.raises(ValueError):
+        pool.release(Point()["x"])
+
+
+def test_pool_context():
+    pool = ElementPool()
+    with pool.element(Point) as el:
+        el.set_flat([("point_x", "3")])
+        assert el["x"].value == 3
+    with pool.element(Point) as again:
+        assert again is el
+        assert again["x"].value is None
+
+
+def test_pool_threads():
+    pool = ElementPool(size=4)
+    seen = []
+
+    def work():
+        for i in range(200):
+            with pool.element(Point) as el:
+                assert el["x"].value is None
+                el.set({"x": i, "y": i})
+                seen.append(id(el))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(seen) == 800
+    assert len(set(seen)) <= 8
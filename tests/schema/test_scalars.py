@@ -1,11 +1,13 @@
 import datetime
 import decimal
+import io
 
 from flatland import (
     Boolean,
     Date,
     DateTime,
     Decimal,
+    File,
     Float,
     Integer,
     Long,
@@ -311,3 +313,26 @@ def test_datetime():
         (None, None, "", {}, True),
     ):
         validate_element_set(DateTime, *spec)
+
+
+def test_file():
+    upload = io.BytesIO(b"data")
+    upload.filename = "a.txt"
+
+    el = File(upload)
+    assert el.value is upload
+    assert el.u == "a.txt"
+
+    el = File(io.BytesIO(b"data"))
+    assert el.value is not None
+    assert el.u == ""
+
+    for empty in (None, ""):
+        el = File(empty)
+        assert el.value is None
+        assert el.u == ""
+
+    el = File()
+    assert not el.set("a.txt")
+    assert el.value is None
+    assert el.u == "a.txt"
@@ -0,0 +1,139 @@
+from array import array
+
+import pytest
+
+from flatland import Dict, Float, Integer, List, String
+from flatland.columnar import validate_columns
+from flatland.validation import (
+    Converted,
+    LengthBetween,
+    Present,
+    Validator,
+    ValueBetween,
+    ValueIn,
+    ValuesEqual,
+)
+
+Record = Dict.named("record").of(
+    String.named("name").using(validators=[Present(), LengthBetween(2, 10)]),
+    Integer.named("age").using(validators=[Converted(), ValueBetween(0, 150)]),
+    String.named("country").using(optional=True, validators=[ValueIn(["de", "nz"])]),
+)
+
+
+def assert_as_elements(schema, columns, result):
+    names = list(columns)
+    for row, valid in enumerate(result.valid):
+        element = schema({name: columns[name][row] for name in names})
+        assert element.validate() == valid
+        expected = [
+            (e.name, e.errors)
+            for e in [element, *element.all_children]
+            if e.errors or not e.valid
+        ]
+        got = [(e.name, e.errors) for e in result.errors if e.row == row]
+        assert got == expected
+
+
+def test_validate_columns():
+    columns = {
+        "name": ["Ada", "", "B", "Grace"],
+        "age": ["36", "x", "200", 85],
+        "country": ["nz", "", "xx", None],
+    }
+    result = validate_columns(Record, columns)
+    assert result.valid == [True, False, False, True]
+    assert [(e.row, e.name) for e in result.errors] == [
+        (1, "name"),
+        (1, "age"),
+        (2, "name"),
+        (2, "age"),
+        (2, "country"),
+    ]
+    assert result.errors[0].errors == ["name may not be blank."]
+    assert result.values["age"] == [36, None, 200, 85]
+    assert_as_elements(Record, columns, result)
+
+
+def test_arrays_and_missing_columns():
+    columns = {"name": ["Ada", "Bob"], "age": array("i", [36, -1])}
+    result = validate_columns(Record, columns)
+    assert result.valid == [True, False]
+    assert result.errors[0].errors == ["age must be in the range 0 to 150."]
+    assert result.values["country"] == [None, None]
+
+
+def test_validated_by_row():
+    class Even(Validator):
+        odd = "%(label)s is odd."
+
+        def validate(self, element, state):
+            if element.value % 2:
+                return self.note_error(element, state, "odd")
+            return True
+
+    Cells = Dict.of(
+        Integer.named("a").using(validators=[Converted(), Even()]),
+        Integer.named("b").using(validators=[Converted()]),
+    )
+    columns = {"a": ["2", "3", "x"], "b": ["1", "y", "2"]}
+    result = validate_columns(Cells, columns)
+    assert result.valid == [True, False, False]
+    assert_as_elements(Cells, columns, result)
+
+    Rows = Cells.using(validators=[ValuesEqual("a", "b")])
+    columns = {"a": ["2", "4", "3"], "b": ["2", "5", "3"]}
+    result = validate_columns(Rows, columns)
+    assert result.valid == [True, False, False]
+    assert_as_elements(Rows, columns, result)
+
+
+def test_instance_validate_by_row():
+    def validate(element, state):
+        return element.value != 4 or between.note_error(
+            element, state, "failure_inclusive"
+        )
+
+    between = ValueBetween(0, 150)
+    between.validate = validate
+    Cells = Dict.of(Integer.named("a").using(validators=[Converted(), between]))
+    columns = {"a": ["2", "4", "200"]}
+    result = validate_columns(Cells, columns)
+    assert result.valid == [True, False, True]
+    assert_as_elements(Cells, columns, result)
+
+
+def test_messages_translated_with_state():
+    german = {"%(label)s is not correct.": "%(label)s ist nicht korrekt."}
+    state = {"ugettext": lambda text: german.get(text, text)}
+    result = validate_columns(Record, {"name": ["Ada"], "age": ["x"]}, state)
+    assert result.errors[0].errors == ["age ist nicht korrekt."]
+
+
+def test_rejected_schemas():
+    with pytest.raises(TypeError):
+        validate_columns(Integer, {})
+    with pytest.raises(TypeError):
+        validate_columns(Dict.of(List.named("l").of(Integer)), {})
+    with pytest.raises(ValueError):
+        validate_columns(Record, {"name": ["a", "b"], "age": ["1"]})
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip("numpy")
+    Numbers = Dict.of(
+        Integer.named("i").using(validators=[Converted(), ValueBetween(0, 9)]),
+        Float.named("f").using(validators=[ValueIn([0.5, 2.0])]),
+    )
+    columns = {
+        "i": numpy.array([1, 10, 5, -1]),
+        "f": numpy.array([0.5, 2, 3, 0.5]),
+    }
+    result = validate_columns(Numbers, columns)
+    assert isinstance(result.valid, numpy.ndarray)
+    assert result.valid.tolist() == [True, False, False, False]
+    assert result.values["i"] is columns["i"]
+    assert [(e.row, e.name) for e in result.errors] == [(1, "i"), (2, "f"), (3, "i")]
+    assert result.errors[0].errors == ["i must be in the range 0 to 9."]
+    columns = {name: column.tolist() for name, column in columns.items()}
+    assert_as_elements(Numbers, columns, result)
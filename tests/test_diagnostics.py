@@ -0,0 +1,65 @@
+from flatland import CompactList, Dict, Integer, List, String
+from flatland.diagnostics import measure
+
+Form = Dict.named("form").of(
+    String.named("name"),
+    List.named("tags").of(String.named("tag")),
+)
+
+
+def test_measure_class():
+    footprint = measure(Form)
+    assert footprint.elements == 3
+    assert footprint.counts == {"Dict": 1, "String": 1, "List": 1}
+    assert footprint.traced > 0
+    assert footprint.total == sum(footprint.sizes.values()) + footprint.values
+
+
+def test_measure_element():
+    element = Form.from_flat([("form_tags_0_tag", "a"), ("form_tags_1_tag", "b")])
+    footprint = measure(element)
+    assert footprint.traced is None
+    assert footprint.counts["ListSlot"] == 2
+    assert footprint.counts["String"] == 3
+    assert footprint.elements == 7
+    assert footprint.values > 0
+
+    before = footprint.messages
+    element["name"].add_error("required")
+    element["tags"][0].add_warning("short")
+    assert measure(element).messages > before
+
+    element.properties["hint"] = "x" * 100
+    assert measure(element).properties > 100
+
+
+def test_measure_shared():
+    element = Form.from_flat([("form_name", "a" * 100)])
+    element["tags"].append("a" * 100)
+    # the same string is counted once
+    single = measure(element).values
+    element["tags"].append(element["name"].value)
+    assert measure(element).values - single < 100
+
+
+def test_measure_report():
+    footprint = measure(Form)
+    report = footprint.report()
+    assert report.splitlines()[0].split() == ["element", "type", "count", "bytes"]
+    assert "traced" in report
+    assert repr(footprint) == "<Footprint 3 elements, %d bytes>" % footprint.total
+
+
+def test_measure_compact_list():
+    element = CompactList.of(Integer).from_flat([(str(i), str(i)) for i in range(100)])
+    footprint = measure(element)
+    assert footprint.counts["CompactList"] == 1
+    # only the shared flyweight member and its slot, never one per member
+    assert footprint.elements <= 3
+    assert not element._elements
+    assert (
+        footprint.total
+        < measure(
+            List.of(Integer).from_flat([(str(i), str(i)) for i in range(100)])
+        ).total
+    )
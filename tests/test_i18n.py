@@ -1,7 +1,13 @@
+from operator import attrgetter
+
 from flatland import (
     Dict,
+    Integer,
+    List,
+    SparseDict,
     String,
 )
+from flatland.schema.util import find_i18n_function, i18n_resolution_cache
 from flatland.validation import (
     Converted,
     NoLongerThan,
@@ -142,3 +148,74 @@ def test_tuple_plural():
     data = schema(dict(name="xxx"))
     data.validate(catalog)
     assert data["name"].errors == ["plural NAME 2"]
+
+
+def test_gettext_lookup_cached_while_validating():
+    catalog = GetTextish()
+    lookups = []
+
+    class Translated(Dict):
+        @property
+        def ugettext(self):
+            lookups.append(self.name)
+            return catalog.ugettext
+
+    schema = Translated.named("form").of(
+        List.named("ages").of(Integer.named("age").using(validators=[Converted()]))
+    )
+    data = schema({"ages": ["x"] * 20})
+    assert not data.validate()
+    assert [e.errors for e in data["ages"]] == [["reg AGE"]] * 20
+    # looked up on the root once for the whole tree
+    assert lookups == ["form"]
+
+    # and again for each message expanded outside of validation
+    Converted().note_error(data["ages"][0], None, "incorrect")
+    Converted().note_error(data["ages"][1], None, "incorrect")
+    assert lookups == ["form"] * 3
+
+
+def test_gettext_lookup_cache_reparenting():
+    finder = attrgetter("ugettext")
+    items_schema = List.named("l").of(String)
+    first = SparseDict.using(ugettext="first").of(items_schema)
+    second = SparseDict.using(ugettext="second").of(items_schema)
+    tree, other = first({"l": ["a"]}), second()
+    items = tree["l"]
+    element = items[0]
+
+    with i18n_resolution_cache():
+        assert find_i18n_function(element, finder) == "first"
+        assert find_i18n_function(items[0], finder) == "first"
+        # the list moves to the other tree
+        other["l"] = items
+        assert find_i18n_function(element, finder) == "second"
+        tree["l"] = items
+        assert find_i18n_function(element, finder) == "first"
+        # an element detached from its list
+        detached = items.pop()
+        assert detached is element.parent
+        assert find_i18n_function(element, finder) is None
+        # or reparented directly
+        element.parent = other
+        assert find_i18n_function(element, finder) == "second"
+
+
+def test_gettext_lookup_cache_resolves_once():
+    calls = []
+
+    def finder(element):
+        calls.append(element)
+        return element.ugettext
+
+    schema = Dict.using(ugettext="top").of(
+        List.named("l").of(String), String.named("s")
+    )
+    tree = schema({"l": ["a", "b"], "s": "c"})
+    items = tree["l"]
+
+    with i18n_resolution_cache():
+        for element in [items[0], items[1], tree["s"], items[0]]:
+            assert find_i18n_function(element, finder) == "top"
+    # each element searched once, ancestors shared
+    assert len(calls) == len(set(map(id, calls))) == 7
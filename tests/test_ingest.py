@@ -0,0 +1,283 @@
+import asyncio
+import io
+
+import pytest
+
+from flatland import Dict, File, Integer, List, String
+from flatland.exc import InputLimitError
+from flatland.ingest import (
+    MultipartParser,
+    UploadedFile,
+    UrlencodedParser,
+    aread_multipart,
+    aread_urlencoded,
+    iter_multipart,
+    iter_urlencoded,
+    multipart_boundary,
+)
+from flatland.schema.flat import FlatTrie
+
+
+def test_parser_decodes():
+    parser = UrlencodedParser()
+    pairs = parser.feed(b"a=1&b=x+y&c=%C3%A9&d&e=&&f%5F1=%26")
+    pairs.extend(parser.close())
+    assert pairs == [
+        ("a", "1"),
+        ("b", "x y"),
+        ("c", "\xe9"),
+        ("d", ""),
+        ("e", ""),
+        ("f_1", "&"),
+    ]
+
+
+def test_parser_split_chunks():
+    body = b"alpha=one&beta=two+three&gamma=%E2%82%AC"
+    for size in range(1, len(body) + 1):
+        parser, pairs = UrlencodedParser(), []
+        for start in range(0, len(body), size):
+            pairs.extend(parser.feed(body[start : start + size]))
+        pairs.extend(parser.close())
+        assert pairs == [("alpha", "one"), ("beta", "two three"), ("gamma", "€")]
+
+
+def test_parser_charset():
+    parser = UrlencodedParser(charset="latin-1")
+    assert parser.feed(b"a=%E9&") == [("a", "\xe9")]
+
+    parser = UrlencodedParser()
+    assert parser.feed(b"a=%E9&") == [("a", "�")]
+
+    parser = UrlencodedParser(errors="strict")
+    with pytest.raises(UnicodeDecodeError):
+        parser.feed(b"a=%E9&")
+
+
+def test_parser_max_field_size():
+    parser = UrlencodedParser(max_field_size=8)
+    assert parser.feed(b"a=1234&b=12") == [("a", "1234")]
+    with pytest.raises(InputLimitError):
+        parser.feed(b"3456789")
+
+    parser = UrlencodedParser(max_field_size=8)
+    with pytest.raises(InputLimitError):
+        parser.feed(b"a=12345678&b=1")
+
+    parser = UrlencodedParser(max_field_size=8)
+    parser.feed(b"a=123456")
+    assert parser.close() == [("a", "123456")]
+
+
+def test_parser_max_size():
+    parser = UrlencodedParser(max_size=10)
+    parser.feed(b"a=1&b=2&")
+    with pytest.raises(InputLimitError):
+        parser.feed(b"c=3")
+    assert issubclass(InputLimitError, ValueError)
+
+
+def test_iter_urlencoded_sources():
+    expected = [("a", "1"), ("b", "2")]
+    assert list(iter_urlencoded(b"a=1&b=2")) == expected
+    assert list(iter_urlencoded([b"a=", b"1&b", b"=2"])) == expected
+    assert list(iter_urlencoded(io.BytesIO(b"a=1&b=2"), chunk_size=1)) == expected
+
+
+def test_iter_urlencoded_content_length():
+    body = io.BytesIO(b"a=1&b=2&garbage")
+    assert list(iter_urlencoded(body, chunk_size=3, content_length=7)) == [
+        ("a", "1"),
+        ("b", "2"),
+    ]
+    assert body.read() == b"&garbage"
+
+
+def test_iter_urlencoded_is_lazy():
+    reads = []
+
+    class Body:
+        def __init__(self, chunks):
+            self.chunks = list(chunks)
+
+        def read(self, size):
+            reads.append(size)
+            return self.chunks.pop(0) if self.chunks else b""
+
+    pairs = iter_urlencoded(Body([b"a=1&", b"b=2&", b"c=3"]))
+    assert next(pairs) == ("a", "1")
+    assert len(reads) == 1
+    assert list(pairs) == [("b", "2"), ("c", "3")]
+
+
+def test_set_flat_from_stream():
+    schema = Dict.named("f").of(
+        String.named("title"), List.named("n").of(Integer.named("i"))
+    )
+    body = io.BytesIO(b"f_title=Hello+world&f_n_0_i=1&f_n_1_i=2&other=x")
+    el = schema.from_flat(iter_urlencoded(body, chunk_size=4))
+    assert el.value == {"title": "Hello world", "n": [1, 2]}
+
+
+def test_set_flat_consumes_iterator_once():
+    consumed = []
+
+    def pairs():
+        for pair in [("d_x", "1"), ("d_y", "2")]:
+            consumed.append(pair)
+            yield pair
+
+    schema = Dict.named("d").of(String.named("x"), String.named("y"))
+    el = schema.from_flat(pairs())
+    assert el.value == {"x": "1", "y": "2"}
+    assert len(consumed) == 2
+
+
+def test_aread_urlencoded():
+    async def body():
+        for chunk in (b"d_x=1&d", b"_y=2+3&", b"d_x=9"):
+            yield chunk
+
+    trie = asyncio.run(aread_urlencoded(body(), max_field_size=16))
+    assert isinstance(trie, FlatTrie)
+
+    schema = Dict.named("d").of(String.named("x"), String.named("y"))
+    el = schema.from_flat(trie)
+    assert el.value == {"x": "1", "y": "2 3"}
+
+
+MULTIPART = (
+    b"preamble\r\n"
+    b"--XyZ\r\n"
+    b'Content-Disposition: form-data; name="d_x"\r\n'
+    b"\r\n"
+    b"1\r\n"
+    b"--XyZ\r\n"
+    b'Content-Disposition: form-data; name="d_name"\r\n'
+    b"Content-Type: text/plain; charset=latin-1\r\n"
+    b"\r\n"
+    b"\xe9t\xe9\r\n"
+    b"--XyZ\r\n"
+    b'Content-Disposition: form-data; name="d_doc"; filename="a.txt"\r\n'
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"line one\r\n--Xy is not a delimiter\r\n-\r\n"
+    b"--XyZ\r\n"
+    b'Content-Disposition: form-data; name="d_blank"; filename=""\r\n'
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n"
+    b"\r\n"
+    b"--XyZ--\r\n"
+    b"epilogue"
+)
+FILE_CONTENT = b"line one\r\n--Xy is not a delimiter\r\n-"
+
+
+def _parse_multipart(body, size, **options):
+    parser, pairs = MultipartParser("XyZ", **options), []
+    for start in range(0, len(body), size):
+        pairs.extend(parser.feed(body[start : start + size]))
+    pairs.extend(parser.close())
+    return pairs
+
+
+def test_multipart_parser():
+    for size in (1, 2, 3, 7, 64, len(MULTIPART)):
+        pairs = _parse_multipart(MULTIPART, size)
+        assert [key for key, _ in pairs] == ["d_x", "d_name", "d_doc", "d_blank"]
+        assert pairs[0][1] == "1"
+        assert pairs[1][1] == "\xe9t\xe9"
+        assert pairs[3][1] == ""
+
+        upload = pairs[2][1]
+        assert isinstance(upload, UploadedFile)
+        assert upload.filename == "a.txt"
+        assert upload.content_type == "text/plain"
+        assert upload.size == len(FILE_CONTENT)
+        assert upload.read() == FILE_CONTENT
+        upload.close()
+
+
+def test_multipart_spooling():
+    pairs = _parse_multipart(MULTIPART, 64, spool_size=4)
+    upload = pairs[2][1]
+    assert upload.file._rolled
+    assert upload.read() == FILE_CONTENT
+
+    pairs = _parse_multipart(MULTIPART, 64)
+    assert not pairs[2][1].file._rolled
+
+
+def test_multipart_malformed():
+    parser = MultipartParser("XyZ")
+    parser.feed(MULTIPART[:60])
+    with pytest.raises(ValueError):
+        parser.close()
+
+    with pytest.raises(ValueError):
+        MultipartParser("")
+
+
+def test_multipart_limits():
+    with pytest.raises(InputLimitError):
+        _parse_multipart(MULTIPART, 16, max_size=len(MULTIPART) - 1)
+    with pytest.raises(InputLimitError):
+        _parse_multipart(MULTIPART, 16, max_parts=3)
+    with pytest.raises(InputLimitError):
+        _parse_multipart(MULTIPART, 16, max_part_size=len(FILE_CONTENT) - 1)
+    with pytest.raises(InputLimitError):
+        _parse_multipart(MULTIPART, 16, max_header_size=40)
+
+    # field limits do not apply to files
+    pairs = _parse_multipart(MULTIPART, 16, max_field_size=3)
+    assert pairs[2][1].size == len(FILE_CONTENT)
+    with pytest.raises(InputLimitError):
+        _parse_multipart(MULTIPART, 16, max_field_size=2)
+
+    assert _parse_multipart(MULTIPART, 16, max_size=len(MULTIPART), max_parts=4)
+
+
+def test_multipart_boundary():
+    assert multipart_boundary("multipart/form-data; boundary=XyZ") == "XyZ"
+    assert multipart_boundary('multipart/form-data; boundary="a b"') == "a b"
+    with pytest.raises(ValueError):
+        multipart_boundary("multipart/form-data")
+    with pytest.raises(ValueError):
+        multipart_boundary("application/x-www-form-urlencoded")
+
+
+def test_set_flat_from_multipart():
+    schema = Dict.named("d").of(
+        Integer.named("x"),
+        String.named("name"),
+        File.named("doc"),
+        File.named("blank"),
+    )
+    pairs = iter_multipart(
+        io.BytesIO(MULTIPART),
+        "multipart/form-data; boundary=XyZ",
+        chunk_size=5,
+    )
+    el = schema.from_flat(pairs)
+    assert el["x"].value == 1
+    assert el["name"].value == "\xe9t\xe9"
+    assert el["doc"].u == "a.txt"
+    assert el["doc"].value.read() == FILE_CONTENT
+    assert el["blank"].value is None
+
+
+def test_aread_multipart():
+    async def body():
+        for start in range(0, len(MULTIPART), 10):
+            yield MULTIPART[start : start + 10]
+
+    trie = asyncio.run(
+        aread_multipart(body(), "multipart/form-data; boundary=XyZ", max_parts=4)
+    )
+    assert isinstance(trie, FlatTrie)
+
+    schema = Dict.named("d").of(String.named("x"), File.named("doc"))
+    el = schema.from_flat(trie)
+    assert el["x"].value == "1"
+    with el["doc"].value as upload:
+        assert upload.read() == FILE_CONTENT
@@ -174,3 +174,41 @@ def test_symbol_pickle():
             rt = pickle.loads(serial)
             assert rt is sym1
             assert rt is sym2
+
+
+def test_class_interner(interner):
+    from flatland import Dict, Integer, String
+
+    def validator(element, state):
+        return True
+
+    assert String.using(optional=True) is String.using(optional=True)
+    assert String.named("a") is String.named("a")
+    assert String.named("a") is not String.named("b")
+    assert String.named("a") is not Integer.named("a")
+    assert String.using(default=1) is not String.using(default=True)
+    assert String.using(validators=[validator]) is String.using(validators=[validator])
+    assert Dict.of(String.named("a")) is Dict.of(String.named("a"))
+    assert String.named("a").__module__ == __name__
+    assert interner.hits and interner.misses
+
+    unhashable = String.using(default={"a": 1})
+    assert unhashable is not String.using(default={"a": 1})
+    assert len(interner) == interner.misses
+
+    interner.clear()
+    assert len(interner) == 0
+
+
+def test_class_interner_weak(interner):
+    import gc
+
+    from flatland import String
+
+    kept = String.named("kept")
+    for name in "abcd":
+        String.named(name)
+    gc.collect()
+    assert len(interner) == 3
+    assert String.named("kept") is kept
+    assert String.named("d") is String.named("d")
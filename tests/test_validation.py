@@ -5,6 +5,7 @@ from flatland import (
 )
 from flatland.validation import (
     Converted,
+    DeferredMessage,
     Present,
     Validator,
 )
@@ -94,3 +95,64 @@ def test_nested_validation():
 
     form["d2"]["x2"].set(2)
     assert form.validate()
+
+
+def test_deferred_messages():
+    calls = []
+
+    class Counted(Age.ValidAge):
+        defer_messages = True
+
+        def expand_message(self, element, state, message, **info):
+            calls.append(message)
+            return Validator.expand_message(self, element, state, message, **info)
+
+    schema = Integer.named("age").using(validators=[Counted(minage=30)])
+    el = schema(10)
+    assert not el.validate()
+    # noting the same message again is recognized without expanding it
+    assert not el.validate()
+    (held,) = el._deferred_messages["errors"][1]
+    assert isinstance(held, DeferredMessage)
+    assert calls == []
+
+    # expanded to strings once read
+    assert el.errors == ["age must be at least 30."]
+    assert type(el.errors[0]) is str
+    assert ", ".join(el.errors) == "age must be at least 30."
+    assert len(calls) == 1
+    assert "_deferred_messages" not in el.__dict__
+
+    # a string already present is not added again
+    el = schema(10)
+    el.add_error("age must be at least 30.")
+    assert not el.validate()
+    assert el.errors == ["age must be at least 30."]
+    assert type(el.errors[0]) is str
+
+    # nor is one noted again after reading
+    assert not el.validate()
+    assert el.errors == ["age must be at least 30."]
+
+    # messages added meanwhile keep their order
+    el = schema(10)
+    messages = el.errors
+    assert not el.validate()
+    el.add_error("later")
+    messages.append("appended")
+    assert el.errors == ["age must be at least 30.", "later", "appended"]
+    assert el.errors is messages
+
+    el = schema(30)
+    assert not el.validate()
+    assert el.warnings == ["age is at the minimum age."]
+
+
+def test_deferred_messages_state():
+    translations = {"%(label)s must be at least %(minage)s.": "%(label)s < %(minage)s"}
+    schema = Integer.named("age").using(
+        validators=[Age.ValidAge(minage=30, defer_messages=True)]
+    )
+    el = schema(10)
+    assert not el.validate({"ugettext": lambda m: translations.get(m, m)})
+    assert el.errors == ["age < 30"]
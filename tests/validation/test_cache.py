@@ -0,0 +1,138 @@
+from flatland import Dict, Integer, String
+from flatland.validation import IsEmail, ValidatorCache, Validator, ValueIn
+
+
+class Counted(Validator):
+    pure = True
+
+    fail = "%(label)s is %(value)s."
+
+    def __init__(self, **kw):
+        Validator.__init__(self, **kw)
+        self.calls = 0
+
+    def validate(self, element, state):
+        self.calls += 1
+        if element.value == "bad":
+            return self.note_error(element, state, "fail")
+        if element.value == "meh":
+            self.note_warning(element, state, "fail")
+        return True
+
+
+def test_hits_and_misses():
+    cache = ValidatorCache()
+    validator = Counted(cache=cache)
+    for value in ["ok", "bad", "ok", "bad", "meh", "meh"]:
+        validator(String(value), None)
+    assert validator.calls == 3
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert len(cache) == 3
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_replayed_messages():
+    cache = ValidatorCache()
+    validator = Counted(cache=cache)
+
+    first = String("bad", name="first")
+    assert not validator(first, None)
+    second = String("bad", name="second")
+    assert not validator(second, None)
+    assert validator.calls == 1
+    assert first.errors == ["first is bad."]
+    assert second.errors == ["second is bad."]
+
+    third = String("meh", name="third")
+    assert validator(third, None)
+    assert validator(String("meh"), None)
+    assert third.warnings == ["third is meh."]
+    assert validator.calls == 2
+
+
+def test_replayed_translation():
+    cache = ValidatorCache()
+    Email = String.named("email").using(validators=[IsEmail(cache=cache)])
+    assert not Email("oops").validate()
+    german = {"%(label)s is not a valid email address.": "%(label)s ist ungültig."}
+    translated = Email("oops")
+    assert not translated.validate({"ugettext": lambda m: german.get(m, m)})
+    assert translated.errors == ["email ist ungültig."]
+    assert cache.hits == 1
+
+
+def test_lru_eviction():
+    cache = ValidatorCache(size=2)
+    validator = Counted(cache=cache)
+    for value in ["a", "b", "a", "c", "b", "a"]:
+        validator(String(value), None)
+    # b was least recently used when c arrived, and then a when b returned
+    assert validator.calls == 5
+    assert len(cache) == 2
+
+
+def test_keyed_by_validator_and_type():
+    cache = ValidatorCache()
+    yes = ValueIn([1], cache=cache)
+    no = ValueIn([2], cache=cache)
+    assert yes(Integer(1), None)
+    assert not no(Integer(1), None)
+    assert yes(String("1", name="s"), None) is not True
+    assert cache.misses == 3
+
+
+def test_impure_not_cached():
+    cache = ValidatorCache()
+    validator = Counted(cache=cache, pure=False)
+    validator(String("ok"), None)
+    validator(String("ok"), None)
+    assert validator.calls == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_uncacheable_results():
+    class Direct(Counted):
+        def validate(self, element, state):
+            self.calls += 1
+            element.add_error("direct")
+            return False
+
+    class Elsewhere(Counted):
+        def validate(self, element, state):
+            self.calls += 1
+            return self.note_error(element.parent, state, "fail")
+
+    cache = ValidatorCache()
+    direct = Direct(cache=cache)
+    elsewhere = Elsewhere(cache=cache)
+    schema = Dict.of(String.named("x"))
+    for _ in range(2):
+        assert not direct(String("v"), None)
+        assert not elsewhere(schema({"x": "v"})["x"], None)
+    assert direct.calls == elsewhere.calls == 2
+    assert len(cache) == 0
+
+
+def test_unhashable_values():
+    cache = ValidatorCache()
+    validator = Counted(cache=cache)
+    element = String()
+    element.value = ["un", "hashable"]
+    validator(element, None)
+    validator(element, None)
+    assert validator.calls == 2
+    assert cache.misses == 2
+
+
+def test_class_wide_cache():
+    cache = ValidatorCache()
+    IsEmail.cache = cache
+    try:
+        Email = String.using(validators=[IsEmail()])
+        assert Email("a@example.com").validate()
+        assert Email("a@example.com").validate()
+    finally:
+        del IsEmail.cache
+    assert cache.hits == 1
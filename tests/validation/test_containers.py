@@ -8,6 +8,7 @@ from flatland.validation import (
     HasAtLeast,
     HasAtMost,
     HasBetween,
+    HasNoDuplicates,
     NotDuplicated,
     SetWithAllFields,
     SetWithKnownFields,
@@ -99,6 +100,62 @@ def test_no_duplicates_list_dict():
     _test_no_duplicates(schema, {"x": 1, "y": 2}, {"x": 3, "y": 4})
 
 
+def test_has_no_duplicates_scalar():
+    hnd = HasNoDuplicates(failure="%(container_label)s %(position)s")
+    schema = List.named("test").of(String).using(validators=[hnd])
+    _test_no_duplicates(schema, "foo", "bar")
+
+
+def test_has_no_duplicates_dict():
+    hnd = HasNoDuplicates(failure="%(container_label)s %(position)s")
+    schema = List.named("test").of(Dict.of(Integer.named("x"), Integer.named("y")))
+    # Dict values are unhashable, and compared pairwise
+    _test_no_duplicates(
+        schema.using(validators=[hnd]), {"x": 1, "y": 2}, {"x": 3, "y": 4}
+    )
+
+    key = lambda element: (element["x"].value, element["y"].value)
+    hnd = HasNoDuplicates(key=key, failure="%(container_label)s %(position)s")
+    _test_no_duplicates(
+        schema.using(validators=[hnd]), {"x": 1, "y": 2}, {"x": 3, "y": 4}
+    )
+
+
+def test_has_no_duplicates_matches_not_duplicated():
+    values = ["a", "b", "", "a", None, "c", "", "b", "a"]
+    schema = List.named("test").of(String.named("item").using(optional=True))
+    member = schema.of(
+        String.named("item").using(optional=True, validators=[NotDuplicated()])
+    )
+    container = schema.using(validators=[HasNoDuplicates()])
+
+    expected, el = member(values), container(values)
+    assert expected.validate() == el.validate()
+    assert valid_of_children(el) == valid_of_children(expected)
+    assert [e.errors for e in el] == [e.errors for e in expected]
+    assert el[3].errors == ["item may not be repeated within test."]
+
+
+def test_has_no_duplicates_unconverted():
+    # members failing conversion differ in u, though both values are None
+    schema = List.named("test").of(Integer).using(validators=[HasNoDuplicates()])
+    el = schema(["x", "y", "1", "1"])
+    el.validate()
+    assert el[1].errors == []
+    assert el[3].errors
+
+
+def test_has_no_duplicates_incremental():
+    schema = List.named("test").of(String).using(validators=[HasNoDuplicates()])
+    el = schema(["a", "b", "a"])
+    assert not el.validate(incremental=True)
+    assert valid_of_children(el) == [True, True, False]
+
+    el[0].set("c")
+    assert el.validate(incremental=True)
+    assert valid_of_children(el) == [True, True, True]
+
+
 def validated_list(*validators):
     return List.named("outer").of(String.named("inner")).using(validators=validators)
 
@@ -0,0 +1,110 @@
+from flatland import Integer, String
+from flatland.schema.base import SkipAll
+from flatland.signals import validator_validated
+from flatland.validation import (
+    Converted,
+    LengthBetween,
+    Present,
+    Validator,
+    ValidatorCache,
+    ValueBetween,
+    ValueIn,
+)
+from flatland.validation.fusion import fuse
+
+
+class Counted(Validator):
+    def __init__(self, result=True, **kw):
+        Validator.__init__(self, **kw)
+        self.result = result
+        self.calls = 0
+
+    def validate(self, element, state):
+        self.calls += 1
+        return self.result
+
+
+def validated(schema, value):
+    element = schema(value)
+    return element.validate(), list(element.errors)
+
+
+def test_fused_chain():
+    chain = [Present(), Converted(), LengthBetween(2, 4), ValueIn(["ab", "abc"])]
+    Fused = String.named("code").using(validators=chain)
+    Plain = Fused.using(fuse_validators=False)
+    for value in [None, "", "a", "abcde", "abcd", "ab"]:
+        assert validated(Fused, value) == validated(Plain, value)
+    assert validated(Fused, "a") == (
+        False,
+        ["code must be between 2 and 4 characters long."],
+    )
+    assert fuse(chain) is not None
+
+
+def test_mixed_chain():
+    counted = Counted(SkipAll)
+    after = Counted()
+    Fused = Integer.named("n").using(
+        validators=[Converted(), counted, ValueBetween(1, 3), after]
+    )
+    assert validated(Fused, "x") == (False, ["n is not correct."])
+    assert counted.calls == 0
+    assert validated(Fused, "7") == (True, [])
+    assert (counted.calls, after.calls) == (1, 0)
+
+    counted.result = True
+    assert validated(Fused, "7") == (False, ["n must be in the range 1 to 3."])
+    assert validated(Fused, "2") == (True, [])
+    assert after.calls == 1
+
+
+def test_not_fused():
+    assert fuse([Counted()]) is None
+    assert fuse([ValueIn([1], cache=ValidatorCache())]) is None
+
+    class Subclass(Present):
+        pass
+
+    assert fuse([Subclass()]) is None
+
+
+def test_changes_seen():
+    between = ValueBetween(1, 3)
+    Fused = Integer.named("n").using(validators=[between])
+    assert validated(Fused, "5")[0] is False
+    between.maximum = 5
+    assert validated(Fused, "5")[0] is True
+    Fused.validators.append(ValueIn([1]))
+    assert validated(Fused, "5") == (False, ["5 is not a valid value for n."])
+
+
+def test_later_changes_unfused():
+    present, valid_in = Present(), ValueIn(["a"])
+    Fused = String.named("s").using(validators=[present, valid_in])
+    assert validated(Fused, "b")[0] is False
+
+    valid_in.cache = cache = ValidatorCache()
+    assert validated(Fused, "b")[0] is False
+    assert validated(Fused, "b") == (False, ["b is not a valid value for s."])
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    calls = []
+    present.validate = lambda element, state: calls.append(element.value) or SkipAll
+    assert validated(Fused, "") == (True, [])
+    assert calls == [""]
+
+
+def test_signals_unfused():
+    sent = []
+
+    def listener(sender, **kw):
+        sent.append(sender)
+
+    chain = [Present(), Converted()]
+    validator_validated.connect(listener)
+    try:
+        assert String.using(validators=chain)("x").validate()
+    finally:
+        validator_validated.disconnect(listener)
+    assert sent == chain
@@ -1,3 +1,5 @@
+import asyncio
+
 from flatland import String, signals
 from flatland.schema.base import NotEmpty
 from flatland.validation import (
@@ -47,3 +49,27 @@ def test_validator_validated():
     assert sentinel == [dict(sender=NotEmpty, element=el, state=None, result=True)]
 
     signals.validator_validated._clear_state()
+
+
+def test_validator_validated_async():
+    sentinel = []
+
+    def listener(sender, **kw):
+        sentinel.append((sender, kw["result"]))
+
+    signals.validator_validated.connect(listener)
+
+    async def taken(element, state):
+        return element.value != "admin"
+
+    schema = String.using(validators=[Present(), taken])
+    el = schema("admin")
+    assert not asyncio.run(el.avalidate())
+    assert sentinel == [(schema.validators[0], True), (taken, False)]
+
+    del sentinel[:]
+    el = String.using(optional=False)()
+    assert not asyncio.run(el.avalidate())
+    assert sentinel == [(NotEmpty, False)]
+
+    signals.validator_validated._clear_state()